@@ -0,0 +1,86 @@
+"""Latency benchmarks for the commands users run most often.
+
+Not collected by a plain ``pytest`` run (``testpaths`` only covers ``tests``);
+run them explicitly with pytest-benchmark installed::
+
+    pytest benches/ --benchmark-only --benchmark-warmup=off --benchmark-min-rounds=5
+
+Add ``--benchmark-group-by=func --benchmark-json=benchmark-results.json`` to
+keep a machine-readable record for comparing runs over time. CI runs the same
+benches with ``pytest benches/ --codspeed``, which counts instructions rather
+than wall time and so stays stable on noisy shared runners.
+"""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from dailybot_cli.main import cli
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+def test_version_speed(benchmark: Any, runner: CliRunner) -> None:
+    result = benchmark(runner.invoke, cli, ["--version"])
+    assert result.exit_code == 0
+
+
+def test_help_speed(benchmark: Any, runner: CliRunner) -> None:
+    result = benchmark(runner.invoke, cli, ["--help"])
+    assert result.exit_code == 0
+
+
+@patch("dailybot_cli.commands.status.get_token", return_value="tok")
+@patch("dailybot_cli.commands.status.DailyBotClient")
+def test_status_speed(
+    mock_client_cls: MagicMock,
+    _mock_get_token: MagicMock,
+    benchmark: Any,
+    runner: CliRunner,
+) -> None:
+    mock_client_cls.return_value.get_status.return_value = {"pending_checkins": []}
+    result = benchmark(runner.invoke, cli, ["status"])
+    assert result.exit_code == 0
+
+
+@pytest.mark.benchmark(group="cli-hot-paths")
+@patch("dailybot_cli.commands.update.get_token", return_value="tok")
+@patch("dailybot_cli.commands.update.DailyBotClient")
+def test_update_throughput(
+    mock_client_cls: MagicMock,
+    _mock_get_token: MagicMock,
+    benchmark: Any,
+    runner: CliRunner,
+) -> None:
+    mock_client_cls.return_value.submit_update.return_value = {"followups_count": 0}
+    result = benchmark.pedantic(
+        runner.invoke, args=(cli, ["update", "x"]), kwargs={"catch_exceptions": False},
+        rounds=50, iterations=10,
+    )
+    assert result.exit_code == 0
+
+
+@pytest.mark.benchmark(group="cli-hot-paths")
+@patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
+@patch("dailybot_cli.commands.agent.get_agent_auth", return_value="api_key")
+@patch("dailybot_cli.commands.agent.DailyBotClient")
+def test_agent_update_throughput(
+    mock_client_cls: MagicMock,
+    _mock_get_auth: MagicMock,
+    _mock_profile: MagicMock,
+    benchmark: Any,
+    runner: CliRunner,
+) -> None:
+    mock_client_cls.return_value.submit_agent_report.return_value = {"id": 1}
+    result = benchmark.pedantic(
+        runner.invoke, args=(cli, ["agent", "update", "x"]), kwargs={"catch_exceptions": False},
+        rounds=50, iterations=10,
+    )
+    assert result.exit_code == 0
@@ -1,15 +1,90 @@
 """HTTP client for Dailybot CLI API endpoints."""
 
-from typing import Any, Optional
-
-import httpx
-
-from dailybot_cli.config import get_api_key, get_api_url, get_token
+from __future__ import annotations
+
+import hashlib
+import socket
+import threading
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from dailybot_cli.config import (
+    get_api_key,
+    get_api_url,
+    get_token,
+    load_etag_cache,
+    save_etag_cache,
+)
+from dailybot_cli.json_compat import dumps, loads
+
+if TYPE_CHECKING:
+    import httpx
+
+
+# Endpoint paths, relative to the client's base_url.
+_PATH_REQUEST_CODE: str = "/v1/cli/auth/request-code/"
+_PATH_VERIFY_CODE: str = "/v1/cli/auth/verify-code/"
+_PATH_AUTH_STATUS: str = "/v1/cli/auth/status/"
+_PATH_LOGOUT: str = "/v1/cli/auth/logout/"
+_PATH_UPDATES: str = "/v1/cli/updates/"
+_PATH_STATUS: str = "/v1/cli/status/"
+_PATH_AGENT_REPORTS: str = "/v1/agent-reports/"
+_PATH_AGENT_HEALTH: str = "/v1/agent-health/"
+_PATH_AGENT_WEBHOOK: str = "/v1/agent-webhook/"
+_PATH_AGENT_EMAIL_SEND: str = "/v1/agent-email/send/"
+_PATH_AGENT_MESSAGES: str = "/v1/agent-messages/"
+_PATH_AGENT_MESSAGES_READ: str = "/v1/agent-messages/read/"
+_PATH_REGISTER_CHALLENGE: str = "/v1/agent/register/challenge/"
+_PATH_REGISTER: str = "/v1/agent/register/"
+
+# Idempotent GETs are retried on dropped or refused connections; writes never are.
+_GET_RETRIES: int = 2
+_GET_RETRY_BACKOFF: float = 0.1
+# Oldest conditional-GET entries are evicted past this, so the cache file stays small.
+_ETAG_CACHE_MAX_ENTRIES: int = 32
+# At most this many bulk report POSTs are in flight, matching the pool size.
+_BULK_CONCURRENCY: int = 10
+
+
+def _payload(**fields: Any) -> dict[str, Any]:
+    """Build a request body, dropping fields that were left as None."""
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def _agent_report_payload(
+    agent_name: str,
+    content: str,
+    structured: dict[str, Any] | None = None,
+    metadata: dict[str, Any] | None = None,
+    is_milestone: bool = False,
+    co_authors: list[str] | None = None,
+) -> dict[str, Any]:
+    """Build the body for POST /v1/agent-reports/."""
+    return _payload(
+        agent_name=agent_name,
+        content=content,
+        structured=structured,
+        metadata=metadata,
+        is_milestone=True if is_milestone else None,
+        co_authors=co_authors,
+    )
+
+
+def _resolve_quietly(host: str, port: int) -> None:
+    """Resolve *host* so the OS resolver cache is warm; ignore failures."""
+    try:
+        socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except OSError:
+        pass
 
 
 class APIError(Exception):
     """Raised when the API returns a non-success response."""
 
+    __slots__ = ("status_code", "detail")
+
     def __init__(self, status_code: int, detail: str) -> None:
         self.status_code: int = status_code
         self.detail: str = detail
@@ -19,69 +94,220 @@ class APIError(Exception):
 class DailyBotClient:
     """HTTP client for the Dailybot /v1/cli/* API endpoints."""
 
+    __slots__ = (
+        "api_url",
+        "token",
+        "api_key",
+        "timeout",
+        "_base_headers",
+        "_auth_headers",
+        "_agent_auth_headers",
+        "_agent_auth_mode",
+        "_etag_cache",
+        "_etag_lock",
+        "_client",
+    )
+
     def __init__(
         self,
-        api_url: Optional[str] = None,
-        token: Optional[str] = None,
-        api_key: Optional[str] = None,
+        api_url: str | None = None,
+        token: str | None = None,
+        api_key: str | None = None,
         timeout: float = 30.0,
+        warm: bool = False,
     ) -> None:
+        # httpx (and its h2/anyio stack) is imported on first client rather than
+        # at module load, so --help and argument errors skip that cost.
+        import httpx
+
         self.api_url: str = (api_url or get_api_url()).rstrip("/")
-        self.token: Optional[str] = token or get_token()
-        self.api_key: Optional[str] = api_key or get_api_key()
+        self.token: str | None = token or get_token()
+        self.api_key: str | None = api_key or get_api_key()
         self.timeout: float = timeout
-        self._agent_auth_mode: Optional[str] = None
-
-    def _headers(self, authenticated: bool = True) -> dict[str, str]:
-        """Build request headers."""
-        headers: dict[str, str] = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        if authenticated and self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
-
-    def _agent_headers(self) -> dict[str, str]:
-        """Build headers for agent authentication (API key preferred, then Bearer)."""
-        headers: dict[str, str] = {
+        # Auth headers never change for the lifetime of a client, so build
+        # them once instead of re-formatting "Bearer ..." on every request.
+        # Every call shares them, hence the read-only views.
+        self._base_headers: Mapping[str, str] = MappingProxyType({
             "Content-Type": "application/json",
             "Accept": "application/json",
-        }
+        })
+        self._auth_headers: Mapping[str, str] = (
+            MappingProxyType({**self._base_headers, "Authorization": f"Bearer {self.token}"})
+            if self.token
+            else self._base_headers
+        )
+        self._agent_auth_headers: Mapping[str, str]
+        self._agent_auth_mode: str | None
         if self.api_key:
-            headers["X-API-KEY"] = self.api_key
+            self._agent_auth_headers = MappingProxyType({**self._base_headers, "X-API-KEY": self.api_key})
             self._agent_auth_mode = "api_key"
         elif self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
+            self._agent_auth_headers = self._auth_headers
             self._agent_auth_mode = "bearer"
         else:
+            self._agent_auth_headers = self._base_headers
             self._agent_auth_mode = None
-        return headers
+        self._etag_cache: dict[str, Any] | None = None
+        # The interactive prefetch thread may share this client with the main one.
+        self._etag_lock: threading.Lock = threading.Lock()
+        # One pooled client per instance: keep-alive + HTTP/2 let consecutive
+        # calls (e.g. request_code -> verify_code) reuse the TCP/TLS session.
+        self._client: httpx.Client = httpx.Client(
+            base_url=self.api_url,
+            http2=True,
+            timeout=self.timeout,
+            headers=self._base_headers,
+            limits=httpx.Limits(
+                max_keepalive_connections=10,
+                max_connections=10,
+                keepalive_expiry=30.0,
+            ),
+        )
+        if warm:
+            self._prefetch_dns()
+
+    def _prefetch_dns(self) -> None:
+        """Start resolving the API host on a daemon thread.
+
+        Worth it only when the caller has idle time (e.g. waiting on a
+        prompt) before its first request.
+        """
+        url: httpx.URL = self._client.base_url
+        if not url.host:
+            return
+        port: int = url.port or (443 if url.scheme == "https" else 80)
+        threading.Thread(target=_resolve_quietly, args=(url.host, port), daemon=True).start()
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self._client.close()
+
+    def __enter__(self) -> DailyBotClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
-    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
-        """Parse API response and raise on errors."""
-        if response.status_code >= 400:
+    def _headers(self, authenticated: bool = True) -> Mapping[str, str]:
+        """Return the precomputed request headers."""
+        return self._auth_headers if authenticated else self._base_headers
+
+    def _agent_headers(self) -> Mapping[str, str]:
+        """Return headers for agent authentication (API key preferred, then Bearer)."""
+        return self._agent_auth_headers
+
+    def _handle_response(
+        self,
+        response: httpx.Response,
+        auth_mode: str | None = None,
+    ) -> dict[str, Any]:
+        """Parse API response and raise on errors.
+
+        *auth_mode* is the agent auth mode the request was sent with; a 401/403
+        under ``"bearer"`` is reported as an expired login session.
+        """
+        status_code: int = response.status_code
+        if status_code < 400:
+            if status_code == 204:
+                return {}
+            return loads(response.content)  # type: ignore[no-any-return]
+        try:
+            body: dict[str, Any] = loads(response.content)
+            # Only stringify the whole body when neither field is present.
+            detail: str = body.get("detail")  # type: ignore[assignment]
+            if detail is None:
+                detail = body.get("error")  # type: ignore[assignment]
+            if detail is None:
+                detail = str(body)
+        except Exception:
+            detail = response.text or f"HTTP {status_code}"
+        if status_code in (401, 403) and auth_mode == "bearer":
+            detail = "Session expired. Run 'dailybot login' to re-authenticate."
+        raise APIError(status_code=status_code, detail=detail)
+
+    def _get(
+        self,
+        path: str,
+        headers: Mapping[str, str] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """GET *path*, retrying transient connection failures with backoff."""
+        import httpx
+
+        attempt: int = 0
+        while True:
             try:
-                body: dict[str, Any] = response.json()
-                detail: str = body.get("detail", body.get("error", str(body)))
-            except Exception:
-                detail = response.text or f"HTTP {response.status_code}"
-            if response.status_code in (401, 403) and self._agent_auth_mode == "bearer":
-                detail = "Session expired. Run 'dailybot login' to re-authenticate."
-            raise APIError(status_code=response.status_code, detail=detail)
-        if response.status_code == 204:
-            return {}
-        return response.json()  # type: ignore[no-any-return]
+                return self._client.get(path, params=params, headers=headers)
+            except (httpx.ConnectError, httpx.RemoteProtocolError, httpx.ReadError):
+                if attempt >= _GET_RETRIES:
+                    raise
+                time.sleep(_GET_RETRY_BACKOFF * 2**attempt)
+                attempt += 1
+
+    def _conditional_get(
+        self,
+        path: str,
+        headers: Mapping[str, str],
+        params: dict[str, str] | None = None,
+        auth_mode: str | None = None,
+    ) -> Any:
+        """GET *path*, revalidating any cached copy with If-None-Match.
+
+        Each CLI command runs in a fresh process, so cached bodies are kept
+        on disk. A 304 reply returns the cached body without re-downloading.
+        """
+        # Key on the credentials too so accounts never share cached bodies.
+        identity: str = hashlib.sha256(
+            (headers.get("Authorization") or headers.get("X-API-KEY") or "").encode()
+        ).hexdigest()[:16]
+        query: str = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        key: str = f"{identity} {self.api_url}{path}?{query}"
+
+        with self._etag_lock:
+            if self._etag_cache is None:
+                self._etag_cache = load_etag_cache()
+            cached: dict[str, Any] | None = self._etag_cache.get(key)
+        request_headers: Mapping[str, str] = headers
+        if cached:
+            conditional: dict[str, str] = {**headers, "If-None-Match": cached["etag"]}
+            if cached.get("last_modified"):
+                conditional["If-Modified-Since"] = cached["last_modified"]
+            request_headers = conditional
+
+        response: httpx.Response = self._get(path, request_headers, params=params)
+        if response.status_code == 304 and cached:
+            return cached["body"]
+        body: Any = self._handle_response(response, auth_mode)
+
+        etag: str | None = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                cache: dict[str, Any] = self._etag_cache if self._etag_cache is not None else {}
+                # Re-insert so dict order tracks recency, then drop the oldest.
+                cache.pop(key, None)
+                cache[key] = {
+                    "etag": etag,
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "body": body,
+                }
+                while len(cache) > _ETAG_CACHE_MAX_ENTRIES:
+                    del cache[next(iter(cache))]
+                self._etag_cache = cache
+                try:
+                    save_etag_cache(cache)
+                except OSError:
+                    # The cache only saves bandwidth; a failed write must not
+                    # turn a successful fetch into an error.
+                    pass
+        return body
 
     # --- Auth endpoints ---
 
     def request_code(self, email: str) -> dict[str, Any]:
         """POST /v1/cli/auth/request-code/"""
-        response: httpx.Response = httpx.post(
-            f"{self.api_url}/v1/cli/auth/request-code/",
-            json={"email": email},
-            headers=self._headers(authenticated=False),
-            timeout=self.timeout,
+        response: httpx.Response = self._client.post(
+            _PATH_REQUEST_CODE,
+            content=dumps({"email": email}),
         )
         return self._handle_response(response)
 
@@ -89,35 +315,25 @@ class DailyBotClient:
         self,
         email: str,
         code: str,
-        organization_id: Optional[int] = None,
+        organization_id: int | None = None,
     ) -> dict[str, Any]:
         """POST /v1/cli/auth/verify-code/"""
-        payload: dict[str, Any] = {"email": email, "code": code}
-        if organization_id is not None:
-            payload["organization_id"] = organization_id
-        response: httpx.Response = httpx.post(
-            f"{self.api_url}/v1/cli/auth/verify-code/",
-            json=payload,
-            headers=self._headers(authenticated=False),
-            timeout=self.timeout,
+        payload: dict[str, Any] = _payload(email=email, code=code, organization_id=organization_id)
+        response: httpx.Response = self._client.post(
+            _PATH_VERIFY_CODE,
+            content=dumps(payload),
         )
         return self._handle_response(response)
 
     def auth_status(self) -> dict[str, Any]:
         """GET /v1/cli/auth/status/"""
-        response: httpx.Response = httpx.get(
-            f"{self.api_url}/v1/cli/auth/status/",
-            headers=self._headers(),
-            timeout=self.timeout,
-        )
-        return self._handle_response(response)
+        return self._conditional_get(_PATH_AUTH_STATUS, self._headers())  # type: ignore[no-any-return]
 
     def logout(self) -> dict[str, Any]:
         """POST /v1/cli/auth/logout/"""
-        response: httpx.Response = httpx.post(
-            f"{self.api_url}/v1/cli/auth/logout/",
+        response: httpx.Response = self._client.post(
+            _PATH_LOGOUT,
             headers=self._headers(),
-            timeout=self.timeout,
         )
         return self._handle_response(response)
 
@@ -125,24 +341,16 @@ class DailyBotClient:
 
     def submit_update(
         self,
-        message: Optional[str] = None,
-        done: Optional[str] = None,
-        doing: Optional[str] = None,
-        blocked: Optional[str] = None,
+        message: str | None = None,
+        done: str | None = None,
+        doing: str | None = None,
+        blocked: str | None = None,
     ) -> dict[str, Any]:
         """POST /v1/cli/updates/"""
-        payload: dict[str, str] = {}
-        if message:
-            payload["message"] = message
-        if done:
-            payload["done"] = done
-        if doing:
-            payload["doing"] = doing
-        if blocked:
-            payload["blocked"] = blocked
-        response: httpx.Response = httpx.post(
-            f"{self.api_url}/v1/cli/updates/",
-            json=payload,
+        payload: dict[str, Any] = _payload(message=message, done=done, doing=doing, blocked=blocked)
+        response: httpx.Response = self._client.post(
+            _PATH_UPDATES,
+            content=dumps(payload),
             headers=self._headers(),
             timeout=120.0,
         )
@@ -150,12 +358,7 @@ class DailyBotClient:
 
     def get_status(self) -> dict[str, Any]:
         """GET /v1/cli/status/"""
-        response: httpx.Response = httpx.get(
-            f"{self.api_url}/v1/cli/status/",
-            headers=self._headers(),
-            timeout=self.timeout,
-        )
-        return self._handle_response(response)
+        return self._conditional_get(_PATH_STATUS, self._headers())  # type: ignore[no-any-return]
 
     # --- Agent endpoints ---
 
@@ -163,62 +366,101 @@ class DailyBotClient:
         self,
         agent_name: str,
         content: str,
-        structured: Optional[dict[str, Any]] = None,
-        metadata: Optional[dict[str, Any]] = None,
+        structured: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
         is_milestone: bool = False,
-        co_authors: Optional[list[str]] = None,
+        co_authors: list[str] | None = None,
     ) -> dict[str, Any]:
         """POST /v1/agent-reports/"""
-        payload: dict[str, Any] = {
-            "agent_name": agent_name,
-            "content": content,
-        }
-        if structured:
-            payload["structured"] = structured
-        if metadata:
-            payload["metadata"] = metadata
-        if is_milestone:
-            payload["is_milestone"] = True
-        if co_authors:
-            payload["co_authors"] = co_authors
-        response: httpx.Response = httpx.post(
-            f"{self.api_url}/v1/agent-reports/",
-            json=payload,
+        payload: dict[str, Any] = _agent_report_payload(
+            agent_name=agent_name,
+            content=content,
+            structured=structured,
+            metadata=metadata,
+            is_milestone=is_milestone,
+            co_authors=co_authors,
+        )
+        response: httpx.Response = self._client.post(
+            _PATH_AGENT_REPORTS,
+            content=dumps(payload),
             headers=self._agent_headers(),
-            timeout=self.timeout,
         )
-        return self._handle_response(response)
+        return self._handle_response(response, self._agent_auth_mode)
+
+    def submit_agent_reports_bulk(
+        self,
+        reports: list[dict[str, Any]],
+    ) -> list[dict[str, Any] | APIError | httpx.TransportError]:
+        """POST /v1/agent-reports/ for each report, concurrently.
+
+        Each report is a dict of submit_agent_report() keyword arguments. Up to
+        _BULK_CONCURRENCY requests are multiplexed over one HTTP/2 connection.
+        Results come back in input order; a rejected report yields its APIError
+        and an unreachable one its httpx.TransportError instead of raising, so
+        one failure never hides which other reports went through.
+        """
+        import asyncio
+
+        import httpx
+
+        headers: Mapping[str, str] = self._agent_headers()
+        bodies: list[bytes] = [dumps(_agent_report_payload(**report)) for report in reports]
+
+        async def _send_all() -> list[httpx.Response | BaseException]:
+            limit: asyncio.Semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+            async with httpx.AsyncClient(
+                base_url=self.api_url,
+                http2=True,
+                timeout=self.timeout,
+                headers=self._base_headers,
+                limits=httpx.Limits(
+                    max_keepalive_connections=_BULK_CONCURRENCY,
+                    max_connections=_BULK_CONCURRENCY,
+                ),
+            ) as client:
+
+                async def _send(body: bytes) -> httpx.Response:
+                    async with limit:
+                        return await client.post(_PATH_AGENT_REPORTS, content=body, headers=headers)
+
+                return await asyncio.gather(*(_send(body) for body in bodies), return_exceptions=True)
+
+        results: list[dict[str, Any] | APIError | httpx.TransportError] = []
+        for response in asyncio.run(_send_all()):
+            if isinstance(response, httpx.TransportError):
+                results.append(response)
+                continue
+            if isinstance(response, BaseException):
+                raise response
+            try:
+                results.append(self._handle_response(response, self._agent_auth_mode))
+            except APIError as e:
+                results.append(e)
+        return results
 
     def submit_agent_health(
         self,
         agent_name: str,
         ok: bool,
-        message: Optional[str] = None,
+        message: str | None = None,
     ) -> dict[str, Any]:
         """POST /v1/agent-health/"""
-        payload: dict[str, Any] = {
-            "agent_name": agent_name,
-            "ok": ok,
-        }
-        if message:
-            payload["message"] = message
-        response: httpx.Response = httpx.post(
-            f"{self.api_url}/v1/agent-health/",
-            json=payload,
+        payload: dict[str, Any] = _payload(agent_name=agent_name, ok=ok, message=message)
+        response: httpx.Response = self._client.post(
+            _PATH_AGENT_HEALTH,
+            content=dumps(payload),
             headers=self._agent_headers(),
-            timeout=self.timeout,
         )
-        return self._handle_response(response)
+        return self._handle_response(response, self._agent_auth_mode)
 
     def get_agent_health(self, agent_name: str) -> dict[str, Any]:
         """GET /v1/agent-health/?agent_name=..."""
-        response: httpx.Response = httpx.get(
-            f"{self.api_url}/v1/agent-health/",
+        return self._conditional_get(  # type: ignore[no-any-return]
+            _PATH_AGENT_HEALTH,
+            self._agent_headers(),
             params={"agent_name": agent_name},
-            headers=self._agent_headers(),
-            timeout=self.timeout,
+            auth_mode=self._agent_auth_mode,
         )
-        return self._handle_response(response)
 
     # --- Agent webhook endpoints ---
 
@@ -226,33 +468,30 @@ class DailyBotClient:
         self,
         agent_name: str,
         webhook_url: str,
-        webhook_secret: Optional[str] = None,
+        webhook_secret: str | None = None,
     ) -> dict[str, Any]:
         """POST /v1/agent-webhook/"""
-        payload: dict[str, Any] = {
-            "agent_name": agent_name,
-            "webhook_url": webhook_url,
-        }
-        if webhook_secret:
-            payload["webhook_secret"] = webhook_secret
-        response: httpx.Response = httpx.post(
-            f"{self.api_url}/v1/agent-webhook/",
-            json=payload,
+        payload: dict[str, Any] = _payload(
+            agent_name=agent_name,
+            webhook_url=webhook_url,
+            webhook_secret=webhook_secret,
+        )
+        response: httpx.Response = self._client.post(
+            _PATH_AGENT_WEBHOOK,
+            content=dumps(payload),
             headers=self._agent_headers(),
-            timeout=self.timeout,
         )
-        return self._handle_response(response)
+        return self._handle_response(response, self._agent_auth_mode)
 
     def unregister_agent_webhook(self, agent_name: str) -> dict[str, Any]:
         """DELETE /v1/agent-webhook/"""
-        response: httpx.Response = httpx.request(
+        response: httpx.Response = self._client.request(
             "DELETE",
-            f"{self.api_url}/v1/agent-webhook/",
-            json={"agent_name": agent_name},
+            _PATH_AGENT_WEBHOOK,
+            content=dumps({"agent_name": agent_name}),
             headers=self._agent_headers(),
-            timeout=self.timeout,
         )
-        return self._handle_response(response)
+        return self._handle_response(response, self._agent_auth_mode)
 
     # --- Agent email endpoints ---
 
@@ -262,24 +501,22 @@ class DailyBotClient:
         to: list[str],
         subject: str,
         body_html: str,
-        metadata: Optional[dict[str, Any]] = None,
+        metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """POST /v1/agent-email/send/"""
-        payload: dict[str, Any] = {
-            "agent_name": agent_name,
-            "to": to,
-            "subject": subject,
-            "body_html": body_html,
-        }
-        if metadata:
-            payload["metadata"] = metadata
-        response: httpx.Response = httpx.post(
-            f"{self.api_url}/v1/agent-email/send/",
-            json=payload,
+        payload: dict[str, Any] = _payload(
+            agent_name=agent_name,
+            to=to,
+            subject=subject,
+            body_html=body_html,
+            metadata=metadata,
+        )
+        response: httpx.Response = self._client.post(
+            _PATH_AGENT_EMAIL_SEND,
+            content=dumps(payload),
             headers=self._agent_headers(),
-            timeout=self.timeout,
         )
-        return self._handle_response(response)
+        return self._handle_response(response, self._agent_auth_mode)
 
     # --- Agent message endpoints ---
 
@@ -287,76 +524,62 @@ class DailyBotClient:
         self,
         agent_name: str,
         content: str,
-        message_type: Optional[str] = None,
-        metadata: Optional[dict[str, Any]] = None,
-        expires_at: Optional[str] = None,
-        sender_type: Optional[str] = None,
-        sender_name: Optional[str] = None,
+        message_type: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        expires_at: str | None = None,
+        sender_type: str | None = None,
+        sender_name: str | None = None,
     ) -> dict[str, Any]:
         """POST /v1/agent-messages/"""
-        payload: dict[str, Any] = {
-            "agent_name": agent_name,
-            "content": content,
-        }
-        if message_type:
-            payload["message_type"] = message_type
-        if metadata:
-            payload["metadata"] = metadata
-        if expires_at:
-            payload["expires_at"] = expires_at
-        if sender_type:
-            payload["sender_type"] = sender_type
-        if sender_name:
-            payload["sender_name"] = sender_name
-        response: httpx.Response = httpx.post(
-            f"{self.api_url}/v1/agent-messages/",
-            json=payload,
+        payload: dict[str, Any] = _payload(
+            agent_name=agent_name,
+            content=content,
+            message_type=message_type,
+            metadata=metadata,
+            expires_at=expires_at,
+            sender_type=sender_type,
+            sender_name=sender_name,
+        )
+        response: httpx.Response = self._client.post(
+            _PATH_AGENT_MESSAGES,
+            content=dumps(payload),
             headers=self._agent_headers(),
-            timeout=self.timeout,
         )
-        return self._handle_response(response)
+        return self._handle_response(response, self._agent_auth_mode)
 
     def get_agent_messages(
         self,
         agent_name: str,
-        delivered: Optional[bool] = None,
+        delivered: bool | None = None,
     ) -> list[dict[str, Any]]:
         """GET /v1/agent-messages/?agent_name=..."""
         params: dict[str, str] = {"agent_name": agent_name}
         if delivered is not None:
             params["delivered"] = "true" if delivered else "false"
-        response: httpx.Response = httpx.get(
-            f"{self.api_url}/v1/agent-messages/",
+        return self._conditional_get(  # type: ignore[no-any-return]
+            _PATH_AGENT_MESSAGES,
+            self._agent_headers(),
             params=params,
-            headers=self._agent_headers(),
-            timeout=self.timeout,
+            auth_mode=self._agent_auth_mode,
         )
-        if response.status_code >= 400:
-            self._handle_response(response)
-        return response.json()  # type: ignore[no-any-return]
 
     def mark_agent_messages_read(
         self,
         message_ids: list[str],
     ) -> dict[str, Any]:
         """PATCH /v1/agent-messages/read/"""
-        response: httpx.Response = httpx.patch(
-            f"{self.api_url}/v1/agent-messages/read/",
-            json={"message_ids": message_ids},
+        response: httpx.Response = self._client.patch(
+            _PATH_AGENT_MESSAGES_READ,
+            content=dumps({"message_ids": message_ids}),
             headers=self._agent_headers(),
-            timeout=self.timeout,
         )
-        return self._handle_response(response)
+        return self._handle_response(response, self._agent_auth_mode)
 
     # --- Agent registration endpoints ---
 
     def get_registration_challenge(self) -> dict[str, Any]:
         """GET /v1/agent/register/challenge/ — no auth required."""
-        response: httpx.Response = httpx.get(
-            f"{self.api_url}/v1/agent/register/challenge/",
-            headers=self._headers(authenticated=False),
-            timeout=self.timeout,
-        )
+        response: httpx.Response = self._get(_PATH_REGISTER_CHALLENGE)
         return self._handle_response(response)
 
     def register_agent(
@@ -366,24 +589,21 @@ class DailyBotClient:
         reason: str,
         org_name: str,
         agent_name: str,
-        contact_email: Optional[str] = None,
+        contact_email: str | None = None,
         timezone: str = "UTC",
     ) -> dict[str, Any]:
         """POST /v1/agent/register/ — no auth required."""
-        payload: dict[str, Any] = {
-            "challenge_id": challenge_id,
-            "answer": answer,
-            "reason": reason,
-            "org_name": org_name,
-            "agent_name": agent_name,
-            "timezone": timezone,
-        }
-        if contact_email:
-            payload["contact_email"] = contact_email
-        response: httpx.Response = httpx.post(
-            f"{self.api_url}/v1/agent/register/",
-            json=payload,
-            headers=self._headers(authenticated=False),
-            timeout=self.timeout,
+        payload: dict[str, Any] = _payload(
+            challenge_id=challenge_id,
+            answer=answer,
+            reason=reason,
+            org_name=org_name,
+            agent_name=agent_name,
+            timezone=timezone,
+            contact_email=contact_email,
+        )
+        response: httpx.Response = self._client.post(
+            _PATH_REGISTER,
+            content=dumps(payload),
         )
         return self._handle_response(response)
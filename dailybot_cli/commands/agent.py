@@ -1,7 +1,9 @@
 """Agent commands for Dailybot CLI (API key or login session)."""
 
+from __future__ import annotations
+
 import re
-from typing import Any, Optional
+from typing import IO, Any
 
 import click
 
@@ -18,7 +20,6 @@ from dailybot_cli.config import (
     save_agent_profile,
 )
 from dailybot_cli.display import (
-    console,
     print_agent_email_sent,
     print_agent_health,
     print_agent_message_sent,
@@ -30,7 +31,9 @@ from dailybot_cli.display import (
     print_registration_result,
     print_success,
     print_webhook_result,
+    spinner,
 )
+from dailybot_cli.json_compat import JSONDecodeError, loads
 
 
 _NO_AUTH_MSG: str = (
@@ -46,9 +49,28 @@ _CHALLENGE_WORD_COUNT: int = 52
 _CHALLENGE_NUMBER_RE: re.Pattern[str] = re.compile(r"session is (\d+)\.")
 
 
+def _shared_client(api_key: str | None = None) -> DailyBotClient:
+    """Return this invocation's client for *api_key*, creating it on first use.
+
+    Clients live in the root Click context's ``meta`` so nested groups and
+    ``ctx.invoke`` calls reuse one connection pool, which is closed when the
+    command finishes.
+    """
+    ctx: click.Context | None = click.get_current_context(silent=True)
+    if ctx is None:
+        return DailyBotClient(api_key=api_key)
+    root: click.Context = ctx.find_root()
+    clients: dict[str | None, DailyBotClient] = root.meta.setdefault("dailybot.clients", {})
+    client: DailyBotClient | None = clients.get(api_key)
+    if client is None:
+        client = clients[api_key] = DailyBotClient(api_key=api_key)
+        root.call_on_close(client.close)
+    return client
+
+
 def _resolve_agent_context(
-    profile_flag: Optional[str],
-    name_flag: Optional[str],
+    profile_flag: str | None,
+    name_flag: str | None,
 ) -> tuple[str, DailyBotClient]:
     """Resolve agent name and build a configured client.
 
@@ -63,7 +85,7 @@ def _resolve_agent_context(
     agent_name: profile.agent_name > --name flag > "CLI Agent"
     """
     # Try profile
-    profile_data: Optional[dict[str, Any]] = None
+    profile_data: dict[str, Any] | None = None
     if profile_flag:
         profile_data = get_profile(profile_flag)
         if not profile_data:
@@ -74,12 +96,12 @@ def _resolve_agent_context(
 
     if profile_data:
         agent_name: str = name_flag or profile_data.get("agent_name", "CLI Agent")
-        api_key: Optional[str] = profile_data.get("api_key")
+        api_key: str | None = profile_data.get("api_key")
         if api_key:
-            return agent_name, DailyBotClient(api_key=api_key)
+            return agent_name, _shared_client(api_key)
         # Profile without key — fall through to Bearer token
         if get_token():
-            return agent_name, DailyBotClient()
+            return agent_name, _shared_client()
         print_error(
             f"Profile '{profile_data['profile']}' has no API key and no login session.\n"
             "  Run: dailybot login  or  dailybot agent configure --name ... --key ..."
@@ -92,7 +114,7 @@ def _resolve_agent_context(
         raise SystemExit(1)
 
     agent_name = name_flag or "CLI Agent"
-    return agent_name, DailyBotClient()
+    return agent_name, _shared_client()
 
 
 # --- Agent group ---
@@ -101,7 +123,7 @@ def _resolve_agent_context(
 @click.group()
 @click.option("--profile", "-p", default=None, help="Agent profile name from agents.json.", hidden=False)
 @click.pass_context
-def agent(ctx: click.Context, profile: Optional[str]) -> None:
+def agent(ctx: click.Context, profile: str | None) -> None:
     """Agent commands (requires API key or login session)."""
     ctx.ensure_object(dict)
     ctx.obj["profile"] = profile
@@ -115,7 +137,7 @@ def agent(ctx: click.Context, profile: Optional[str]) -> None:
 @click.option("--key", "-k", default=None, help="API key (optional — omit if using OTP login).")
 @click.option("--profile", "profile_name", default=None, help="Profile name (defaults to slugified --name).")
 @click.pass_context
-def agent_configure(ctx: click.Context, name: str, key: Optional[str], profile_name: Optional[str]) -> None:
+def agent_configure(ctx: click.Context, name: str, key: str | None, profile_name: str | None) -> None:
     """Configure a named agent profile.
 
     \b
@@ -127,9 +149,9 @@ def agent_configure(ctx: click.Context, name: str, key: Optional[str], profile_n
 
     if key:
         # Validate the key
-        client: DailyBotClient = DailyBotClient(api_key=key)
+        client: DailyBotClient = _shared_client(key)
         try:
-            with console.status("Validating API key..."):
+            with spinner("Validating API key..."):
                 client.get_agent_health(agent_name=name)
         except APIError as e:
             if e.status_code in (401, 403):
@@ -157,7 +179,7 @@ def agent_profiles() -> None:
     data: dict[str, Any] = load_agents()
     all_profiles: dict[str, Any] = data.get("profiles", {})
     for p in profiles:
-        raw_key: Optional[str] = all_profiles.get(p["profile"], {}).get("api_key")
+        raw_key: str | None = all_profiles.get(p["profile"], {}).get("api_key")
         if raw_key:
             p["masked_key"] = raw_key[:4] + "****" if len(raw_key) > 4 else "****"
     print_agent_profiles(profiles)
@@ -166,41 +188,87 @@ def agent_profiles() -> None:
 # --- agent update ---
 
 
+_BATCH_REPORT_FIELDS: frozenset[str] = frozenset(
+    {"content", "structured", "metadata", "is_milestone", "co_authors"}
+)
+
+
+def _format_report_result(result: dict[str, Any]) -> str:
+    """Build the success line for a submitted agent report."""
+    msg: str = f"Report submitted (id: {result.get('id', 'N/A')})"
+    if result.get("is_milestone"):
+        msg += " [Milestone]"
+    co: list[dict[str, Any]] | None = result.get("co_authors")
+    if co:
+        names: str = ", ".join(a.get("name", a.get("uuid", "?")) for a in co)
+        msg += f"\n  Co-authors: {names}"
+    return msg
+
+
+def _read_batch_reports(batch: IO[str], defaults: dict[str, Any]) -> list[dict[str, Any]]:
+    """Parse one JSON report per line, applying command-line flags as defaults."""
+    reports: list[dict[str, Any]] = []
+    for line_no, line in enumerate(batch, start=1):
+        if not line.strip():
+            continue
+        try:
+            entry: Any = loads(line)
+        except JSONDecodeError:
+            print_error(f"Invalid JSON on line {line_no} of --batch.")
+            raise SystemExit(1)
+        if not isinstance(entry, dict) or not entry.get("content"):
+            print_error(f"Line {line_no} of --batch must be an object with a \"content\" field.")
+            raise SystemExit(1)
+        unknown: set[str] = set(entry) - _BATCH_REPORT_FIELDS
+        if unknown:
+            print_error(f"Unknown field(s) on line {line_no} of --batch: {', '.join(sorted(unknown))}")
+            raise SystemExit(1)
+        reports.append({**defaults, **entry})
+    if not reports:
+        print_error("No reports found in --batch input.")
+        raise SystemExit(1)
+    return reports
+
+
 @agent.command(name="update")
-@click.argument("content")
+@click.argument("content", required=False)
 @click.option("--name", "-n", default=None, help="Agent worker name.")
 @click.option("--profile", "-p", default=None, help="Agent profile name from agents.json.")
 @click.option("--json-data", "-j", help="Structured JSON data to include.")
 @click.option("--metadata", "-d", help="JSON metadata (e.g. repo, branch, PR).")
 @click.option("--milestone", "-m", is_flag=True, default=False, help="Mark as a milestone accomplishment.")
 @click.option("--co-authors", "-c", multiple=True, help="Co-author email or UUID (repeatable, or comma-separated).")
+@click.option("--batch", type=click.File("r"), default=None, help="File with one JSON report per line ('-' for stdin).")
 @click.pass_context
-def agent_update(ctx: click.Context, content: str, name: Optional[str], profile: Optional[str], json_data: Optional[str], metadata: Optional[str], milestone: bool, co_authors: tuple[str, ...]) -> None:
+def agent_update(ctx: click.Context, content: str | None, name: str | None, profile: str | None, json_data: str | None, metadata: str | None, milestone: bool, co_authors: tuple[str, ...], batch: IO[str] | None) -> None:
     """Submit an agent activity report.
 
     \b
       dailybot agent update "Deployed v2.1 to staging"
       dailybot agent update "Built feature X" --name "Claude Code"
       dailybot agent update "Deployed" --profile ci-bot
+      dailybot agent update --batch reports.jsonl
     """
-    profile_flag: Optional[str] = profile or ctx.obj.get("profile")
-    agent_name, client = _resolve_agent_context(profile_flag, name)
+    if (content is None) == (batch is None):
+        print_error("Provide either CONTENT or --batch.")
+        raise SystemExit(1)
 
-    import json as json_mod
+    profile_flag: str | None = profile or ctx.obj.get("profile")
+    agent_name, client = _resolve_agent_context(profile_flag, name)
 
-    structured: Optional[dict[str, Any]] = None
+    structured: dict[str, Any] | None = None
     if json_data:
         try:
-            structured = json_mod.loads(json_data)
-        except json_mod.JSONDecodeError:
+            structured = loads(json_data)
+        except JSONDecodeError:
             print_error("Invalid JSON in --json-data.")
             raise SystemExit(1)
 
-    metadata_dict: Optional[dict[str, Any]] = None
+    metadata_dict: dict[str, Any] | None = None
     if metadata:
         try:
-            metadata_dict = json_mod.loads(metadata)
-        except json_mod.JSONDecodeError:
+            metadata_dict = loads(metadata)
+        except JSONDecodeError:
             print_error("Invalid JSON in --metadata.")
             raise SystemExit(1)
 
@@ -212,8 +280,46 @@ def agent_update(ctx: click.Context, content: str, name: Optional[str], profile:
             if stripped:
                 co_author_list.append(stripped)
 
+    if batch is not None:
+        reports: list[dict[str, Any]] = _read_batch_reports(
+            batch,
+            {
+                "agent_name": agent_name,
+                "structured": structured,
+                "metadata": metadata_dict,
+                "is_milestone": milestone,
+                "co_authors": co_author_list or None,
+            },
+        )
+        import httpx
+
+        with spinner(f"Submitting {len(reports)} agent reports..."):
+            results: list[dict[str, Any] | APIError | httpx.TransportError] = (
+                client.submit_agent_reports_bulk(reports)
+            )
+        failed: int = 0
+        pending_batch: list[dict[str, Any]] = []
+        for line_no, outcome in enumerate(results, start=1):
+            if isinstance(outcome, APIError):
+                failed += 1
+                print_error(f"Report {line_no}: {outcome.detail}")
+            elif isinstance(outcome, httpx.TimeoutException):
+                failed += 1
+                print_error(f"Report {line_no}: timed out; it may still have been recorded.")
+            elif isinstance(outcome, httpx.TransportError):
+                failed += 1
+                print_error(f"Report {line_no}: could not reach Dailybot ({outcome}).")
+            else:
+                print_success(f"Report {line_no}: {_format_report_result(outcome)}")
+                pending_batch = outcome.get("pending_messages", []) or pending_batch
+        if pending_batch:
+            print_pending_agent_messages(pending_batch)
+        if failed:
+            raise SystemExit(1)
+        return
+
     try:
-        with console.status("Submitting agent report..."):
+        with spinner("Submitting agent report..."):
             result: dict[str, Any] = client.submit_agent_report(
                 agent_name=agent_name,
                 content=content,
@@ -222,14 +328,7 @@ def agent_update(ctx: click.Context, content: str, name: Optional[str], profile:
                 is_milestone=milestone,
                 co_authors=co_author_list or None,
             )
-        msg: str = f"Report submitted (id: {result.get('id', 'N/A')})"
-        if result.get("is_milestone"):
-            msg += " [Milestone]"
-        co: list[dict[str, Any]] | None = result.get("co_authors")
-        if co:
-            names: str = ", ".join(a.get("name", a.get("uuid", "?")) for a in co)
-            msg += f"\n  Co-authors: {names}"
-        print_success(msg)
+        print_success(_format_report_result(result))
         pending: list[dict[str, Any]] = result.get("pending_messages", [])
         if pending:
             print_pending_agent_messages(pending)
@@ -254,9 +353,9 @@ def agent_health(
     report_ok: bool,
     report_fail: bool,
     query_status: bool,
-    message: Optional[str],
-    name: Optional[str],
-    profile: Optional[str],
+    message: str | None,
+    name: str | None,
+    profile: str | None,
 ) -> None:
     """Report or query agent health status.
 
@@ -265,21 +364,21 @@ def agent_health(
       dailybot agent health --fail --message "DB unreachable"
       dailybot agent health --status --name "Claude Code"
     """
-    flags: int = sum([report_ok, report_fail, query_status])
+    flags: int = report_ok + report_fail + query_status
     if flags != 1:
         print_error("Specify exactly one of --ok, --fail, or --status.")
         raise SystemExit(1)
 
-    profile_flag: Optional[str] = profile or ctx.obj.get("profile")
+    profile_flag: str | None = profile or ctx.obj.get("profile")
     agent_name, client = _resolve_agent_context(profile_flag, name)
 
     try:
         if query_status:
-            with console.status("Fetching agent health..."):
+            with spinner("Fetching agent health..."):
                 result: dict[str, Any] = client.get_agent_health(agent_name=agent_name)
             print_agent_health(result)
         else:
-            with console.status("Submitting agent health..."):
+            with spinner("Submitting agent health..."):
                 result = client.submit_agent_health(
                     agent_name=agent_name,
                     ok=report_ok,
@@ -306,18 +405,18 @@ def agent_webhook() -> None:
 @click.option("--name", "-n", default=None, help="Agent worker name.")
 @click.option("--profile", "-p", default=None, help="Agent profile name from agents.json.")
 @click.pass_context
-def webhook_register(ctx: click.Context, url: str, secret: Optional[str], name: Optional[str], profile: Optional[str]) -> None:
+def webhook_register(ctx: click.Context, url: str, secret: str | None, name: str | None, profile: str | None) -> None:
     """Register a webhook for the agent.
 
     \b
       dailybot agent webhook register --url https://my-server.com/hook
       dailybot agent webhook register --url https://... --secret my-token
     """
-    profile_flag: Optional[str] = profile or ctx.obj.get("profile")
+    profile_flag: str | None = profile or ctx.obj.get("profile")
     agent_name, client = _resolve_agent_context(profile_flag, name)
 
     try:
-        with console.status("Registering webhook..."):
+        with spinner("Registering webhook..."):
             result: dict[str, Any] = client.register_agent_webhook(
                 agent_name=agent_name,
                 webhook_url=url,
@@ -333,18 +432,18 @@ def webhook_register(ctx: click.Context, url: str, secret: Optional[str], name:
 @click.option("--name", "-n", default=None, help="Agent worker name.")
 @click.option("--profile", "-p", default=None, help="Agent profile name from agents.json.")
 @click.pass_context
-def webhook_unregister(ctx: click.Context, name: Optional[str], profile: Optional[str]) -> None:
+def webhook_unregister(ctx: click.Context, name: str | None, profile: str | None) -> None:
     """Unregister the agent's webhook.
 
     \b
       dailybot agent webhook unregister
       dailybot agent webhook unregister --name "Claude Code"
     """
-    profile_flag: Optional[str] = profile or ctx.obj.get("profile")
+    profile_flag: str | None = profile or ctx.obj.get("profile")
     agent_name, client = _resolve_agent_context(profile_flag, name)
 
     try:
-        with console.status("Unregistering webhook..."):
+        with spinner("Unregistering webhook..."):
             result: dict[str, Any] = client.unregister_agent_webhook(agent_name=agent_name)
         print_success(result.get("detail", "Webhook unregistered."))
     except APIError as e:
@@ -374,11 +473,11 @@ def message_send(
     ctx: click.Context,
     to_agent: str,
     content: str,
-    message_type: Optional[str],
-    name: Optional[str],
-    profile: Optional[str],
-    json_data: Optional[str],
-    expires_at: Optional[str],
+    message_type: str | None,
+    name: str | None,
+    profile: str | None,
+    json_data: str | None,
+    expires_at: str | None,
 ) -> None:
     """Send a message to an agent.
 
@@ -386,21 +485,19 @@ def message_send(
       dailybot agent message send --to "Claude Code" --content "Review PR #42"
       dailybot agent message send --to "Claude Code" --content "Do X" --type command
     """
-    profile_flag: Optional[str] = profile or ctx.obj.get("profile")
+    profile_flag: str | None = profile or ctx.obj.get("profile")
     agent_name, client = _resolve_agent_context(profile_flag, name)
 
-    metadata: Optional[dict[str, Any]] = None
+    metadata: dict[str, Any] | None = None
     if json_data:
-        import json
-
         try:
-            metadata = json.loads(json_data)
-        except json.JSONDecodeError:
+            metadata = loads(json_data)
+        except JSONDecodeError:
             print_error("Invalid JSON in --json-data.")
             raise SystemExit(1)
 
     try:
-        with console.status("Sending message..."):
+        with spinner("Sending message..."):
             result: dict[str, Any] = client.send_agent_message(
                 agent_name=to_agent,
                 content=content,
@@ -421,19 +518,19 @@ def message_send(
 @click.option("--profile", "-p", default=None, help="Agent profile name from agents.json.")
 @click.option("--pending", is_flag=True, default=False, help="Show only undelivered messages.")
 @click.pass_context
-def message_list(ctx: click.Context, name: Optional[str], profile: Optional[str], pending: bool) -> None:
+def message_list(ctx: click.Context, name: str | None, profile: str | None, pending: bool) -> None:
     """List messages for an agent.
 
     \b
       dailybot agent message list --name "Claude Code"
       dailybot agent message list --pending
     """
-    profile_flag: Optional[str] = profile or ctx.obj.get("profile")
+    profile_flag: str | None = profile or ctx.obj.get("profile")
     agent_name, client = _resolve_agent_context(profile_flag, name)
 
-    delivered: Optional[bool] = False if pending else None
+    delivered: bool | None = False if pending else None
     try:
-        with console.status("Fetching messages..."):
+        with spinner("Fetching messages..."):
             messages: list[dict[str, Any]] = client.get_agent_messages(
                 agent_name=agent_name,
                 delivered=delivered,
@@ -448,18 +545,18 @@ def message_list(ctx: click.Context, name: Optional[str], profile: Optional[str]
 @click.argument("message_ids", nargs=-1, required=True)
 @click.option("--profile", "-p", default=None, help="Agent profile name from agents.json.")
 @click.pass_context
-def message_claim(ctx: click.Context, message_ids: tuple[str, ...], profile: Optional[str]) -> None:
+def message_claim(ctx: click.Context, message_ids: tuple[str, ...], profile: str | None) -> None:
     """Mark one or more messages as read.
 
     \b
       dailybot agent message claim abc-123
       dailybot agent message claim abc-123 def-456
     """
-    profile_flag: Optional[str] = profile or ctx.obj.get("profile")
+    profile_flag: str | None = profile or ctx.obj.get("profile")
     _agent_name, client = _resolve_agent_context(profile_flag, None)
 
     try:
-        with console.status("Marking messages as read..."):
+        with spinner("Marking messages as read..."):
             result: dict[str, Any] = client.mark_agent_messages_read(
                 message_ids=list(message_ids),
             )
@@ -474,18 +571,18 @@ def message_claim(ctx: click.Context, message_ids: tuple[str, ...], profile: Opt
 @click.option("--name", "-n", default=None, help="Agent worker name.")
 @click.option("--profile", "-p", default=None, help="Agent profile name from agents.json.")
 @click.pass_context
-def message_claim_all(ctx: click.Context, name: Optional[str], profile: Optional[str]) -> None:
+def message_claim_all(ctx: click.Context, name: str | None, profile: str | None) -> None:
     """Mark all pending messages as delivered via health check.
 
     \b
       dailybot agent message claim-all
       dailybot agent message claim-all --name "Claude Code"
     """
-    profile_flag: Optional[str] = profile or ctx.obj.get("profile")
+    profile_flag: str | None = profile or ctx.obj.get("profile")
     agent_name, client = _resolve_agent_context(profile_flag, name)
 
     try:
-        with console.status("Marking all messages as delivered..."):
+        with spinner("Marking all messages as delivered..."):
             client.submit_agent_health(
                 agent_name=agent_name,
                 ok=True,
@@ -519,9 +616,9 @@ def email_send(
     recipients: tuple[str, ...],
     subject: str,
     body_html: str,
-    name: Optional[str],
-    profile: Optional[str],
-    metadata: Optional[str],
+    name: str | None,
+    profile: str | None,
+    metadata: str | None,
 ) -> None:
     """Send an email through an agent.
 
@@ -531,23 +628,21 @@ def email_send(
       dailybot agent email send --to a@co.com --to b@co.com --subject "Report" \\
         --body-html "<h1>Done</h1>"
     """
-    profile_flag: Optional[str] = profile or ctx.obj.get("profile")
+    profile_flag: str | None = profile or ctx.obj.get("profile")
     agent_name, client = _resolve_agent_context(profile_flag, name)
 
     to_list: list[str] = list(recipients)
 
-    metadata_dict: Optional[dict[str, Any]] = None
+    metadata_dict: dict[str, Any] | None = None
     if metadata:
-        import json
-
         try:
-            metadata_dict = json.loads(metadata)
-        except json.JSONDecodeError:
+            metadata_dict = loads(metadata)
+        except JSONDecodeError:
             print_error("Invalid JSON in --metadata.")
             raise SystemExit(1)
 
     try:
-        with console.status("Sending email..."):
+        with spinner("Sending email..."):
             result: dict[str, Any] = client.send_agent_email(
                 agent_name=agent_name,
                 to=to_list,
@@ -570,7 +665,7 @@ def email_send(
 
 def _solve_challenge(instruction: str) -> int:
     """Extract random_number from challenge instruction and compute the answer."""
-    match: Optional[re.Match[str]] = _CHALLENGE_NUMBER_RE.search(instruction)
+    match: re.Match[str] | None = _CHALLENGE_NUMBER_RE.search(instruction)
     if not match:
         print_error("Could not parse challenge. Please report this issue.")
         raise SystemExit(1)
@@ -587,9 +682,9 @@ def _solve_challenge(instruction: str) -> int:
 def agent_register(
     org_name: str,
     agent_name: str,
-    email: Optional[str],
+    email: str | None,
     timezone: str,
-    profile_name: Optional[str],
+    profile_name: str | None,
 ) -> None:
     """Register a new agent and organization (no existing account needed).
 
@@ -597,15 +692,15 @@ def agent_register(
       dailybot agent register --org-name "My Startup" --agent-name "Claude Code"
       dailybot agent register --org-name "My Startup" --agent-name "Claude Code" --email me@co.com
     """
-    client: DailyBotClient = DailyBotClient()
+    client: DailyBotClient = _shared_client()
     slug: str = profile_name or _slugify(agent_name)
     reason: str = f"Agent '{agent_name}' registering for org '{org_name}'"
 
     def _attempt_register() -> dict[str, Any]:
-        with console.status("Getting registration challenge..."):
+        with spinner("Getting registration challenge..."):
             challenge: dict[str, Any] = client.get_registration_challenge()
         answer: int = _solve_challenge(challenge["instruction"])
-        with console.status("Registering agent..."):
+        with spinner("Registering agent..."):
             return client.register_agent(
                 challenge_id=challenge["challenge_id"],
                 answer=answer,
@@ -634,8 +729,8 @@ def agent_register(
             raise SystemExit(1)
 
     # Save profile
-    api_key: Optional[str] = result.get("api_key")
-    agent_email: Optional[str] = result.get("agent_email")
+    api_key: str | None = result.get("api_key")
+    agent_email: str | None = result.get("agent_email")
     save_agent_profile(slug, agent_name=agent_name, api_key=api_key, agent_email=agent_email)
 
     # Display result
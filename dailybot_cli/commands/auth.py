@@ -1,10 +1,10 @@
 """Authentication commands for Dailybot CLI."""
 
+import os
 import sys
 from typing import Any, Optional
 
 import click
-import questionary
 
 from dailybot_cli.api_client import APIError, DailyBotClient
 from dailybot_cli.config import (
@@ -16,15 +16,21 @@ from dailybot_cli.config import (
     save_org_cache,
 )
 from dailybot_cli.display import (
-    console,
+    org_name_of,
+    org_uuid_of,
     print_error,
     print_info,
     print_success,
+    spinner,
 )
 
 
 def _prompt_org_selection(organizations: list[dict[str, Any]]) -> dict[str, Any]:
     """Display orgs and prompt the user to pick one."""
+    # questionary pulls in prompt_toolkit, which dominates CLI startup time;
+    # only pay for it when a prompt is actually shown.
+    import questionary
+
     choices: list[questionary.Choice] = [
         questionary.Choice(title=org.get("name", "Unknown"), value=org)
         for org in organizations
@@ -42,10 +48,10 @@ def _prompt_org_selection(organizations: list[dict[str, Any]]) -> dict[str, Any]
 def _print_org_list(organizations: list[dict[str, Any]]) -> None:
     """Print organizations with UUIDs and names for non-interactive use."""
     print_info("You belong to multiple organizations. Use --org=UUID to select one:")
-    for org in organizations:
-        org_uuid: str = org.get("uuid", "")
-        org_name: str = org.get("name", "Unknown")
-        click.echo(f"  {org_name} (uuid: {org_uuid})")
+    lines: list[str] = [
+        f"  {org.get('name', 'Unknown')} (uuid: {org.get('uuid', '')})" for org in organizations
+    ]
+    click.echo("\n".join(lines))
 
 
 def _resolve_org_uuid(organizations: list[dict[str, Any]], org_uuid: str) -> Optional[int]:
@@ -59,7 +65,7 @@ def _resolve_org_uuid(organizations: list[dict[str, Any]], org_uuid: str) -> Opt
 def _verify_and_save(client: DailyBotClient, email: str, code: str, organization_id: Optional[int]) -> None:
     """Verify OTP code and save credentials."""
     try:
-        with console.status("Verifying code..."):
+        with spinner("Verifying code..."):
             result: dict[str, Any] = client.verify_code(email, code, organization_id=organization_id)
     except APIError as e:
         print_error(e.detail)
@@ -87,8 +93,8 @@ def _verify_and_save(client: DailyBotClient, email: str, code: str, organization
         raise SystemExit(1)
 
     org_raw: Any = result.get("organization", "")
-    org_name: str = org_raw.get("name", "") if isinstance(org_raw, dict) else str(org_raw)
-    org_uuid: str = org_raw.get("uuid", "") if isinstance(org_raw, dict) else result.get("organization_uuid", "")
+    org_name: str = org_name_of(org_raw)
+    org_uuid: str = org_uuid_of(org_raw, fallback=result.get("organization_uuid", ""))
     save_credentials(
         token=token,
         email=email,
@@ -99,13 +105,10 @@ def _verify_and_save(client: DailyBotClient, email: str, code: str, organization
     print_success(f"Logged in as {email} ({org_name})")
 
 
-def _do_login(email: str) -> None:
-    """Shared login logic for 'dailybot login' and interactive mode."""
-    client: DailyBotClient = DailyBotClient()
-
-    # Step 1: Request OTP code
+def _request_code(client: DailyBotClient, email: str) -> tuple[bool, list[dict[str, Any]]]:
+    """Request an OTP for *email*; return (is_multi_org, organizations)."""
     try:
-        with console.status("Sending verification code..."):
+        with spinner("Sending verification code..."):
             request_result: dict[str, Any] = client.request_code(email)
     except APIError as e:
         print_error(e.detail)
@@ -116,6 +119,19 @@ def _do_login(email: str) -> None:
 
     is_multi_org: bool = request_result.get("is_multi_org", False)
     organizations: list[dict[str, Any]] = request_result.get("organizations", [])
+    return is_multi_org, organizations
+
+
+def _do_login(email: str, org_uuid: Optional[str] = None) -> None:
+    """Shared login logic for 'dailybot login' and interactive mode.
+
+    If *org_uuid* (or the DAILYBOT_ORG env var) names one of the user's
+    organizations, it is used instead of prompting.
+    """
+    client: DailyBotClient = DailyBotClient()
+
+    # Step 1: Request OTP code
+    is_multi_org, organizations = _request_code(client, email)
 
     # Print org list for reference if multi-org
     if is_multi_org and len(organizations) > 1:
@@ -128,8 +144,12 @@ def _do_login(email: str) -> None:
     # Step 3: If multi-org, prompt for org selection before verifying
     organization_id: Optional[int] = None
     if is_multi_org and len(organizations) > 1:
-        selected_org: dict[str, Any] = _prompt_org_selection(organizations)
-        organization_id = selected_org["id"]
+        preferred_uuid: Optional[str] = org_uuid or os.environ.get("DAILYBOT_ORG")
+        if preferred_uuid:
+            organization_id = _resolve_org_uuid(organizations, preferred_uuid)
+        if organization_id is None:
+            selected_org: dict[str, Any] = _prompt_org_selection(organizations)
+            organization_id = selected_org["id"]
     elif len(organizations) == 1:
         organization_id = organizations[0].get("id")
 
@@ -140,19 +160,7 @@ def _do_login(email: str) -> None:
 def _request_code_non_interactive(email: str) -> None:
     """Non-interactive step 1: request OTP and print next-step instructions."""
     client: DailyBotClient = DailyBotClient()
-
-    try:
-        with console.status("Sending verification code..."):
-            request_result: dict[str, Any] = client.request_code(email)
-    except APIError as e:
-        print_error(e.detail)
-        raise SystemExit(1)
-
-    print_success(f"Verification code sent to {email}")
-    print_info("Check your inbox (including spam folder).")
-
-    is_multi_org: bool = request_result.get("is_multi_org", False)
-    organizations: list[dict[str, Any]] = request_result.get("organizations", [])
+    is_multi_org, organizations = _request_code(client, email)
 
     if is_multi_org and len(organizations) > 1:
         save_org_cache(email, organizations)
@@ -213,6 +221,8 @@ def login(ctx: click.Context, email: str, code: Optional[str], org_uuid: Optiona
         dailybot login --email=user@example.com --code=123456
       Multi-org: pass --org with the UUID shown in step 1
         dailybot login --email=user@example.com --code=123456 --org=abc-123
+
+    In the interactive flow, --org or DAILYBOT_ORG skips the org prompt.
     """
     email_from_flag: bool = (
         ctx.get_parameter_source("email") == click.core.ParameterSource.COMMANDLINE
@@ -226,7 +236,7 @@ def login(ctx: click.Context, email: str, code: Optional[str], org_uuid: Optiona
         _request_code_non_interactive(email)
     else:
         # Fully interactive (email was prompted)
-        _do_login(email)
+        _do_login(email, org_uuid)
 
 
 @click.command()
@@ -239,7 +249,7 @@ def logout() -> None:
 
     client: DailyBotClient = DailyBotClient()
     try:
-        with console.status("Logging out..."):
+        with spinner("Logging out..."):
             client.logout()
     except APIError:
         pass  # Revoke best-effort; clear local credentials regardless
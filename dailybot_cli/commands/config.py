@@ -13,10 +13,8 @@ KNOWN_SETTINGS: dict[str, str] = {
 
 
 def _mask(value: str) -> str:
-    """Mask all but the first 4 characters."""
-    if len(value) <= 4:
-        return value[0] + "****" if value else "****"
-    return value[:4] + "****"
+    """Mask all but the first 4 characters (only the first if the value is that short)."""
+    return value[: 4 if len(value) > 4 else 1] + "****"
 
 
 @click.command(name="config")
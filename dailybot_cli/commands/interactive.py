@@ -1,22 +1,28 @@
 """Interactive mode for Dailybot CLI."""
 
-import readline  # noqa: F401 — enables arrow-key editing in input()
-from typing import Any, Optional
+import os
+import sys
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, TypeVar
 
 import click
-import httpx
-import questionary
 
 from dailybot_cli.api_client import APIError, DailyBotClient
 from dailybot_cli.commands.auth import _do_login
 from dailybot_cli.config import get_token, load_credentials
 from dailybot_cli.display import (
     console,
+    enable_line_editing,
+    org_name_of,
+    org_uuid_of,
     print_error,
     print_info,
     print_pending_checkins,
     print_success,
     print_update_result,
+    spinner,
+    user_email_of,
 )
 
 
@@ -32,9 +38,68 @@ MENU_CHOICES: list[str] = [
     MENU_QUIT,
 ]
 
+# The session client is shared by the menu and the prefetch thread; calls
+# on it take turns so neither sees the other's request half-done.
+_client_lock: threading.Lock = threading.Lock()
+
+_T = TypeVar("_T")
+
+
+def _prefetch(fetch: Callable[[], _T]) -> Future[_T]:
+    """Run *fetch* on a daemon thread and return a future for its result.
+
+    A daemon thread, unlike a ThreadPoolExecutor worker, never keeps the
+    process alive after Quit while a request is still in flight.
+    """
+    future: Future[_T] = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            with _client_lock:
+                result: _T = fetch()
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _use_rich_menu() -> bool:
+    """Whether to show the arrow-key picker instead of a numbered menu."""
+    return sys.stdout.isatty() and not os.environ.get("DAILYBOT_NO_TUI")
+
+
+def _ask_menu_choice() -> Optional[str]:
+    """Ask for the next menu action. Returns None if the user bails out."""
+    if _use_rich_menu():
+        # questionary pulls in prompt_toolkit; only load it for real terminals.
+        import questionary
+
+        return questionary.select(  # type: ignore[no-any-return]
+            "What would you like to do?",
+            choices=MENU_CHOICES,
+        ).ask()
+
+    for number, label in enumerate(MENU_CHOICES, start=1):
+        console.print(f"  {number}. {label}")
+    try:
+        index: int = click.prompt(
+            "What would you like to do?",
+            type=click.IntRange(1, len(MENU_CHOICES)),
+        )
+    except click.Abort:
+        return None
+    return MENU_CHOICES[index - 1]
+
 
 def run_interactive() -> None:
     """Run the interactive TUI mode."""
+    enable_line_editing()
+
     creds: Optional[dict[str, Any]] = load_credentials()
     token: Optional[str] = get_token()
 
@@ -50,31 +115,46 @@ def run_interactive() -> None:
     else:
         email: str = creds.get("email", "") if creds else ""
         org_stored: Any = creds.get("organization", "") if creds else ""
-        org: str = org_stored.get("name", "") if isinstance(org_stored, dict) else str(org_stored)
+        org: str = org_name_of(org_stored)
         org_uuid: str = creds.get("organization_uuid", "") if creds else ""
         console.print(f"Logged in as {email} ({org})")
         if org_uuid:
             console.print(f"[dim]Org UUID: {org_uuid}[/dim]")
     console.print()
 
-    client: DailyBotClient = DailyBotClient()
-
-    while True:
-        console.print()
-        choice: Optional[str] = questionary.select(
-            "What would you like to do?",
-            choices=MENU_CHOICES,
-        ).ask()
+    # One pooled client for the whole session, so every menu action reuses
+    # the same keep-alive connection. The user is about to pick from the
+    # menu, so resolve the host meanwhile.
+    client: DailyBotClient = DailyBotClient(warm=True)
 
-        if choice is None or choice == MENU_QUIT:
-            print_info("Goodbye!")
-            break
-        elif choice == MENU_SEND_UPDATE:
-            _send_update(client)
-        elif choice == MENU_VIEW_PENDING:
-            _view_pending(client)
-        elif choice == MENU_AUTH_STATUS:
-            _show_auth(client)
+    # Fetch pending check-ins in the background while the user is at the
+    # menu, so "View pending check-ins" usually shows without a round trip.
+    pending: Optional[Future[dict[str, Any]]] = None
+    try:
+        while True:
+            if pending is None:
+                pending = _prefetch(client.get_status)
+            console.print()
+            choice: Optional[str] = _ask_menu_choice()
+
+            if choice is None or choice == MENU_QUIT:
+                print_info("Goodbye!")
+                break
+            elif choice == MENU_SEND_UPDATE:
+                _send_update(client)
+                # The update may have answered a check-in; refetch.
+                pending = None
+            elif choice == MENU_VIEW_PENDING:
+                _view_pending(pending)
+                pending = None
+            elif choice == MENU_AUTH_STATUS:
+                _show_auth(client)
+    finally:
+        if pending is None or pending.done():
+            client.close()
+        else:
+            # Don't wait out an in-flight prefetch; close once it settles.
+            pending.add_done_callback(lambda _future: client.close())
 
 
 def _send_update(client: DailyBotClient) -> None:
@@ -95,8 +175,10 @@ def _send_update(client: DailyBotClient) -> None:
         print_error("Empty update. Nothing sent.")
         return
 
+    import httpx
+
     try:
-        with console.status("Submitting update..."):
+        with spinner("Submitting update..."), _client_lock:
             result: dict[str, Any] = client.submit_update(message=message)
         print_update_result(result)
     except httpx.TimeoutException:
@@ -108,13 +190,19 @@ def _send_update(client: DailyBotClient) -> None:
         print_error(e.detail)
 
 
-def _view_pending(client: DailyBotClient) -> None:
-    """Fetch and display pending check-ins."""
+def _view_pending(pending: Future[dict[str, Any]]) -> None:
+    """Display pending check-ins, waiting for the prefetch if still in flight."""
+    import httpx
+
     try:
-        with console.status("Fetching..."):
-            data: dict[str, Any] = client.get_status()
+        with spinner("Fetching..."):
+            data: dict[str, Any] = pending.result()
         checkins: list[dict[str, Any]] = data.get("pending_checkins", [])
         print_pending_checkins(checkins)
+    except httpx.TimeoutException:
+        print_error("The request timed out. Please try again.")
+    except (httpx.TransportError, OSError) as e:
+        print_error(f"Could not reach Dailybot: {e}")
     except APIError as e:
         print_error(e.detail)
 
@@ -122,12 +210,12 @@ def _view_pending(client: DailyBotClient) -> None:
 def _show_auth(client: DailyBotClient) -> None:
     """Show current auth status."""
     try:
-        data: dict[str, Any] = client.auth_status()
-        user_raw: Any = data.get("user", "")
-        email: str = user_raw.get("email", "") if isinstance(user_raw, dict) else str(user_raw or data.get("email", ""))
+        with _client_lock:
+            data: dict[str, Any] = client.auth_status()
+        email: str = user_email_of(data)
         org_raw: Any = data.get("organization", "")
-        org_name: str = org_raw.get("name", "") if isinstance(org_raw, dict) else str(org_raw)
-        org_uuid: str = org_raw.get("uuid", "") if isinstance(org_raw, dict) else ""
+        org_name: str = org_name_of(org_raw)
+        org_uuid: str = org_uuid_of(org_raw)
         msg: str = f"Logged in as {email} ({org_name})"
         if org_uuid:
             msg += f" | Org UUID: {org_uuid}"
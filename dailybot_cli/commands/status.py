@@ -7,12 +7,12 @@ import click
 from dailybot_cli.api_client import APIError, DailyBotClient
 from dailybot_cli.config import get_api_key, get_token
 from dailybot_cli.display import (
-    console,
     print_auth_status,
     print_error,
     print_info,
     print_pending_checkins,
     print_success,
+    spinner,
 )
 
 
@@ -24,7 +24,7 @@ def _check_auth() -> None:
     token: Optional[str] = get_token()
     if token:
         try:
-            with console.status("Checking login session..."):
+            with spinner("Checking login session..."):
                 data: dict[str, Any] = client.auth_status()
             print_success("Authenticated via login (OTP)")
             print_auth_status(data)
@@ -36,7 +36,7 @@ def _check_auth() -> None:
     api_key: Optional[str] = get_api_key()
     if api_key:
         try:
-            with console.status("Checking API key..."):
+            with spinner("Checking API key..."):
                 client.get_agent_health(agent_name="CLI")
             print_success("Authenticated via API key")
             masked: str = api_key[:4] + "****"
@@ -76,7 +76,7 @@ def status(auth: bool) -> None:
 
     client: DailyBotClient = DailyBotClient()
     try:
-        with console.status("Fetching pending check-ins..."):
+        with spinner("Fetching pending check-ins..."):
             data: dict[str, Any] = client.get_status()
         checkins: list[dict[str, Any]] = data.get("pending_checkins", [])
         print_pending_checkins(checkins)
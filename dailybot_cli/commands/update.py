@@ -1,13 +1,19 @@
 """Update command for Dailybot CLI."""
 
+import sys
 from typing import Any, Optional
 
 import click
-import httpx
 
 from dailybot_cli.api_client import APIError, DailyBotClient
 from dailybot_cli.config import get_token
-from dailybot_cli.display import console, print_error, print_info, print_update_result
+from dailybot_cli.display import (
+    enable_line_editing,
+    print_error,
+    print_info,
+    print_update_result,
+    spinner,
+)
 
 
 def _require_auth() -> DailyBotClient:
@@ -19,6 +25,28 @@ def _require_auth() -> DailyBotClient:
     return DailyBotClient()
 
 
+def _prompt_message() -> str:
+    """Read a multi-line update from the terminal, ending on an empty line."""
+    enable_line_editing()
+    print_info("Enter your update (press Enter twice to submit):")
+    lines: list[str] = []
+    empty_count: int = 0
+    while True:
+        try:
+            line: str = input()
+        except EOFError:
+            break
+        if line == "":
+            empty_count += 1
+            if empty_count >= 1 and lines:
+                break
+            lines.append("")
+        else:
+            empty_count = 0
+            lines.append(line)
+    return "\n".join(lines).strip()
+
+
 @click.command()
 @click.argument("message", required=False)
 @click.option("--done", "-d", help="What you completed.")
@@ -40,31 +68,21 @@ def update(
     """
     client: DailyBotClient = _require_auth()
 
-    # If no args at all, prompt for input
+    # If no args at all, read the update from stdin
     if not message and not done and not doing and not blocked:
-        print_info("Enter your update (press Enter twice to submit):")
-        lines: list[str] = []
-        empty_count: int = 0
-        while True:
-            try:
-                line: str = input()
-            except EOFError:
-                break
-            if line == "":
-                empty_count += 1
-                if empty_count >= 1 and lines:
-                    break
-                lines.append("")
-            else:
-                empty_count = 0
-                lines.append(line)
-        message = "\n".join(lines).strip()
+        if sys.stdin.isatty():
+            message = _prompt_message()
+        else:
+            # Piped input (e.g. `cat notes.md | dailybot update`): take it all.
+            message = sys.stdin.read().strip()
         if not message:
             print_error("Empty update. Nothing sent.")
             raise SystemExit(1)
 
+    import httpx
+
     try:
-        with console.status("Submitting update..."):
+        with spinner("Submitting update..."):
             result: dict[str, Any] = client.submit_update(
                 message=message,
                 done=done,
@@ -1,10 +1,12 @@
 """Credential and configuration management for Dailybot CLI."""
 
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+from dailybot_cli.json_compat import JSONDecodeError, dumps, loads
+
 
 DEFAULT_API_URL: str = "https://api.dailybot.com"
 _api_url_override: Optional[str] = None
@@ -14,30 +16,80 @@ def set_api_url_override(url: str) -> None:
     """Set a CLI-level API URL override (from --api-url flag)."""
     global _api_url_override
     _api_url_override = url.rstrip("/")
+    invalidate_config_cache()
+
+
 CONFIG_DIR: Path = Path.home() / ".config" / "dailybot"
 CREDENTIALS_FILE: Path = CONFIG_DIR / "credentials.json"
 CONFIG_FILE: Path = CONFIG_DIR / "config.json"
 ORG_CACHE_FILE: Path = CONFIG_DIR / "org_cache.json"
 AGENTS_FILE: Path = CONFIG_DIR / "agents.json"
+ETAG_CACHE_FILE: Path = CONFIG_DIR / "etag_cache.json"
+
+
+def invalidate_config_cache() -> None:
+    """Drop memoized credentials/config reads and the getters built on them.
+
+    Called automatically whenever credentials or config are written.
+    """
+    _read_credentials.cache_clear()
+    _read_config.cache_clear()
+    get_api_url.cache_clear()
+    get_token.cache_clear()
+    get_api_key.cache_clear()
+
+
+_ensured_config_dir: Optional[Path] = None
 
 
 def get_config_dir() -> Path:
-    """Return the config directory, creating it if needed."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    """Return the config directory, creating it on first use in this process."""
+    global _ensured_config_dir
+    if _ensured_config_dir != CONFIG_DIR:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        _ensured_config_dir = CONFIG_DIR
     return CONFIG_DIR
 
 
-def load_credentials() -> Optional[dict[str, Any]]:
-    """Load stored credentials from disk."""
-    if not CREDENTIALS_FILE.exists():
-        return None
+@lru_cache(maxsize=1)
+def _read_credentials() -> Optional[dict[str, Any]]:
+    """Parse credentials.json once per invocation (see invalidate_config_cache)."""
     try:
-        data: dict[str, Any] = json.loads(CREDENTIALS_FILE.read_text())
+        data: dict[str, Any] = loads(CREDENTIALS_FILE.read_bytes())
         return data if data.get("token") else None
-    except (json.JSONDecodeError, KeyError):
+    except (FileNotFoundError, JSONDecodeError, KeyError):
         return None
 
 
+def _write_private(path: Path, data: Any) -> None:
+    """Atomically write *data* as JSON to *path*, readable by the owner only.
+
+    Every write gets its own 0600 temp file from mkstemp, so concurrent
+    writers never share an inode and there is no window where the contents
+    are world-readable; os.replace then swaps it in.
+    """
+    import tempfile
+
+    get_config_dir()
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(dumps(data))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load_credentials() -> Optional[dict[str, Any]]:
+    """Load stored credentials from disk."""
+    data: Optional[dict[str, Any]] = _read_credentials()
+    # Hand out a copy so callers can't mutate the memoized dict.
+    return dict(data) if data is not None else None
+
+
 def save_credentials(
     token: str,
     email: str,
@@ -46,29 +98,27 @@ def save_credentials(
     api_url: str = DEFAULT_API_URL,
 ) -> None:
     """Save credentials to disk."""
-    get_config_dir()
-    CREDENTIALS_FILE.write_text(
-        json.dumps(
-            {
-                "token": token,
-                "email": email,
-                "organization": organization,
-                "organization_uuid": organization_uuid,
-                "api_url": api_url,
-            },
-            indent=2,
-        )
+    _write_private(
+        CREDENTIALS_FILE,
+        {
+            "token": token,
+            "email": email,
+            "organization": organization,
+            "organization_uuid": organization_uuid,
+            "api_url": api_url,
+        },
     )
-    # Restrict file permissions (owner read/write only)
-    os.chmod(CREDENTIALS_FILE, 0o600)
+    invalidate_config_cache()
 
 
 def clear_credentials() -> None:
-    """Remove stored credentials."""
-    if CREDENTIALS_FILE.exists():
-        CREDENTIALS_FILE.unlink()
+    """Remove stored credentials and any responses cached for them."""
+    CREDENTIALS_FILE.unlink(missing_ok=True)
+    clear_etag_cache()
+    invalidate_config_cache()
 
 
+@lru_cache(maxsize=1)
 def get_api_url() -> str:
     """Return the API URL (--api-url flag > env var > credentials > default)."""
     if _api_url_override:
@@ -82,6 +132,7 @@ def get_api_url() -> str:
     return DEFAULT_API_URL
 
 
+@lru_cache(maxsize=1)
 def get_token() -> Optional[str]:
     """Return the stored auth token, or the DAILYBOT_CLI_TOKEN env var."""
     env_token: Optional[str] = os.environ.get("DAILYBOT_CLI_TOKEN")
@@ -93,16 +144,20 @@ def get_token() -> Optional[str]:
     return None
 
 
-def load_config() -> dict[str, Any]:
-    """Read config.json, return {} if missing."""
-    if not CONFIG_FILE.exists():
-        return {}
+@lru_cache(maxsize=1)
+def _read_config() -> dict[str, Any]:
+    """Parse config.json once per invocation (see invalidate_config_cache)."""
     try:
-        return json.loads(CONFIG_FILE.read_text())
-    except (json.JSONDecodeError, KeyError):
+        return loads(CONFIG_FILE.read_bytes())
+    except (FileNotFoundError, JSONDecodeError, KeyError):
         return {}
 
 
+def load_config() -> dict[str, Any]:
+    """Read config.json, return {} if missing."""
+    return dict(_read_config())
+
+
 def save_config(data: dict[str, Any]) -> None:
     """Merge *data* into existing config. Keys set to None are removed."""
     existing: dict[str, Any] = load_config()
@@ -111,11 +166,11 @@ def save_config(data: dict[str, Any]) -> None:
             existing.pop(key, None)
         else:
             existing[key] = value
-    get_config_dir()
-    CONFIG_FILE.write_text(json.dumps(existing, indent=2))
-    os.chmod(CONFIG_FILE, 0o600)
+    _write_private(CONFIG_FILE, existing)
+    invalidate_config_cache()
 
 
+@lru_cache(maxsize=1)
 def get_api_key() -> Optional[str]:
     """Return the org API key (env var > stored config > None)."""
     env_key: Optional[str] = os.environ.get("DAILYBOT_API_KEY")
@@ -129,16 +184,14 @@ def save_org_cache(email: str, organizations: list[dict[str, Any]]) -> None:
     """Cache the org list from request_code for UUID resolution in step 2."""
     get_config_dir()
     data: dict[str, Any] = {"email": email, "organizations": organizations}
-    ORG_CACHE_FILE.write_text(json.dumps(data))
+    ORG_CACHE_FILE.write_bytes(dumps(data))
 
 
 def load_org_cache(email: str) -> Optional[list[dict[str, Any]]]:
     """Load cached org list for the given email. Returns None if missing or stale."""
-    if not ORG_CACHE_FILE.exists():
-        return None
     try:
-        data: dict[str, Any] = json.loads(ORG_CACHE_FILE.read_text())
-    except (json.JSONDecodeError, OSError):
+        data: dict[str, Any] = loads(ORG_CACHE_FILE.read_bytes())
+    except (JSONDecodeError, OSError):
         return None
     if data.get("email") != email:
         return None
@@ -147,8 +200,25 @@ def load_org_cache(email: str) -> Optional[list[dict[str, Any]]]:
 
 def clear_org_cache() -> None:
     """Remove the org cache file."""
-    if ORG_CACHE_FILE.exists():
-        ORG_CACHE_FILE.unlink()
+    ORG_CACHE_FILE.unlink(missing_ok=True)
+
+
+def load_etag_cache() -> dict[str, Any]:
+    """Read cached conditional-GET responses, return {} if missing."""
+    try:
+        return loads(ETAG_CACHE_FILE.read_bytes())
+    except (JSONDecodeError, OSError):
+        return {}
+
+
+def save_etag_cache(data: dict[str, Any]) -> None:
+    """Write cached conditional-GET responses with restricted permissions."""
+    _write_private(ETAG_CACHE_FILE, data)
+
+
+def clear_etag_cache() -> None:
+    """Remove the conditional-GET cache file."""
+    ETAG_CACHE_FILE.unlink(missing_ok=True)
 
 
 def get_agent_auth() -> Optional[str]:
@@ -178,19 +248,15 @@ def _slugify(name: str) -> str:
 
 def load_agents() -> dict[str, Any]:
     """Read agents.json, return {} if missing."""
-    if not AGENTS_FILE.exists():
-        return {}
     try:
-        return json.loads(AGENTS_FILE.read_text())
-    except (json.JSONDecodeError, OSError):
+        return loads(AGENTS_FILE.read_bytes())
+    except (JSONDecodeError, OSError):
         return {}
 
 
 def _save_agents(data: dict[str, Any]) -> None:
     """Write agents.json with restricted permissions."""
-    get_config_dir()
-    AGENTS_FILE.write_text(json.dumps(data, indent=2))
-    os.chmod(AGENTS_FILE, 0o600)
+    _write_private(AGENTS_FILE, data)
 
 
 def save_agent_profile(
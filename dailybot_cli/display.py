@@ -1,34 +1,86 @@
 """Rich console output helpers for Dailybot CLI."""
 
-from typing import Any
+from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache
+from typing import Any, Optional, Union
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+# rich.table and rich.panel are imported inside the functions that draw
+# them: most commands only ever print one-line status messages.
+from rich.console import Console, Group, RenderableType
 from rich.text import Text
 
 console: Console = Console()
 error_console: Console = Console(stderr=True)
 
 
+def spinner(message: str) -> AbstractContextManager[Any]:
+    """Show a status spinner while the block runs, but only on a terminal.
+
+    When output is piped (CI, editor plugins) the spinner would never be
+    seen, so skip starting Rich's refresh thread altogether.
+    """
+    if console.is_terminal:
+        return console.status(message)
+    return nullcontext()
+
+
+def enable_line_editing() -> None:
+    """Give input() arrow-key editing and history where readline exists.
+
+    Loaded on demand by the prompts that read from a terminal; some
+    platforms (e.g. Windows) ship without the module.
+    """
+    try:
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+
+
+# Built once: console.print() renders these as-is, so the constant prefixes
+# skip the markup parser on every message.
+_OK_PREFIX: Text = Text("OK", style="bold green")
+_ERROR_PREFIX: Text = Text("Error:", style="bold red")
+_WARNING_PREFIX: Text = Text("Warning:", style="bold yellow")
+_YES: Text = Text.from_markup("[green]yes[/green]")
+_NO: Text = Text.from_markup("[yellow]no[/yellow]")
+
+
+def _print_message(target: Console, prefix: Optional[Text], message: str) -> None:
+    """Print a one-line status message, bypassing Rich when output is piped.
+
+    Off a terminal there is no styling to apply, so the message skips
+    segment rendering and is written unwrapped; markup is still resolved
+    (only when the message could contain any) so the text matches what a
+    terminal shows.
+    """
+    if not target.is_terminal:
+        plain: str = Text.from_markup(message).plain if "[" in message else message
+        target.file.write(f"{prefix.plain} {plain}\n" if prefix else f"{plain}\n")
+        return
+    if prefix:
+        target.print(prefix, message)
+    else:
+        target.print(message, style="dim")
+
+
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[bold green]OK[/bold green] {message}")
+    _print_message(console, _OK_PREFIX, message)
 
 
 def print_error(message: str) -> None:
     """Print an error message to stderr."""
-    error_console.print(f"[bold red]Error:[/bold red] {message}")
+    _print_message(error_console, _ERROR_PREFIX, message)
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    console.print(f"[bold yellow]Warning:[/bold yellow] {message}")
+    _print_message(console, _WARNING_PREFIX, message)
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    console.print(f"[dim]{message}[/dim]")
+    _print_message(console, None, message)
 
 
 def _format_sender(msg: dict[str, Any]) -> str:
@@ -36,8 +88,12 @@ def _format_sender(msg: dict[str, Any]) -> str:
 
     Brackets are escaped for Rich markup (\\[ renders as literal [).
     """
-    sender_type: str = msg.get("sender_type", "")
-    sender_name: str = msg.get("sender_name") or ""
+    return _sender_prefix(msg.get("sender_type", ""), msg.get("sender_name") or "")
+
+
+@lru_cache(maxsize=256)
+def _sender_prefix(sender_type: str, sender_name: str) -> str:
+    """Cached body of _format_sender; a message list has only a few senders."""
     if sender_name:
         return f"\\[{sender_type}] {sender_name}:"
     if sender_type:
@@ -45,13 +101,33 @@ def _format_sender(msg: dict[str, Any]) -> str:
     return ""
 
 
+def org_name_of(org: Any) -> str:
+    """Return an organization's name; the API sends either a dict or a bare name."""
+    return org.get("name", "") if isinstance(org, dict) else str(org)
+
+
+def org_uuid_of(org: Any, fallback: str = "") -> str:
+    """Return an organization's UUID, or *fallback* when *org* is a bare name."""
+    return org.get("uuid", "") if isinstance(org, dict) else fallback
+
+
+def user_email_of(data: dict[str, Any]) -> str:
+    """Return the user email from an auth response (nested ``user`` or top-level)."""
+    user_raw: Any = data.get("user", "")
+    if isinstance(user_raw, dict):
+        return user_raw.get("email", "")  # type: ignore[no-any-return]
+    return str(user_raw or data.get("email", ""))
+
+
 def print_auth_status(data: dict[str, Any]) -> None:
     """Display auth status information."""
-    user_raw: Any = data.get("user", "")
-    email: str = user_raw.get("email", "") if isinstance(user_raw, dict) else str(user_raw or data.get("email", ""))
+    from rich.panel import Panel
+    from rich.table import Table
+
+    email: str = user_email_of(data)
     org_raw: Any = data.get("organization", "")
-    org_name: str = org_raw.get("name", "") if isinstance(org_raw, dict) else str(org_raw)
-    org_uuid: str = org_raw.get("uuid", "") if isinstance(org_raw, dict) else ""
+    org_name: str = org_name_of(org_raw)
+    org_uuid: str = org_uuid_of(org_raw)
     table: Table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column(style="bold")
     table.add_column()
@@ -64,10 +140,13 @@ def print_auth_status(data: dict[str, Any]) -> None:
 
 def print_pending_checkins(checkins: list[dict[str, Any]]) -> None:
     """Display pending check-ins."""
+    from rich.panel import Panel
+
     if not checkins:
         print_info("No pending check-ins for today.")
         return
 
+    panels: list[Panel] = []
     for checkin in checkins:
         name: str = checkin.get("followup_name", "Check-in")
         questions: list[dict[str, Any]] = checkin.get("template_questions", [])
@@ -79,17 +158,22 @@ def print_pending_checkins(checkins: list[dict[str, Any]]) -> None:
             if q.get("is_blocker"):
                 content.append(" [blocker]", style="bold red")
             content.append("\n")
-        console.print(
+        panels.append(
             Panel(
                 content,
                 title=f"[bold]{name}[/bold]",
                 border_style="cyan",
             )
         )
+    # One print (one lock, one width probe, one write) for all panels.
+    console.print(Group(*panels))
 
 
 def print_agent_health(data: dict[str, Any]) -> None:
     """Display agent health status."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     agent_name: str = data.get("agent_name", "Unknown")
     status: str = data.get("status", "unknown")
     last_check: str = data.get("last_check", "N/A")
@@ -103,7 +187,9 @@ def print_agent_health(data: dict[str, Any]) -> None:
     table.add_row("Agent", agent_name)
     table.add_row("Status", status_display)
     table.add_row("Last Check", last_check)
-    console.print(Panel(table, title="[bold]Agent Health[/bold]", border_style=style))
+    renderables: list[RenderableType] = [
+        Panel(table, title="[bold]Agent Health[/bold]", border_style=style)
+    ]
 
     history: list[dict[str, Any]] = data.get("history", [])
     if history:
@@ -119,28 +205,39 @@ def print_agent_health(data: dict[str, Any]) -> None:
                 Text(entry_status, style=entry_style),
                 entry.get("message", ""),
             )
-        console.print(hist_table)
+        renderables.append(hist_table)
 
     pending: list[dict[str, Any]] = data.get("pending_messages", [])
-    print_pending_agent_messages(pending)
+    renderables.extend(_pending_agent_message_lines(pending))
+    console.print(Group(*renderables))
 
 
-def print_pending_agent_messages(messages: list[dict[str, Any]]) -> None:
-    """Display pending messages with IDs for agent consumption."""
+def _pending_agent_message_lines(messages: list[dict[str, Any]]) -> list[str]:
+    """Build the markup lines for pending messages (empty if there are none)."""
     if not messages:
-        return
-    console.print(f"\n--- Pending messages from Dailybot ({len(messages)}) ---")
+        return []
+    lines: list[str] = [f"\n--- Pending messages from Dailybot ({len(messages)}) ---"]
     for msg in messages:
         msg_id: str = msg.get("id", "?")
         sender: str = _format_sender(msg)
         content: str = msg.get("content", "")
-        line: str = f"\\[id:{msg_id}] {sender} {content}" if sender else f"\\[id:{msg_id}] {content}"
-        console.print(line)
-    console.print("[dim]Claim: dailybot agent message claim <id>[/dim]")
+        lines.append(f"\\[id:{msg_id}] {sender} {content}" if sender else f"\\[id:{msg_id}] {content}")
+    lines.append("[dim]Claim: dailybot agent message claim <id>[/dim]")
+    return lines
+
+
+def print_pending_agent_messages(messages: list[dict[str, Any]]) -> None:
+    """Display pending messages with IDs for agent consumption."""
+    lines: list[str] = _pending_agent_message_lines(messages)
+    if lines:
+        console.print(Group(*lines))
 
 
 def print_webhook_result(data: dict[str, Any]) -> None:
     """Display webhook registration result."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     table: Table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column(style="bold")
     table.add_column()
@@ -151,6 +248,8 @@ def print_webhook_result(data: dict[str, Any]) -> None:
 
 def print_agent_messages(messages: list[dict[str, Any]]) -> None:
     """Display a list of agent messages."""
+    from rich.table import Table
+
     if not messages:
         print_info("No messages found.")
         return
@@ -162,7 +261,6 @@ def print_agent_messages(messages: list[dict[str, Any]]) -> None:
     table.add_column("Created", style="dim")
     for msg in messages:
         delivered: bool = msg.get("delivered", False)
-        delivered_text: str = "[green]yes[/green]" if delivered else "[yellow]no[/yellow]"
         sender_type: str = msg.get("sender_type", "")
         sender_name: str = msg.get("sender_name") or ""
         sender_display: str = f"{sender_name} ({sender_type})" if sender_name else sender_type
@@ -170,7 +268,7 @@ def print_agent_messages(messages: list[dict[str, Any]]) -> None:
             msg.get("message_type", "text"),
             sender_display,
             msg.get("content", ""),
-            delivered_text,
+            _YES if delivered else _NO,
             msg.get("created_at", ""),
         )
     console.print(table)
@@ -178,6 +276,9 @@ def print_agent_messages(messages: list[dict[str, Any]]) -> None:
 
 def print_agent_message_sent(data: dict[str, Any]) -> None:
     """Display the result of sending an agent message."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     table: Table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column(style="bold")
     table.add_column()
@@ -191,6 +292,9 @@ def print_agent_message_sent(data: dict[str, Any]) -> None:
 
 def print_agent_email_sent(data: dict[str, Any]) -> None:
     """Display the result of sending an agent email."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     table: Table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column(style="bold")
     table.add_column()
@@ -203,6 +307,8 @@ def print_agent_email_sent(data: dict[str, Any]) -> None:
 
 def print_agent_profiles(profiles: list[dict[str, Any]]) -> None:
     """Display agent profiles in a table."""
+    from rich.table import Table
+
     if not profiles:
         print_info("No agent profiles configured. Run: dailybot agent configure --name \"My Agent\"")
         return
@@ -216,13 +322,16 @@ def print_agent_profiles(profiles: list[dict[str, Any]]) -> None:
         auth: str = "login token"
         if p.get("has_key"):
             auth = p.get("masked_key", "****")
-        default: str = "[green]yes[/green]" if p.get("is_default") else ""
+        default: Union[Text, str] = _YES if p.get("is_default") else ""
         table.add_row(p["profile"], p["agent_name"], p.get("agent_email", ""), auth, default)
     console.print(table)
 
 
 def print_registration_result(data: dict[str, Any]) -> None:
     """Display agent registration result."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     table: Table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column(style="bold")
     table.add_column(no_wrap=True, overflow="fold")
@@ -0,0 +1,29 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+from json import JSONDecodeError
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["JSONDecodeError", "dumps", "loads"]
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize *obj* to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    import json
+
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: "bytes | str") -> Any:
+    """Parse JSON from bytes or str. Raises JSONDecodeError on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+
+    return json.loads(data)
@@ -1,20 +1,50 @@
 """Dailybot CLI entry point."""
 
+import importlib
+
 import click
 
-from typing import Optional
+from typing import Any, Optional
 
 from dailybot_cli import __version__
-from dailybot_cli.commands.agent import agent
-from dailybot_cli.commands.auth import login, logout
-from dailybot_cli.commands.config import config
-from dailybot_cli.commands.interactive import run_interactive
-from dailybot_cli.commands.status import status
-from dailybot_cli.commands.update import update
-from dailybot_cli.config import set_api_url_override
 
 
-@click.group(invoke_without_command=True)
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is used.
+
+    Every invocation is a fresh process, so ``dailybot status`` should not
+    pay for importing the agent commands (and vice versa).
+    """
+
+    def __init__(self, *args: Any, lazy_subcommands: Optional[dict[str, str]] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # command name -> "module:attribute"
+        self.lazy_subcommands: dict[str, str] = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        target: Optional[str] = self.lazy_subcommands.get(cmd_name)
+        if target is None:
+            return super().get_command(ctx, cmd_name)
+        module_name, attr = target.split(":")
+        command: click.Command = getattr(importlib.import_module(module_name), attr)
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    invoke_without_command=True,
+    lazy_subcommands={
+        "login": "dailybot_cli.commands.auth:login",
+        "logout": "dailybot_cli.commands.auth:logout",
+        "update": "dailybot_cli.commands.update:update",
+        "status": "dailybot_cli.commands.status:status",
+        "agent": "dailybot_cli.commands.agent:agent",
+        "config": "dailybot_cli.commands.config:config",
+    },
+)
 @click.version_option(version=__version__, prog_name="dailybot")
 @click.option("--api-url", default=None, envvar="DAILYBOT_API_URL", help="Override the API base URL (e.g. staging).")
 @click.pass_context
@@ -42,17 +72,13 @@ def cli(ctx: click.Context, api_url: Optional[str]) -> None:
     Run without arguments for interactive mode.
     """
     if api_url:
+        from dailybot_cli.config import set_api_url_override
+
         set_api_url_override(api_url)
     if ctx.invoked_subcommand is None:
-        run_interactive()
-
+        from dailybot_cli.commands.interactive import run_interactive
 
-cli.add_command(login)
-cli.add_command(logout)
-cli.add_command(update)
-cli.add_command(status)
-cli.add_command(agent)
-cli.add_command(config)
+        run_interactive()
 
 
 if __name__ == "__main__":
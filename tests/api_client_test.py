@@ -1,7 +1,9 @@
 """Tests for the API client module."""
 
-from typing import Any
-from unittest.mock import MagicMock, patch
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import httpx
 import pytest
@@ -9,6 +11,44 @@ import pytest
 from dailybot_cli.api_client import APIError, DailyBotClient
 
 
+@pytest.fixture(autouse=True)
+def tmp_etag_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the conditional-GET cache out of the real config directory."""
+    cache_file: Path = tmp_path / "etag_cache.json"
+    monkeypatch.setattr("dailybot_cli.config.CONFIG_DIR", tmp_path)
+    monkeypatch.setattr("dailybot_cli.config.ETAG_CACHE_FILE", cache_file)
+    return cache_file
+
+
+ResponseFactory = Callable[..., Mock]
+
+
+@pytest.fixture(scope="session")
+def make_response() -> ResponseFactory:
+    """Build stand-ins for httpx.Response.
+
+    A plain Mock with just the attributes the client reads is much cheaper
+    than MagicMock(spec=httpx.Response), which introspects the class.
+    """
+
+    def _make(
+        body: Any = None,
+        status_code: int = 200,
+        headers: Optional[dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> Mock:
+        response: Mock = Mock()
+        response.status_code = status_code
+        response.headers = httpx.Headers(headers or {})
+        if content is None:
+            content = json.dumps(body).encode() if body is not None else b""
+        response.content = content
+        response.text = content.decode(errors="replace")
+        return response
+
+    return _make
+
+
 @pytest.fixture
 def client() -> DailyBotClient:
     return DailyBotClient(
@@ -20,61 +60,100 @@ def client() -> DailyBotClient:
 
 class TestDailyBotClientAuth:
 
-    def test_request_code(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"detail": "Code sent"}
+    def test_request_code(self, client: DailyBotClient, make_response: ResponseFactory) -> None:
+        mock_response: Mock = make_response({"detail": "Code sent"})
 
-        with patch("httpx.post", return_value=mock_response) as mock_post:
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
             result: dict[str, Any] = client.request_code("user@example.com")
 
         mock_post.assert_called_once()
         call_kwargs: dict[str, Any] = mock_post.call_args[1]
-        assert call_kwargs["json"] == {"email": "user@example.com"}
+        assert json.loads(call_kwargs["content"]) == {"email": "user@example.com"}
+        # Unauthenticated: relies on the client's default headers only
+        assert "headers" not in call_kwargs
         assert result["detail"] == "Code sent"
 
-    def test_verify_code(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"token": "new-token", "organization": "Org"}
+    def test_verify_code(self, client: DailyBotClient, make_response: ResponseFactory) -> None:
+        mock_response: Mock = make_response({"token": "new-token", "organization": "Org"})
 
-        with patch("httpx.post", return_value=mock_response) as mock_post:
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
             result: dict[str, Any] = client.verify_code("user@example.com", "123456")
 
         call_kwargs: dict[str, Any] = mock_post.call_args[1]
-        assert call_kwargs["json"]["email"] == "user@example.com"
-        assert call_kwargs["json"]["code"] == "123456"
+        assert json.loads(call_kwargs["content"])["email"] == "user@example.com"
+        assert json.loads(call_kwargs["content"])["code"] == "123456"
         assert result["token"] == "new-token"
 
-    def test_verify_code_with_org_id(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"token": "new-token"}
+    def test_verify_code_with_org_id(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"token": "new-token"})
 
-        with patch("httpx.post", return_value=mock_response) as mock_post:
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
             client.verify_code("user@example.com", "123456", organization_id=42)
 
         call_kwargs: dict[str, Any] = mock_post.call_args[1]
-        assert call_kwargs["json"]["organization_id"] == 42
+        assert json.loads(call_kwargs["content"])["organization_id"] == 42
 
-    def test_auth_status(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"email": "user@example.com"}
+    def test_auth_status(self, client: DailyBotClient, make_response: ResponseFactory) -> None:
+        mock_response: Mock = make_response({"email": "user@example.com"})
 
-        with patch("httpx.get", return_value=mock_response) as mock_get:
+        with patch.object(client._client, "get", return_value=mock_response) as mock_get:
             result: dict[str, Any] = client.auth_status()
 
         call_kwargs: dict[str, Any] = mock_get.call_args[1]
         assert "Bearer test-token" in call_kwargs["headers"]["Authorization"]
         assert result["email"] == "user@example.com"
 
-    def test_logout(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"detail": "Logged out"}
-
-        with patch("httpx.post", return_value=mock_response):
+    def test_requests_use_pooled_client_with_relative_path(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"detail": "Code sent"})
+
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
+            client.request_code("user@example.com")
+
+        assert client._client.base_url == "http://test-api.example.com"
+        assert mock_post.call_args[0][0] == "/v1/cli/auth/request-code/"
+
+    def test_headers_built_once_per_client(self, client: DailyBotClient) -> None:
+        assert client._headers() is client._headers()
+        with pytest.raises(TypeError):
+            client._headers()["Authorization"] = "Bearer other"  # type: ignore[index]
+        assert client._headers()["Authorization"] == "Bearer test-token"
+        assert "Authorization" not in client._headers(authenticated=False)
+        assert client._client.headers["Accept"] == "application/json"
+
+    def test_client_negotiates_compressed_responses(self, client: DailyBotClient) -> None:
+        assert "gzip" in client._client.headers["Accept-Encoding"]
+
+    def test_client_has_no_instance_dict(self, client: DailyBotClient) -> None:
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unknown_attribute = 1  # type: ignore[attr-defined]
+
+    def test_warm_prefetches_dns(self) -> None:
+        with patch("dailybot_cli.api_client.threading.Thread") as mock_thread:
+            DailyBotClient(api_url="https://api.example.com", token="tok", warm=True)
+            DailyBotClient(api_url="https://api.example.com", token="tok")
+
+        mock_thread.assert_called_once()
+        assert mock_thread.call_args[1]["args"] == ("api.example.com", 443)
+        mock_thread.return_value.start.assert_called_once()
+
+    def test_context_manager_closes_pool(self) -> None:
+        with DailyBotClient(api_url="http://test.com", token="tok") as client:
+            assert not client._client.is_closed
+        assert client._client.is_closed
+
+    def test_logout(self, client: DailyBotClient, make_response: ResponseFactory) -> None:
+        mock_response: Mock = make_response({"detail": "Logged out"})
+
+        with patch.object(client._client, "post", return_value=mock_response):
             result: dict[str, Any] = client.logout()
 
         assert result["detail"] == "Logged out"
@@ -82,69 +161,153 @@ class TestDailyBotClientAuth:
 
 class TestDailyBotClientUpdates:
 
-    def test_submit_update_message(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"followups_count": 1}
+    def test_submit_update_message(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"followups_count": 1}, status_code=201)
 
-        with patch("httpx.post", return_value=mock_response) as mock_post:
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
             result: dict[str, Any] = client.submit_update(message="Did stuff")
 
         call_kwargs: dict[str, Any] = mock_post.call_args[1]
-        assert call_kwargs["json"] == {"message": "Did stuff"}
+        assert json.loads(call_kwargs["content"]) == {"message": "Did stuff"}
         assert result["followups_count"] == 1
 
-    def test_submit_update_structured(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"followups_count": 1}
+    def test_submit_update_structured(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"followups_count": 1}, status_code=201)
 
-        with patch("httpx.post", return_value=mock_response) as mock_post:
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
             result: dict[str, Any] = client.submit_update(
                 done="Auth", doing="Tests", blocked="None"
             )
 
         call_kwargs: dict[str, Any] = mock_post.call_args[1]
-        assert call_kwargs["json"]["done"] == "Auth"
-        assert call_kwargs["json"]["doing"] == "Tests"
-        assert call_kwargs["json"]["blocked"] == "None"
+        assert json.loads(call_kwargs["content"])["done"] == "Auth"
+        assert json.loads(call_kwargs["content"])["doing"] == "Tests"
+        assert json.loads(call_kwargs["content"])["blocked"] == "None"
 
-    def test_get_status(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"count": 1, "pending_checkins": []}
+    def test_submit_update_omits_none_fields(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"followups_count": 1}, status_code=201)
+
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
+            client.submit_update(done="Auth", blocked="")
+
+        call_kwargs: dict[str, Any] = mock_post.call_args[1]
+        assert json.loads(call_kwargs["content"]) == {"done": "Auth", "blocked": ""}
 
-        with patch("httpx.get", return_value=mock_response):
+    def test_get_status(self, client: DailyBotClient, make_response: ResponseFactory) -> None:
+        mock_response: Mock = make_response({"count": 1, "pending_checkins": []})
+
+        with patch.object(client._client, "get", return_value=mock_response):
             result: dict[str, Any] = client.get_status()
 
         assert result["count"] == 1
 
 
+class TestConditionalGet:
+
+    def test_etag_stored_and_revalidated(
+        self,
+        client: DailyBotClient,
+        tmp_etag_cache: Path,
+        make_response: ResponseFactory,
+    ) -> None:
+        fresh: Mock = make_response({"count": 1, "pending_checkins": []}, headers={"ETag": '"v1"'})
+        not_modified: Mock = make_response(status_code=304)
+
+        with patch.object(client._client, "get", side_effect=[fresh, not_modified]) as mock_get:
+            first: dict[str, Any] = client.get_status()
+            # A new client (i.e. the next CLI invocation) reads the cache from disk
+            client._etag_cache = None
+            second: dict[str, Any] = client.get_status()
+
+        assert "If-None-Match" not in mock_get.call_args_list[0][1]["headers"]
+        assert mock_get.call_args_list[1][1]["headers"]["If-None-Match"] == '"v1"'
+        assert first == second == {"count": 1, "pending_checkins": []}
+        assert tmp_etag_cache.exists()
+
+    def test_no_etag_not_cached(
+        self,
+        client: DailyBotClient,
+        tmp_etag_cache: Path,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response([{"id": "m1"}])
+
+        with patch.object(client._client, "get", return_value=mock_response):
+            result: list[dict[str, Any]] = client.get_agent_messages("Claude Code")
+
+        assert result == [{"id": "m1"}]
+        assert not tmp_etag_cache.exists()
+
+    def test_etag_cache_write_failure_ignored(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        fresh: Mock = make_response({"count": 0}, headers={"ETag": '"v1"'})
+
+        with patch.object(client._client, "get", return_value=fresh), patch(
+            "dailybot_cli.api_client.save_etag_cache", side_effect=PermissionError("read-only")
+        ):
+            result: dict[str, Any] = client.get_status()
+
+        assert result == {"count": 0}
+
+    def test_etag_cache_evicts_oldest(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        client._etag_cache = {}
+        with patch("dailybot_cli.api_client._ETAG_CACHE_MAX_ENTRIES", 2):
+            for name in ("a", "b", "c"):
+                fresh: Mock = make_response([], headers={"ETag": f'"{name}"'})
+                with patch.object(client._client, "get", return_value=fresh):
+                    client.get_agent_messages(name)
+
+        assert [entry["etag"] for entry in client._etag_cache.values()] == ['"b"', '"c"']
+
+
 class TestDailyBotClientAgent:
 
-    def test_submit_agent_report(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": 1, "uuid": "abc"}
+    def test_submit_agent_report(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"id": 1, "uuid": "abc"}, status_code=201)
 
-        with patch("httpx.post", return_value=mock_response) as mock_post:
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
             result: dict[str, Any] = client.submit_agent_report(
                 agent_name="Claude Code",
                 content="Deployed v2",
             )
 
         call_kwargs: dict[str, Any] = mock_post.call_args[1]
-        assert call_kwargs["json"]["agent_name"] == "Claude Code"
+        assert json.loads(call_kwargs["content"])["agent_name"] == "Claude Code"
         assert call_kwargs["headers"]["X-API-KEY"] == "test-api-key"
         assert result["id"] == 1
 
 
-    def test_submit_agent_report_with_milestone(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": 2, "is_milestone": True}
+    def test_submit_agent_report_with_milestone(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"id": 2, "is_milestone": True}, status_code=201)
 
-        with patch("httpx.post", return_value=mock_response) as mock_post:
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
             result: dict[str, Any] = client.submit_agent_report(
                 agent_name="Claude Code",
                 content="Big feature",
@@ -152,15 +315,17 @@ class TestDailyBotClientAgent:
             )
 
         call_kwargs: dict[str, Any] = mock_post.call_args[1]
-        assert call_kwargs["json"]["is_milestone"] is True
+        assert json.loads(call_kwargs["content"])["is_milestone"] is True
         assert result["is_milestone"] is True
 
-    def test_submit_agent_report_with_co_authors(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": 3, "co_authors": [{"name": "Alice"}]}
+    def test_submit_agent_report_with_co_authors(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"id": 3, "co_authors": [{"name": "Alice"}]}, status_code=201)
 
-        with patch("httpx.post", return_value=mock_response) as mock_post:
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
             result: dict[str, Any] = client.submit_agent_report(
                 agent_name="Claude Code",
                 content="Paired work",
@@ -168,46 +333,140 @@ class TestDailyBotClientAgent:
             )
 
         call_kwargs: dict[str, Any] = mock_post.call_args[1]
-        assert call_kwargs["json"]["co_authors"] == ["alice@co.com", "bob@co.com"]
+        assert json.loads(call_kwargs["content"])["co_authors"] == ["alice@co.com", "bob@co.com"]
         assert result["co_authors"] == [{"name": "Alice"}]
 
-    def test_submit_agent_report_defaults_omit_new_fields(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": 4}
+    def test_submit_agent_report_defaults_omit_new_fields(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"id": 4}, status_code=201)
 
-        with patch("httpx.post", return_value=mock_response) as mock_post:
+        with patch.object(client._client, "post", return_value=mock_response) as mock_post:
             client.submit_agent_report(
                 agent_name="Claude Code",
                 content="Normal report",
             )
 
         call_kwargs: dict[str, Any] = mock_post.call_args[1]
-        assert "is_milestone" not in call_kwargs["json"]
-        assert "co_authors" not in call_kwargs["json"]
+        assert "is_milestone" not in json.loads(call_kwargs["content"])
+        assert "co_authors" not in json.loads(call_kwargs["content"])
+
+
+class TestGetRetries:
+
+    @patch("dailybot_cli.api_client.time.sleep")
+    def test_get_retried_after_dropped_connection(
+        self,
+        mock_sleep: MagicMock,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"count": 0})
+
+        with patch.object(
+            client._client,
+            "get",
+            side_effect=[httpx.RemoteProtocolError("dropped"), mock_response],
+        ) as mock_get:
+            result: dict[str, Any] = client.get_status()
+
+        assert result == {"count": 0}
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once_with(0.1)
+
+    @patch("dailybot_cli.api_client.time.sleep")
+    def test_get_gives_up_after_retries(self, mock_sleep: MagicMock, client: DailyBotClient) -> None:
+        with patch.object(client._client, "get", side_effect=httpx.ConnectError("refused")) as mock_get:
+            with pytest.raises(httpx.ConnectError):
+                client.get_status()
+
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_post_not_retried(self, client: DailyBotClient) -> None:
+        with patch.object(client._client, "post", side_effect=httpx.RemoteProtocolError("dropped")) as mock_post:
+            with pytest.raises(httpx.RemoteProtocolError):
+                client.submit_update(message="Did stuff")
+
+        mock_post.assert_called_once()
+
+
+class TestBulkAgentReports:
+
+    def test_bulk_reports_returned_in_order(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        ok: Mock = make_response({"id": 1}, status_code=201)
+        rejected: Mock = make_response({"detail": "Content too long"}, status_code=400)
+
+        with patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock, side_effect=[ok, rejected]) as mock_post:
+            results: list[Any] = client.submit_agent_reports_bulk([
+                {"agent_name": "CI", "content": "Built"},
+                {"agent_name": "CI", "content": "x" * 10, "is_milestone": True},
+            ])
+
+        assert results[0] == {"id": 1}
+        assert isinstance(results[1], APIError)
+        assert results[1].detail == "Content too long"
+        sent: list[dict[str, Any]] = [json.loads(c[1]["content"]) for c in mock_post.call_args_list]
+        assert sent[0] == {"agent_name": "CI", "content": "Built"}
+        assert sent[1]["is_milestone"] is True
+        assert mock_post.call_args_list[0][1]["headers"]["X-API-KEY"] == "test-api-key"
+
+    def test_bulk_transport_error_kept_per_report(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        ok: Mock = make_response({"id": 1}, status_code=201)
+        refused: httpx.ConnectError = httpx.ConnectError("refused")
+
+        with patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock, side_effect=[refused, ok]):
+            results: list[Any] = client.submit_agent_reports_bulk([
+                {"agent_name": "CI", "content": "Built"},
+                {"agent_name": "CI", "content": "Deployed"},
+            ])
+
+        assert results == [refused, {"id": 1}]
 
 
 class TestAPIError:
 
-    def test_api_error_raised(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 400
-        mock_response.json.return_value = {"detail": "Bad request"}
+    def test_api_error_raised(self, client: DailyBotClient, make_response: ResponseFactory) -> None:
+        mock_response: Mock = make_response({"detail": "Bad request"}, status_code=400)
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch.object(client._client, "post", return_value=mock_response):
             with pytest.raises(APIError) as exc_info:
                 client.request_code("bad@example.com")
 
         assert exc_info.value.status_code == 400
         assert "Bad request" in exc_info.value.detail
 
-    def test_api_error_non_json(self, client: DailyBotClient) -> None:
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 500
-        mock_response.json.side_effect = ValueError("Not JSON")
-        mock_response.text = "Internal Server Error"
+    def test_api_error_falls_back_to_error_field(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response({"error": "Slow down"}, status_code=429)
+
+        with patch.object(client._client, "post", return_value=mock_response):
+            with pytest.raises(APIError) as exc_info:
+                client.request_code("user@example.com")
+
+        assert exc_info.value.detail == "Slow down"
+
+    def test_api_error_non_json(
+        self,
+        client: DailyBotClient,
+        make_response: ResponseFactory,
+    ) -> None:
+        mock_response: Mock = make_response(status_code=500, content=b"Internal Server Error")
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch.object(client._client, "post", return_value=mock_response):
             with pytest.raises(APIError) as exc_info:
                 client.request_code("user@example.com")
 
@@ -246,33 +505,41 @@ class TestAgentDualAuth:
         assert "Authorization" not in headers
         assert client._agent_auth_mode is None
 
-    def test_handle_response_401_bearer_message(self) -> None:
+    def test_handle_response_401_bearer_message(self, make_response: ResponseFactory) -> None:
         client = DailyBotClient(
             api_url="http://test.com", token="tok", api_key=None
         )
-        client._agent_headers()  # sets _agent_auth_mode to "bearer"
+        assert client._agent_auth_mode == "bearer"
 
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 401
-        mock_response.json.return_value = {"detail": "Unauthorized"}
+        mock_response: Mock = make_response({"detail": "Unauthorized"}, status_code=401)
 
         with pytest.raises(APIError) as exc_info:
-            client._handle_response(mock_response)
+            client._handle_response(mock_response, client._agent_auth_mode)
 
         assert "Session expired" in exc_info.value.detail
         assert "dailybot login" in exc_info.value.detail
 
-    def test_handle_response_401_api_key_unchanged(self) -> None:
+    def test_handle_response_401_api_key_unchanged(self, make_response: ResponseFactory) -> None:
         client = DailyBotClient(
             api_url="http://test.com", token="tok", api_key="key123"
         )
-        client._agent_headers()  # sets _agent_auth_mode to "api_key"
+        assert client._agent_auth_mode == "api_key"
 
-        mock_response: MagicMock = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 401
-        mock_response.json.return_value = {"detail": "Invalid API key"}
+        mock_response: Mock = make_response({"detail": "Invalid API key"}, status_code=401)
 
         with pytest.raises(APIError) as exc_info:
-            client._handle_response(mock_response)
+            client._handle_response(mock_response, client._agent_auth_mode)
 
         assert exc_info.value.detail == "Invalid API key"
+
+    def test_non_agent_401_detail_unchanged(self, make_response: ResponseFactory) -> None:
+        client = DailyBotClient(
+            api_url="http://test.com", token="tok", api_key=None
+        )
+        mock_response: Mock = make_response({"detail": "Token revoked"}, status_code=401)
+
+        with patch.object(client._client, "post", return_value=mock_response):
+            with pytest.raises(APIError) as exc_info:
+                client.logout()
+
+        assert exc_info.value.detail == "Token revoked"
@@ -0,0 +1,758 @@
+"""Tests for `dailybot agent` reporting, health, webhook, message and email commands."""
+
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from dailybot_cli.api_client import APIError
+from dailybot_cli.main import cli
+from tests.helpers import StubClient
+
+
+_PENDING_MESSAGES: tuple[dict[str, Any], ...] = (
+    {
+        "id": "uuid-1",
+        "content": "Please review PR #42",
+        "message_type": "text",
+        "sender_type": "human",
+        "sender_name": "John Doe",
+        "created_at": "2025-01-01T00:00:00Z",
+    },
+    {
+        "id": "uuid-2",
+        "content": "New deployment ready",
+        "message_type": "system",
+        "sender_type": "system",
+        "sender_name": None,
+        "created_at": "2025-01-01T00:00:00Z",
+    },
+)
+
+
+_AGENT_MESSAGES: tuple[dict[str, Any], ...] = (
+    {
+        "id": "msg-1",
+        "content": "Review PR #42",
+        "message_type": "text",
+        "sender_type": "human",
+        "sender_name": "John Doe",
+        "delivered": False,
+        "created_at": "2025-01-01T00:00:00Z",
+    },
+    {
+        "id": "msg-2",
+        "content": "Deploy done",
+        "message_type": "system",
+        "sender_type": "agent",
+        "sender_name": "CI Bot",
+        "delivered": True,
+        "created_at": "2025-01-01T01:00:00Z",
+    },
+)
+
+
+class TestAgentCommand:
+
+    def test_agent_update(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub_client_factory(submit_agent_report={"id": 1, "uuid": "abc"})
+
+        result = runner.invoke(
+            cli, ["agent", "update", "Deployed v2.1", "--name", "Claude Code"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Report submitted" in result.output
+
+    def test_agent_update_with_metadata(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(submit_agent_report={"id": 2, "uuid": "def"})
+
+        result = runner.invoke(
+            cli, ["agent", "update", "Fixed login bug", "--name", "Claude Code",
+                  "--metadata", '{"repo": "api-services", "branch": "fix/login", "pr": "#142"}'],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Report submitted" in result.output
+        assert stub.calls == [
+            ("submit_agent_report", {
+                "agent_name": "Claude Code",
+                "content": "Fixed login bug",
+                "structured": None,
+                "metadata": {"repo": "api-services", "branch": "fix/login", "pr": "#142"},
+                "is_milestone": False,
+                "co_authors": None,
+            })
+        ]
+
+    def test_agent_update_batch(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            submit_agent_reports_bulk=[
+                {"id": 1},
+                APIError(400, "Content too long"),
+            ]
+        )
+
+        result = runner.invoke(
+            cli,
+            ["agent", "update", "--batch", "-", "--name", "CI Bot", "--milestone"],
+            input='{"content": "Built"}\n\n{"content": "Deployed", "is_milestone": false}\n',
+        )
+        assert result.exit_code == 1
+        assert "Report 1: Report submitted (id: 1)" in result.output
+        assert "Content too long" in result.output
+        assert [name for name, _ in stub.calls] == ["submit_agent_reports_bulk"]
+        reports: list[dict[str, Any]] = stub.calls[0][1]["reports"]
+        assert [r["content"] for r in reports] == ["Built", "Deployed"]
+        assert reports[0]["agent_name"] == "CI Bot"
+        assert reports[0]["is_milestone"] is True
+        assert reports[1]["is_milestone"] is False
+
+    def test_agent_update_batch_reports_transport_errors_per_line(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub_client_factory(
+            submit_agent_reports_bulk=[
+                httpx.ConnectError("refused"),
+                {"id": 2},
+                httpx.ReadTimeout("timed out"),
+            ]
+        )
+
+        result = runner.invoke(
+            cli,
+            ["agent", "update", "--batch", "-"],
+            input='{"content": "a"}\n{"content": "b"}\n{"content": "c"}\n',
+        )
+        output: str = result.output
+        assert result.exit_code == 1
+        assert "Report 1: could not reach Dailybot (refused)" in output
+        assert "Report 2: Report submitted (id: 2)" in output
+        assert "Report 3: timed out" in output
+
+    def test_agent_update_batch_rejects_unknown_fields(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory()
+
+        result = runner.invoke(
+            cli, ["agent", "update", "--batch", "-"], input='{"content": "x", "agent": "y"}\n'
+        )
+        assert result.exit_code == 1
+        assert stub.calls == []
+
+    def test_agent_update_requires_content_or_batch(self, runner: CliRunner) -> None:
+        result = runner.invoke(cli, ["agent", "update"])
+        assert result.exit_code == 1
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["agent", "update", "test"],
+            ["agent", "health", "--ok"],
+            ["agent", "webhook", "register", "--url", "https://example.com/hook"],
+            ["agent", "webhook", "unregister"],
+            ["agent", "message", "send", "--to", "Bot", "--content", "hi"],
+            ["agent", "message", "list", "--name", "Bot"],
+        ],
+        ids=["update", "health", "webhook-register", "webhook-unregister", "message-send", "message-list"],
+    )
+    def test_agent_no_api_key(
+        self, agent_mocks: dict[str, MagicMock], runner: CliRunner, argv: list[str]
+    ) -> None:
+        agent_mocks["get_agent_auth"].return_value = None
+        result = runner.invoke(cli, argv)
+        assert result.exit_code != 0
+
+    def test_agent_health_ok(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            submit_agent_health={
+                "agent_name": "Claude Code",
+                "status": "healthy",
+                "last_check": "2025-01-01T00:00:00Z",
+                "history": [],
+            }
+        )
+
+        result = runner.invoke(
+            cli, ["agent", "health", "--ok", "--message", "All good", "--name", "Claude Code"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "healthy" in result.output
+        assert "Claude Code" in result.output
+        assert stub.calls == [
+            ("submit_agent_health", {
+                "agent_name": "Claude Code", "ok": True, "message": "All good",
+            })
+        ]
+
+    def test_agent_health_fail(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            submit_agent_health={
+                "agent_name": "CI Bot",
+                "status": "unhealthy",
+                "last_check": "2025-01-01T00:00:00Z",
+                "history": [],
+            }
+        )
+
+        result = runner.invoke(
+            cli, ["agent", "health", "--fail", "--message", "DB down", "--name", "CI Bot"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "unhealthy" in result.output
+        assert "CI Bot" in result.output
+        assert stub.calls == [
+            ("submit_agent_health", {
+                "agent_name": "CI Bot", "ok": False, "message": "DB down",
+            })
+        ]
+
+    def test_agent_health_status(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            get_agent_health={
+                "agent_name": "Claude Code",
+                "status": "healthy",
+                "last_check": "2025-01-01T00:00:00Z",
+                "history": [
+                    {"timestamp": "2025-01-01T00:00:00Z", "status": "healthy", "message": "All good"},
+                ],
+            }
+        )
+
+        result = runner.invoke(
+            cli, ["agent", "health", "--status", "--name", "Claude Code"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "healthy" in result.output
+        assert "Claude Code" in result.output
+        assert stub.calls == [("get_agent_health", {"agent_name": "Claude Code"})]
+
+    def test_agent_health_no_flag(self, runner: CliRunner) -> None:
+        result = runner.invoke(cli, ["agent", "health"])
+        assert result.exit_code != 0
+
+    def test_agent_health_with_pending_messages(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub_client_factory(
+            submit_agent_health={
+                "agent_name": "Claude Code",
+                "status": "healthy",
+                "last_check": "2025-01-01T00:00:00Z",
+                "history": [],
+                "pending_messages": list(_PENDING_MESSAGES),
+            }
+        )
+
+        result = runner.invoke(
+            cli, ["agent", "health", "--ok", "--name", "Claude Code"],
+            catch_exceptions=False,
+        )
+        output: str = result.output
+        assert result.exit_code == 0
+        assert "Pending messages from Dailybot (2)" in output
+        assert "[id:uuid-1]" in output
+        assert "Please review PR #42" in output
+        assert "John Doe:" in output
+        assert "[id:uuid-2]" in output
+        assert "New deployment ready" in output
+        assert "[system]:" in output
+        assert "dailybot agent message claim <id>" in output
+
+    # --- Webhook tests ---
+
+    def test_webhook_register(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            register_agent_webhook={
+                "agent_name": "Claude Code",
+                "webhook_url": "https://my-server.com/hook",
+            }
+        )
+
+        result = runner.invoke(
+            cli,
+            ["agent", "webhook", "register", "--url", "https://my-server.com/hook",
+             "--secret", "my-token", "--name", "Claude Code"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Webhook Registered" in result.output
+        assert "https://my-server.com/hook" in result.output
+        assert stub.calls == [
+            ("register_agent_webhook", {
+                "agent_name": "Claude Code",
+                "webhook_url": "https://my-server.com/hook",
+                "webhook_secret": "my-token",
+            })
+        ]
+
+    def test_webhook_unregister(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub_client_factory(
+            unregister_agent_webhook={
+                "detail": "Webhook unregistered.",
+            }
+        )
+
+        result = runner.invoke(
+            cli, ["agent", "webhook", "unregister", "--name", "Claude Code"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Webhook unregistered" in result.output
+
+    # --- Message tests ---
+
+    def test_message_send(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            send_agent_message={
+                "id": "msg-uuid",
+                "agent_name": "Claude Code",
+                "content": "Review PR #42",
+                "message_type": "text",
+                "sender_type": "agent",
+                "sender_name": "CLI Agent",
+                "delivered": False,
+                "created_at": "2025-01-01T00:00:00Z",
+            }
+        )
+
+        result = runner.invoke(
+            cli,
+            ["agent", "message", "send", "--to", "Claude Code", "--content", "Review PR #42"],
+            catch_exceptions=False,
+        )
+        output: str = result.output
+        assert result.exit_code == 0
+        assert "Message Sent" in output
+        assert "Review PR #42" in output
+        assert "CLI Agent" in output
+        assert stub.calls == [
+            ("send_agent_message", {
+                "agent_name": "Claude Code",
+                "content": "Review PR #42",
+                "message_type": None,
+                "metadata": None,
+                "expires_at": None,
+                "sender_type": "agent",
+                "sender_name": "CLI Agent",
+            })
+        ]
+
+    def test_message_send_with_type(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            send_agent_message={
+                "id": "msg-uuid",
+                "agent_name": "Claude Code",
+                "content": "Do X",
+                "message_type": "command",
+                "sender_type": "agent",
+                "sender_name": "My Bot",
+                "delivered": False,
+                "created_at": "2025-01-01T00:00:00Z",
+            }
+        )
+
+        result = runner.invoke(
+            cli,
+            ["agent", "message", "send", "--to", "Claude Code",
+             "--content", "Do X", "--type", "command", "--name", "My Bot"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Message Sent" in result.output
+        assert stub.calls == [
+            ("send_agent_message", {
+                "agent_name": "Claude Code",
+                "content": "Do X",
+                "message_type": "command",
+                "metadata": None,
+                "expires_at": None,
+                "sender_type": "agent",
+                "sender_name": "My Bot",
+            })
+        ]
+
+    def test_message_list(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(get_agent_messages=list(_AGENT_MESSAGES))
+
+        result = runner.invoke(
+            cli, ["agent", "message", "list", "--name", "Claude Code"],
+            catch_exceptions=False,
+        )
+        output: str = result.output
+        assert result.exit_code == 0
+        assert "Review PR #42" in output
+        assert "John Doe" in output
+        assert "Deploy done" in output
+        assert "CI Bot" in output
+        assert stub.calls == [
+            ("get_agent_messages", {"agent_name": "Claude Code", "delivered": None})
+        ]
+
+    def test_message_list_pending(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(get_agent_messages=[])
+
+        result = runner.invoke(
+            cli, ["agent", "message", "list", "--name", "Claude Code", "--pending"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "No messages" in result.output
+        assert stub.calls == [
+            ("get_agent_messages", {"agent_name": "Claude Code", "delivered": False})
+        ]
+
+    def test_agent_update_milestone(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            submit_agent_report={
+                "id": 10, "is_milestone": True,
+            }
+        )
+
+        result = runner.invoke(
+            cli, ["agent", "update", "Big feature", "--milestone"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "[Milestone]" in result.output
+        assert stub.calls == [
+            ("submit_agent_report", {
+                "agent_name": "CLI Agent",
+                "content": "Big feature",
+                "structured": None,
+                "metadata": None,
+                "is_milestone": True,
+                "co_authors": None,
+            })
+        ]
+
+    def test_agent_update_co_authors(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            submit_agent_report={
+                "id": 11,
+                "co_authors": [
+                    {"name": "Alice", "uuid": "a-uuid"},
+                    {"name": "Bob", "uuid": "b-uuid"},
+                ],
+            }
+        )
+
+        result = runner.invoke(
+            cli, ["agent", "update", "Paired work",
+                  "--co-authors", "alice@co.com", "--co-authors", "bob@co.com"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Co-authors: Alice, Bob" in result.output
+        assert stub.calls == [
+            ("submit_agent_report", {
+                "agent_name": "CLI Agent",
+                "content": "Paired work",
+                "structured": None,
+                "metadata": None,
+                "is_milestone": False,
+                "co_authors": ["alice@co.com", "bob@co.com"],
+            })
+        ]
+
+    def test_agent_update_co_authors_comma_separated(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            submit_agent_report={
+                "id": 12,
+                "co_authors": [
+                    {"name": "Alice", "uuid": "a-uuid"},
+                    {"name": "Bob", "uuid": "b-uuid"},
+                ],
+            }
+        )
+
+        result = runner.invoke(
+            cli, ["agent", "update", "Paired work",
+                  "--co-authors", "alice@co.com,bob@co.com"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Co-authors: Alice, Bob" in result.output
+        assert stub.calls == [
+            ("submit_agent_report", {
+                "agent_name": "CLI Agent",
+                "content": "Paired work",
+                "structured": None,
+                "metadata": None,
+                "is_milestone": False,
+                "co_authors": ["alice@co.com", "bob@co.com"],
+            })
+        ]
+
+    def test_agent_update_milestone_and_co_authors(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            submit_agent_report={
+                "id": 13,
+                "is_milestone": True,
+                "co_authors": [{"name": "Alice", "uuid": "a-uuid"}],
+            }
+        )
+
+        result = runner.invoke(
+            cli, ["agent", "update", "Big feature", "--milestone",
+                  "--co-authors", "alice@co.com"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "[Milestone]" in result.output
+        assert "Co-authors: Alice" in result.output
+        assert stub.calls == [
+            ("submit_agent_report", {
+                "agent_name": "CLI Agent",
+                "content": "Big feature",
+                "structured": None,
+                "metadata": None,
+                "is_milestone": True,
+                "co_authors": ["alice@co.com"],
+            })
+        ]
+
+    def test_agent_update_with_pending_messages(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub_client_factory(
+            submit_agent_report={
+                "id": 14,
+                "pending_messages": [
+                    {
+                        "id": "uuid-1",
+                        "sender_type": "human",
+                        "sender_name": "John Doe",
+                        "content": "Please review PR #42",
+                    },
+                    {
+                        "id": "uuid-2",
+                        "sender_type": "system",
+                        "sender_name": "",
+                        "content": "New deployment ready",
+                    },
+                ],
+            }
+        )
+
+        result = runner.invoke(
+            cli, ["agent", "update", "Did some work"],
+            catch_exceptions=False,
+        )
+        output: str = result.output
+        assert result.exit_code == 0
+        assert "Report submitted" in output
+        assert "Pending messages from Dailybot (2)" in output
+        assert "[id:uuid-1]" in output
+        assert "John Doe:" in output
+        assert "Please review PR #42" in output
+        assert "[id:uuid-2]" in output
+        assert "New deployment ready" in output
+        assert "dailybot agent message claim <id>" in output
+
+    def test_agent_no_auth(
+        self, agent_mocks: dict[str, MagicMock], runner: CliRunner
+    ) -> None:
+        agent_mocks["get_agent_auth"].return_value = None
+        result = runner.invoke(cli, ["agent", "update", "test"])
+        assert result.exit_code != 0
+        assert "dailybot config key=" in result.output
+        assert "dailybot login" in result.output
+
+
+class TestAgentEmailCommand:
+
+    def test_email_send(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            send_agent_email={
+                "sent_count": 1,
+                "total_recipients": 1,
+                "reply_to": "ag-abc@mail.dailybot.com",
+            }
+        )
+
+        result = runner.invoke(
+            cli,
+            ["agent", "email", "send",
+             "--to", "user@example.com",
+             "--subject", "Build passed",
+             "--body-html", "<p>All green.</p>",
+             "--name", "Claude Code"],
+            catch_exceptions=False,
+        )
+        output: str = result.output
+        assert result.exit_code == 0
+        assert "Email Sent" in output
+        assert "1 of 1" in output
+        assert "ag-abc@mail.dailybot.com" in output
+        assert stub.calls == [
+            ("send_agent_email", {
+                "agent_name": "Claude Code",
+                "to": ["user@example.com"],
+                "subject": "Build passed",
+                "body_html": "<p>All green.</p>",
+                "metadata": None,
+            })
+        ]
+
+    def test_email_send_multiple_recipients(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            send_agent_email={
+                "sent_count": 2,
+                "total_recipients": 2,
+                "reply_to": "ag-abc@mail.dailybot.com",
+            }
+        )
+
+        result = runner.invoke(
+            cli,
+            ["agent", "email", "send",
+             "--to", "a@co.com", "--to", "b@co.com",
+             "--subject", "Report",
+             "--body-html", "<h1>Done</h1>",
+             "--name", "CI Bot"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "2 of 2" in result.output
+        assert stub.calls == [
+            ("send_agent_email", {
+                "agent_name": "CI Bot",
+                "to": ["a@co.com", "b@co.com"],
+                "subject": "Report",
+                "body_html": "<h1>Done</h1>",
+                "metadata": None,
+            })
+        ]
+
+    def test_email_send_rate_limited(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub_client_factory(send_agent_email=APIError(429, "Agent email hourly limit exceeded."))
+
+        result = runner.invoke(
+            cli,
+            ["agent", "email", "send",
+             "--to", "user@example.com",
+             "--subject", "Test",
+             "--body-html", "<p>Hi</p>"],
+        )
+        assert result.exit_code != 0
+        assert "Hourly email limit exceeded" in result.output
+
+    def test_email_send_no_auth(
+        self, agent_mocks: dict[str, MagicMock], runner: CliRunner
+    ) -> None:
+        agent_mocks["get_agent_auth"].return_value = None
+        result = runner.invoke(
+            cli,
+            ["agent", "email", "send",
+             "--to", "user@example.com",
+             "--subject", "Test",
+             "--body-html", "<p>Hi</p>"],
+        )
+        assert result.exit_code != 0
+
+    def test_email_send_with_metadata(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            send_agent_email={
+                "sent_count": 1,
+                "total_recipients": 1,
+                "reply_to": "ag-abc@mail.dailybot.com",
+            }
+        )
+
+        result = runner.invoke(
+            cli,
+            ["agent", "email", "send",
+             "--to", "user@example.com",
+             "--subject", "Build",
+             "--body-html", "<p>Done</p>",
+             "--metadata", '{"pr": "#42"}'],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert stub.calls == [
+            ("send_agent_email", {
+                "agent_name": "CLI Agent",
+                "to": ["user@example.com"],
+                "subject": "Build",
+                "body_html": "<p>Done</p>",
+                "metadata": {"pr": "#42"},
+            })
+        ]
+
+
+class TestAgentMessageClaim:
+
+    def test_claim_messages(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(mark_agent_messages_read={"updated": 2})
+        result = runner.invoke(
+            cli, ["agent", "message", "claim", "uuid-1", "uuid-2"], catch_exceptions=False
+        )
+        assert result.exit_code == 0
+        assert "2 message(s)" in result.output
+        assert stub.calls == [("mark_agent_messages_read", {"message_ids": ["uuid-1", "uuid-2"]})]
+
+    def test_claim_all(
+        self, stub_client_factory: Callable[..., StubClient], runner: CliRunner
+    ) -> None:
+        stub: StubClient = stub_client_factory(
+            submit_agent_health={
+                "agent_name": "CLI Agent", "status": "healthy", "last_check": "now",
+            }
+        )
+        result = runner.invoke(cli, ["agent", "message", "claim-all"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "delivered" in result.output.lower()
+        assert stub.calls == [
+            ("submit_agent_health", {
+                "agent_name": "CLI Agent", "ok": True, "message": None,
+            })
+        ]
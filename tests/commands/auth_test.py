@@ -0,0 +1,347 @@
+"""Tests for `dailybot login` and `dailybot logout`."""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from dailybot_cli.api_client import APIError
+from dailybot_cli.commands.auth import _do_login
+from dailybot_cli.main import cli
+
+
+_ORGS: tuple[dict[str, Any], ...] = (
+    {"id": 1, "name": "Acme Corp", "uuid": "abc-123"},
+    {"id": 2, "name": "Side Project", "uuid": "def-456"},
+)
+
+
+class TestLoginCommand:
+
+    @pytest.fixture
+    def code_prompt(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Answer the OTP prompt so _do_login can be called without CliRunner."""
+        monkeypatch.setattr("click.prompt", lambda *args, **kwargs: "123456")
+
+    @pytest.mark.slow
+    @patch("dailybot_cli.commands.auth.save_credentials")
+    def test_login_single_org(
+        self,
+        mock_save: MagicMock,
+        auth_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        auth_client.api_url = "https://api.dailybot.com"
+        auth_client.request_code.return_value = {
+            "detail": "Verification code sent to your email.",
+            "organizations": [{"id": 1, "name": "MyOrg", "uuid": "org-uuid-456"}],
+            "is_multi_org": False,
+        }
+        auth_client.verify_code.return_value = {
+            "requires_organization_selection": False,
+            "token": "tok123",
+            "user": {"email": "user@test.com"},
+            "organization": {"id": 1, "name": "MyOrg", "uuid": "org-uuid-456"},
+        }
+
+        result = runner.invoke(
+            cli, ["login"], input="user@test.com\n123456\n", catch_exceptions=False
+        )
+        assert result.exit_code == 0
+        assert "Logged in" in result.output
+        assert "MyOrg" in result.output
+        mock_save.assert_called_once()
+        # Single-org: verify is called once with organization_id
+        auth_client.verify_code.assert_called_once_with("user@test.com", "123456", organization_id=1)
+
+    @patch("questionary.select")
+    @patch("dailybot_cli.commands.auth.save_credentials")
+    def test_login_multi_org(
+        self,
+        mock_save: MagicMock,
+        mock_select: MagicMock,
+        auth_client: MagicMock,
+        code_prompt: None,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        auth_client.api_url = "https://api.dailybot.com"
+        auth_client.request_code.return_value = {
+            "detail": "Verification code sent to your email.",
+            "organizations": list(_ORGS),
+            "is_multi_org": True,
+        }
+        auth_client.verify_code.return_value = {
+            "requires_organization_selection": False,
+            "token": "tok456",
+            "user": {"email": "user@test.com"},
+            "organization": _ORGS[1],
+        }
+        # Mock questionary.select to return the second org
+        mock_select.return_value.ask.return_value = _ORGS[1]
+
+        _do_login("user@test.com")
+        output: str = capsys.readouterr().out
+        assert "Logged in" in output
+        assert "Side Project" in output
+        # Org selected before verify — single call with org_id
+        auth_client.verify_code.assert_called_once_with("user@test.com", "123456", organization_id=2)
+
+    @patch("questionary.select")
+    @patch("dailybot_cli.commands.auth.save_credentials")
+    def test_login_multi_org_from_env(
+        self,
+        mock_save: MagicMock,
+        mock_select: MagicMock,
+        auth_client: MagicMock,
+        code_prompt: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("DAILYBOT_ORG", "def-456")
+        auth_client.api_url = "https://api.dailybot.com"
+        auth_client.request_code.return_value = {
+            "organizations": list(_ORGS),
+            "is_multi_org": True,
+        }
+        auth_client.verify_code.return_value = {
+            "token": "tok456",
+            "organization": _ORGS[1],
+        }
+
+        _do_login("user@test.com")
+        mock_select.assert_not_called()
+        auth_client.verify_code.assert_called_once_with("user@test.com", "123456", organization_id=2)
+
+    def test_login_bad_email(self, auth_client: MagicMock) -> None:
+        auth_client.request_code.side_effect = APIError(400, "No account found")
+
+        with pytest.raises(SystemExit) as exc_info:
+            _do_login("bad@test.com")
+        assert exc_info.value.code == 1
+
+    @patch("dailybot_cli.commands.auth.save_credentials")
+    def test_login_non_interactive_verify(
+        self,
+        mock_save: MagicMock,
+        auth_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """Non-interactive step 2: --email + --code verifies directly."""
+        auth_client.api_url = "https://api.dailybot.com"
+        auth_client.verify_code.return_value = {
+            "token": "tok789",
+            "user": {"email": "user@test.com"},
+            "organization": {"id": 1, "name": "MyOrg", "uuid": "org-uuid"},
+        }
+
+        result = runner.invoke(
+            cli, ["login", "--email=user@test.com", "--code=123456"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Logged in" in result.output
+        auth_client.verify_code.assert_called_once_with(
+            "user@test.com", "123456", organization_id=None
+        )
+        mock_save.assert_called_once()
+        # request_code should NOT be called
+        auth_client.request_code.assert_not_called()
+
+    @patch("dailybot_cli.commands.auth.clear_org_cache")
+    @patch("dailybot_cli.commands.auth.load_org_cache")
+    @patch("dailybot_cli.commands.auth.save_credentials")
+    def test_login_non_interactive_verify_with_org(
+        self,
+        mock_save: MagicMock,
+        mock_load_cache: MagicMock,
+        mock_clear_cache: MagicMock,
+        auth_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """Non-interactive step 2 with --org UUID resolves via cached org list."""
+        mock_load_cache.return_value = list(_ORGS)
+        auth_client.api_url = "https://api.dailybot.com"
+        auth_client.verify_code.return_value = {
+            "token": "tok999",
+            "user": {"email": "user@test.com"},
+            "organization": _ORGS[1],
+        }
+
+        result = runner.invoke(
+            cli, ["login", "--email=user@test.com", "--code=654321", "--org=def-456"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Logged in" in result.output
+        assert "Side Project" in result.output
+        # Should NOT call request_code (would invalidate the OTP)
+        auth_client.request_code.assert_not_called()
+        # Single verify call with resolved integer ID
+        auth_client.verify_code.assert_called_once_with(
+            "user@test.com", "654321", organization_id=2
+        )
+        mock_clear_cache.assert_called_once()
+
+    @patch("dailybot_cli.commands.auth.load_org_cache")
+    def test_login_non_interactive_verify_with_bad_org_uuid(
+        self,
+        mock_load_cache: MagicMock,
+        auth_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """Non-interactive --org with unknown UUID shows error and org list."""
+        mock_load_cache.return_value = list(_ORGS[:1])
+
+        result = runner.invoke(
+            cli, ["login", "--email=user@test.com", "--code=654321", "--org=wrong-uuid"]
+        )
+        assert result.exit_code != 0
+        assert "not found" in result.output
+        assert "Acme Corp" in result.output
+
+    @patch("dailybot_cli.commands.auth.load_org_cache")
+    def test_login_non_interactive_verify_with_org_no_cache(
+        self,
+        mock_load_cache: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """Non-interactive --org without cached org list tells user to run step 1."""
+        mock_load_cache.return_value = None
+
+        result = runner.invoke(
+            cli, ["login", "--email=user@test.com", "--code=654321", "--org=abc-123"]
+        )
+        assert result.exit_code != 0
+        assert "No cached organization list" in result.output
+
+    @patch("dailybot_cli.commands.auth.save_org_cache")
+    def test_login_non_interactive_request_code_multi_org(
+        self,
+        mock_save_cache: MagicMock,
+        auth_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """Non-interactive step 1: --email requests code, prints orgs, caches org list."""
+        auth_client.api_url = "https://api.dailybot.com"
+        auth_client.request_code.return_value = {
+            "detail": "Verification code sent.",
+            "organizations": list(_ORGS),
+            "is_multi_org": True,
+        }
+
+        result = runner.invoke(cli, ["login", "--email=user@test.com"], catch_exceptions=False)
+        output: str = result.output
+        assert result.exit_code == 0
+        assert "Verification code sent" in output
+        assert "Acme Corp" in output
+        assert "uuid: abc-123" in output
+        assert "Side Project" in output
+        assert "uuid: def-456" in output
+        assert "--code=CODE --org=ORG_UUID" in output
+        # Should cache org list for step 2
+        mock_save_cache.assert_called_once_with("user@test.com", list(_ORGS))
+        # Should NOT prompt for code
+        auth_client.verify_code.assert_not_called()
+
+    def test_login_non_interactive_verify_requires_org(
+        self,
+        auth_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """Non-interactive verify without --org when multi-org: prints orgs and instruction."""
+        auth_client.api_url = "https://api.dailybot.com"
+        auth_client.verify_code.return_value = {
+            "requires_organization_selection": True,
+            "organizations": list(_ORGS),
+        }
+
+        result = runner.invoke(
+            cli, ["login", "--email=user@test.com", "--code=123456"]
+        )
+        output: str = result.output
+        assert result.exit_code != 0
+        assert "Acme Corp" in output
+        assert "Side Project" in output
+        assert "--org=ORG_UUID" in output
+
+    @patch("dailybot_cli.commands.auth.save_credentials")
+    def test_login_non_interactive_verify_auto_selects_single_org(
+        self,
+        mock_save: MagicMock,
+        auth_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """Non-interactive verify auto-selects when only one org available."""
+        auth_client.api_url = "https://api.dailybot.com"
+        # First call: requires org selection with 1 org
+        # Second call (retry with org_id): returns token
+        auth_client.verify_code.side_effect = [
+            {
+                "requires_organization_selection": True,
+                "organizations": [{"id": 1, "name": "MyOrg", "uuid": "org-uuid"}],
+            },
+            {
+                "token": "tok-auto",
+                "organization": {"id": 1, "name": "MyOrg", "uuid": "org-uuid"},
+            },
+        ]
+
+        result = runner.invoke(
+            cli, ["login", "--email=user@test.com", "--code=123456"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Auto-selecting organization: MyOrg" in result.output
+        assert "Logged in" in result.output
+        assert auth_client.verify_code.call_count == 2
+        auth_client.verify_code.assert_called_with("user@test.com", "123456", organization_id=1)
+
+    def test_login_non_interactive_request_code_single_org(
+        self,
+        auth_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """Non-interactive step 1 with single org: prints instructions without --org."""
+        auth_client.api_url = "https://api.dailybot.com"
+        auth_client.request_code.return_value = {
+            "detail": "Verification code sent.",
+            "organizations": [{"id": 1, "name": "MyOrg", "uuid": "org-uuid"}],
+            "is_multi_org": False,
+        }
+
+        result = runner.invoke(cli, ["login", "--email=user@test.com"], catch_exceptions=False)
+        output: str = result.output
+        assert result.exit_code == 0
+        assert "Verification code sent" in output
+        assert "--code=CODE" in output
+        assert "--org" not in output
+        auth_client.verify_code.assert_not_called()
+
+
+class TestLogoutCommand:
+
+    @patch("dailybot_cli.commands.auth.get_token")
+    @patch("dailybot_cli.commands.auth.clear_credentials")
+    def test_logout(
+        self,
+        mock_clear: MagicMock,
+        mock_get_token: MagicMock,
+        auth_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        mock_get_token.return_value = "tok"
+        auth_client.logout.return_value = {}
+
+        result = runner.invoke(cli, ["logout"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "Logged out" in result.output
+        mock_clear.assert_called_once()
+
+    @patch("dailybot_cli.commands.auth.get_token")
+    def test_logout_not_logged_in(
+        self, mock_get_token: MagicMock, runner: CliRunner
+    ) -> None:
+        mock_get_token.return_value = None
+        result = runner.invoke(cli, ["logout"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "Not logged in" in result.output
@@ -0,0 +1,58 @@
+"""Tests for `dailybot config`."""
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from click.testing import CliRunner
+
+from dailybot_cli.config import load_config, save_config
+from dailybot_cli.main import cli
+
+
+@pytest.fixture(scope="class")
+def _tmp_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Point config paths at one temp directory for a whole test class."""
+    config_dir: Path = tmp_path_factory.mktemp("home") / ".config" / "dailybot"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("dailybot_cli.config.CONFIG_DIR", config_dir)
+        mp.setattr("dailybot_cli.config.CONFIG_FILE", config_dir / "config.json")
+        mp.setattr("dailybot_cli.config.CREDENTIALS_FILE", config_dir / "credentials.json")
+        yield config_dir
+
+
+class TestConfigCommand:
+
+    @pytest.fixture(autouse=True)
+    def _tmp_config(self, _tmp_config_dir: Path) -> None:
+        for name in ("config.json", "credentials.json"):
+            (_tmp_config_dir / name).unlink(missing_ok=True)
+
+    def test_config_set_key(self, runner: CliRunner) -> None:
+        result = runner.invoke(cli, ["config", "key=abc123"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "API key saved" in result.output
+        assert "abc1****" in result.output
+
+    def test_config_show_key(self, runner: CliRunner) -> None:
+        save_config({"api_key": "secretkey99"})
+        result = runner.invoke(cli, ["config", "key"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "secr****" in result.output
+
+    def test_config_show_key_not_set(self, runner: CliRunner) -> None:
+        result = runner.invoke(cli, ["config", "key"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "not set" in result.output
+
+    def test_config_unset_key(self, runner: CliRunner) -> None:
+        save_config({"api_key": "abc123"})
+        result = runner.invoke(cli, ["config", "key="], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "removed" in result.output
+        assert "api_key" not in load_config()
+
+    def test_config_unknown_setting(self, runner: CliRunner) -> None:
+        result = runner.invoke(cli, ["config", "foo=bar"])
+        assert result.exit_code != 0
+        assert "Unknown setting" in result.output
@@ -0,0 +1,113 @@
+"""Tests for the interactive menu shown by a bare `dailybot`."""
+
+from concurrent.futures import Future
+from typing import Any, Callable
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from dailybot_cli.commands.interactive import _view_pending
+from dailybot_cli.main import cli
+
+# Menu loop, background prefetch thread and questionary/prompt_toolkit import.
+pytestmark = pytest.mark.slow
+
+
+def _prefetch_now(fetch: Callable[[], Any]) -> Future[Any]:
+    """Synchronous stand-in for _prefetch, so the menu loop is deterministic."""
+    future: Future[Any] = Future()
+    future.set_result(fetch())
+    return future
+
+
+class TestInteractiveLogin:
+
+    @patch("dailybot_cli.commands.interactive._use_rich_menu", return_value=True)
+    @patch("dailybot_cli.commands.interactive.DailyBotClient")
+    @patch("questionary.select")
+    @patch("dailybot_cli.commands.interactive._do_login")
+    @patch("dailybot_cli.commands.interactive.load_credentials")
+    @patch("dailybot_cli.commands.interactive.get_token")
+    def test_interactive_guides_login_when_not_authenticated(
+        self,
+        mock_get_token: MagicMock,
+        mock_load_creds: MagicMock,
+        mock_do_login: MagicMock,
+        mock_select: MagicMock,
+        mock_client_cls: MagicMock,
+        mock_rich_menu: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        # First call: not logged in; second call (after _do_login): return creds
+        mock_get_token.return_value = None
+        mock_load_creds.side_effect = [
+            None,
+            {"token": "tok", "email": "u@t.com", "organization": "Org"},
+        ]
+        # Mock questionary.select to return "Quit"
+        mock_select.return_value.ask.return_value = "Quit"
+        # Provide email for the prompt (code is handled inside _do_login which is mocked)
+        result = runner.invoke(cli, [], input="u@t.com\n")
+        mock_do_login.assert_called_once_with("u@t.com")
+        mock_client_cls.assert_called_once_with(warm=True)
+
+    @patch("dailybot_cli.commands.interactive._prefetch", _prefetch_now)
+    @patch("dailybot_cli.commands.interactive._use_rich_menu", return_value=True)
+    @patch("dailybot_cli.commands.interactive.print_pending_checkins")
+    @patch("dailybot_cli.commands.interactive.DailyBotClient")
+    @patch("questionary.select")
+    @patch("dailybot_cli.commands.interactive.load_credentials")
+    @patch("dailybot_cli.commands.interactive.get_token")
+    def test_interactive_view_pending_uses_prefetch(
+        self,
+        mock_get_token: MagicMock,
+        mock_load_creds: MagicMock,
+        mock_select: MagicMock,
+        mock_client_cls: MagicMock,
+        mock_print_pending: MagicMock,
+        mock_rich_menu: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        mock_get_token.return_value = "tok"
+        mock_load_creds.return_value = {"token": "tok", "email": "u@t.com", "organization": "Org"}
+        mock_client: MagicMock = mock_client_cls.return_value
+        mock_client.get_status.return_value = {"pending_checkins": [{"id": 1}]}
+        mock_select.return_value.ask.side_effect = ["View pending check-ins", "Quit"]
+
+        result = runner.invoke(cli, [], catch_exceptions=False)
+        assert result.exit_code == 0
+        mock_print_pending.assert_called_once_with([{"id": 1}])
+        mock_client.get_status.assert_called()
+        mock_client.close.assert_called_once()
+
+    @patch("dailybot_cli.commands.interactive.print_error")
+    def test_view_pending_reports_transport_error(self, mock_print_error: MagicMock) -> None:
+        pending: Future[dict[str, Any]] = Future()
+        pending.set_exception(httpx.ConnectError("refused"))
+
+        _view_pending(pending)
+
+        mock_print_error.assert_called_once_with("Could not reach Dailybot: refused")
+
+    @patch("dailybot_cli.commands.interactive.DailyBotClient")
+    @patch("questionary.select")
+    @patch("dailybot_cli.commands.interactive.load_credentials")
+    @patch("dailybot_cli.commands.interactive.get_token")
+    def test_interactive_numbered_menu_without_tty(
+        self,
+        mock_get_token: MagicMock,
+        mock_load_creds: MagicMock,
+        mock_select: MagicMock,
+        mock_client_cls: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        mock_get_token.return_value = "tok"
+        mock_load_creds.return_value = {"token": "tok", "email": "u@t.com", "organization": "Org"}
+
+        result = runner.invoke(cli, [], input="4\n", catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "4. Quit" in result.output
+        assert "Goodbye!" in result.output
+        mock_select.assert_not_called()
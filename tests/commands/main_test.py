@@ -0,0 +1,61 @@
+"""Tests for the top-level `dailybot` group."""
+
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from dailybot_cli import __version__
+from dailybot_cli.main import cli
+from tests.helpers import standup_response
+
+
+class TestVersionAndHelp:
+
+    def test_version(self, runner: CliRunner) -> None:
+        result = runner.invoke(cli, ["--version"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "dailybot" in result.output
+        assert __version__ in result.output
+
+    def test_help(self) -> None:
+        output: str = cli.get_help(click.Context(cli, info_name="dailybot"))
+        assert "login" in output
+        assert "logout" in output
+        assert "update" in output
+        assert "status" in output
+        assert "agent" in output
+        assert "--api-url" in output
+
+    @pytest.mark.slow
+    def test_subcommands_imported_lazily(self) -> None:
+        code: str = (
+            "import sys, dailybot_cli.main; "
+            "print(sorted(m for m in sys.modules if m.startswith('dailybot_cli.')))"
+        )
+        out: str = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        # Neither the subcommands nor config (and its JSON backend) load up front.
+        assert out.strip() == "['dailybot_cli.main']"
+
+    @patch("dailybot_cli.config.set_api_url_override")
+    @patch("dailybot_cli.commands.update.get_token")
+    def test_api_url_override(
+        self,
+        mock_get_token: MagicMock,
+        mock_set_override: MagicMock,
+        update_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        mock_get_token.return_value = "tok"
+        update_client.submit_update.return_value = standup_response("created")
+
+        result = runner.invoke(
+            cli, ["--api-url", "https://staging.dailybot.com", "update", "test"], catch_exceptions=False
+        )
+        assert result.exit_code == 0
+        mock_set_override.assert_called_once_with("https://staging.dailybot.com")
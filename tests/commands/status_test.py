@@ -0,0 +1,112 @@
+"""Tests for `dailybot status`."""
+
+from typing import Iterator
+from unittest.mock import DEFAULT, MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from dailybot_cli.api_client import APIError
+from dailybot_cli.main import cli
+
+
+class TestStatusCommand:
+
+    @pytest.fixture(autouse=True)
+    def status_auth(self) -> Iterator[dict[str, MagicMock]]:
+        """Logged in with a token and no API key unless a test says otherwise."""
+        with patch.multiple(
+            "dailybot_cli.commands.status", get_token=DEFAULT, get_api_key=DEFAULT
+        ) as mocks:
+            mocks["get_token"].return_value = "tok"
+            mocks["get_api_key"].return_value = None
+            yield mocks
+
+    def test_status_with_checkins(
+        self, status_client: MagicMock, runner: CliRunner
+    ) -> None:
+        status_client.get_status.return_value = {
+            "count": 1,
+            "pending_checkins": [
+                {
+                    "followup_name": "Daily Standup",
+                    "template_questions": [
+                        {"question": "What did you do?", "is_blocker": False},
+                    ],
+                }
+            ],
+        }
+
+        result = runner.invoke(cli, ["status"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "Daily Standup" in result.output
+
+    def test_status_no_checkins(
+        self, status_client: MagicMock, runner: CliRunner
+    ) -> None:
+        status_client.get_status.return_value = {"count": 0, "pending_checkins": []}
+
+        result = runner.invoke(cli, ["status"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "No pending" in result.output
+
+    def test_status_auth_valid_login(
+        self, status_client: MagicMock, runner: CliRunner
+    ) -> None:
+        """--auth with valid OTP session shows login auth info."""
+        status_client.auth_status.return_value = {
+            "user": {"email": "user@test.com"},
+            "organization": {"name": "MyOrg", "uuid": "org-uuid"},
+        }
+
+        result = runner.invoke(cli, ["status", "--auth"], catch_exceptions=False)
+        output: str = result.output
+        assert result.exit_code == 0
+        assert "login (OTP)" in output
+        assert "user@test.com" in output
+        assert "MyOrg" in output
+
+    def test_status_auth_valid_api_key(
+        self,
+        status_auth: dict[str, MagicMock],
+        status_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """--auth falls back to API key when no login token."""
+        status_auth["get_token"].return_value = None
+        status_auth["get_api_key"].return_value = "sk-abc123"
+        status_client.get_agent_health.return_value = {"status": "healthy"}
+
+        result = runner.invoke(cli, ["status", "--auth"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "API key" in result.output
+        assert "sk-a****" in result.output
+
+    def test_status_auth_expired_login_falls_back_to_api_key(
+        self,
+        status_auth: dict[str, MagicMock],
+        status_client: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """--auth with expired login falls back to valid API key."""
+        status_auth["get_token"].return_value = "expired-tok"
+        status_auth["get_api_key"].return_value = "sk-xyz789"
+        status_client.auth_status.side_effect = APIError(401, "Unauthorized")
+        status_client.get_agent_health.return_value = {"status": "healthy"}
+
+        result = runner.invoke(cli, ["status", "--auth"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "invalid or expired" in result.output
+        assert "API key" in result.output
+
+    def test_status_auth_no_credentials(
+        self,
+        status_auth: dict[str, MagicMock],
+        runner: CliRunner,
+    ) -> None:
+        """--auth with no credentials shows error."""
+        status_auth["get_token"].return_value = None
+
+        result = runner.invoke(cli, ["status", "--auth"])
+        assert result.exit_code != 0
+        assert "Not authenticated" in result.output
@@ -0,0 +1,107 @@
+"""Tests for `dailybot update`."""
+
+from typing import Any, Iterator
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from dailybot_cli.api_client import APIError
+from dailybot_cli.commands.update import _prompt_message
+from dailybot_cli.main import cli
+from tests.helpers import standup_response
+
+
+# submit_update() results; the command only reads them, so tests share one copy.
+_RESP_ATTACHED = standup_response()
+_RESP_CREATED = standup_response("created")
+_RESP_UPDATED = standup_response("updated")
+_RESP_EMPTY: dict[str, Any] = {"followups_count": 0}
+
+
+class TestUpdateCommand:
+
+    @pytest.fixture(autouse=True)
+    def _logged_in(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("dailybot_cli.commands.update.get_token", lambda: "tok")
+
+    @pytest.mark.parametrize(
+        "response,expected",
+        [(_RESP_ATTACHED, "1 check-in"), (_RESP_CREATED, "Submitted"), (_RESP_UPDATED, "Updated")],
+        ids=["attached", "created", "updated"],
+    )
+    def test_update_message(
+        self,
+        update_client: MagicMock,
+        runner: CliRunner,
+        response: dict[str, Any],
+        expected: str,
+    ) -> None:
+        update_client.submit_update.return_value = response
+
+        result = runner.invoke(cli, ["update", "Finished auth module"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert expected in result.output
+
+    def test_update_from_piped_stdin(
+        self, update_client: MagicMock, runner: CliRunner
+    ) -> None:
+        update_client.submit_update.return_value = _RESP_EMPTY
+
+        result = runner.invoke(
+            cli, ["update"], input="Shipped auth.\n\nNext: tests.\n", catch_exceptions=False
+        )
+        assert result.exit_code == 0
+        update_client.submit_update.assert_called_once_with(
+            message="Shipped auth.\n\nNext: tests.", done=None, doing=None, blocked=None
+        )
+
+    def test_update_structured(
+        self, update_client: MagicMock, runner: CliRunner
+    ) -> None:
+        update_client.submit_update.return_value = _RESP_ATTACHED
+
+        result = runner.invoke(
+            cli, ["update", "--done", "Auth", "--doing", "Tests", "--blocked", "None"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        update_client.submit_update.assert_called_once_with(
+            message=None, done="Auth", doing="Tests", blocked="None"
+        )
+
+    def test_update_ai_processing_failed(
+        self, update_client: MagicMock, runner: CliRunner
+    ) -> None:
+        update_client.submit_update.side_effect = APIError(400, "AI processing failed for input")
+
+        result = runner.invoke(cli, ["update", "???"])
+        assert result.exit_code != 0
+        assert "could not process" in result.output
+        assert "support@dailybot.com" in result.output
+
+    def test_update_timeout(
+        self, update_client: MagicMock, runner: CliRunner
+    ) -> None:
+        update_client.submit_update.side_effect = httpx.ReadTimeout("timed out")
+
+        result = runner.invoke(cli, ["update", "test"])
+        assert result.exit_code != 0
+        assert "timed out" in result.output
+
+    def test_update_not_logged_in(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("dailybot_cli.commands.update.get_token", lambda: None)
+        result = runner.invoke(cli, ["update", "test"])
+        assert result.exit_code != 0
+
+    def test_prompt_message_enables_line_editing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        enable_line_editing: MagicMock = MagicMock()
+        monkeypatch.setattr("dailybot_cli.commands.update.enable_line_editing", enable_line_editing)
+        answers: Iterator[str] = iter(["Shipped auth.", ""])
+        monkeypatch.setattr("builtins.input", lambda: next(answers))
+
+        assert _prompt_message() == "Shipped auth."
+        enable_line_editing.assert_called_once_with()
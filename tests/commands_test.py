@@ -1,1680 +0,0 @@
-"""Tests for CLI commands."""
-
-from pathlib import Path
-from typing import Any
-from unittest.mock import MagicMock, patch
-
-import pytest
-from click.testing import CliRunner
-
-from dailybot_cli.api_client import APIError
-from dailybot_cli.main import cli
-
-
-@pytest.fixture
-def runner() -> CliRunner:
-    return CliRunner()
-
-
-class TestVersionAndHelp:
-
-    def test_version(self, runner: CliRunner) -> None:
-        from dailybot_cli import __version__
-
-        result = runner.invoke(cli, ["--version"])
-        assert result.exit_code == 0
-        assert "dailybot" in result.output
-        assert __version__ in result.output
-
-    def test_help(self, runner: CliRunner) -> None:
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-        assert "login" in result.output
-        assert "logout" in result.output
-        assert "update" in result.output
-        assert "status" in result.output
-        assert "agent" in result.output
-        assert "--api-url" in result.output
-
-    @patch("dailybot_cli.main.set_api_url_override")
-    @patch("dailybot_cli.commands.update.get_token")
-    @patch("dailybot_cli.commands.update.DailyBotClient")
-    def test_api_url_override(
-        self,
-        mock_client_cls: MagicMock,
-        mock_get_token: MagicMock,
-        mock_set_override: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_update.return_value = {
-            "followups_count": 1,
-            "attached_followups": [{"followup_name": "Standup", "action": "created"}],
-        }
-
-        result = runner.invoke(cli, ["--api-url", "https://staging.dailybot.com", "update", "test"])
-        assert result.exit_code == 0
-        mock_set_override.assert_called_once_with("https://staging.dailybot.com")
-
-
-class TestLoginCommand:
-
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    @patch("dailybot_cli.commands.auth.save_credentials")
-    def test_login_single_org(
-        self,
-        mock_save: MagicMock,
-        mock_client_cls: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.api_url = "https://api.dailybot.com"
-        mock_client.request_code.return_value = {
-            "detail": "Verification code sent to your email.",
-            "organizations": [{"id": 1, "name": "MyOrg", "uuid": "org-uuid-456"}],
-            "is_multi_org": False,
-        }
-        mock_client.verify_code.return_value = {
-            "requires_organization_selection": False,
-            "token": "tok123",
-            "user": {"email": "user@test.com"},
-            "organization": {"id": 1, "name": "MyOrg", "uuid": "org-uuid-456"},
-        }
-
-        result = runner.invoke(cli, ["login"], input="user@test.com\n123456\n")
-        assert result.exit_code == 0
-        assert "Logged in" in result.output
-        assert "MyOrg" in result.output
-        mock_save.assert_called_once()
-        # Single-org: verify is called once with organization_id
-        mock_client.verify_code.assert_called_once_with("user@test.com", "123456", organization_id=1)
-
-    @patch("dailybot_cli.commands.auth.questionary")
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    @patch("dailybot_cli.commands.auth.save_credentials")
-    def test_login_multi_org(
-        self,
-        mock_save: MagicMock,
-        mock_client_cls: MagicMock,
-        mock_questionary: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.api_url = "https://api.dailybot.com"
-        orgs = [
-            {"id": 1, "name": "Acme Corp", "uuid": "abc-123"},
-            {"id": 2, "name": "Side Project", "uuid": "def-456"},
-        ]
-        mock_client.request_code.return_value = {
-            "detail": "Verification code sent to your email.",
-            "organizations": orgs,
-            "is_multi_org": True,
-        }
-        mock_client.verify_code.return_value = {
-            "requires_organization_selection": False,
-            "token": "tok456",
-            "user": {"email": "user@test.com"},
-            "organization": {"id": 2, "name": "Side Project", "uuid": "def-456"},
-        }
-        # Mock questionary.select to return the second org
-        mock_questionary.select.return_value.ask.return_value = orgs[1]
-
-        # Enter email, code (org selection handled by questionary mock)
-        result = runner.invoke(cli, ["login"], input="user@test.com\n123456\n")
-        assert result.exit_code == 0
-        assert "Logged in" in result.output
-        assert "Side Project" in result.output
-        # Org selected before verify — single call with org_id
-        mock_client.verify_code.assert_called_once_with("user@test.com", "123456", organization_id=2)
-
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    def test_login_bad_email(
-        self, mock_client_cls: MagicMock, runner: CliRunner
-    ) -> None:
-        from dailybot_cli.api_client import APIError
-
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.request_code.side_effect = APIError(400, "No account found")
-
-        result = runner.invoke(cli, ["login"], input="bad@test.com\n")
-        assert result.exit_code != 0
-
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    @patch("dailybot_cli.commands.auth.save_credentials")
-    def test_login_non_interactive_verify(
-        self,
-        mock_save: MagicMock,
-        mock_client_cls: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """Non-interactive step 2: --email + --code verifies directly."""
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.api_url = "https://api.dailybot.com"
-        mock_client.verify_code.return_value = {
-            "token": "tok789",
-            "user": {"email": "user@test.com"},
-            "organization": {"id": 1, "name": "MyOrg", "uuid": "org-uuid"},
-        }
-
-        result = runner.invoke(
-            cli, ["login", "--email=user@test.com", "--code=123456"]
-        )
-        assert result.exit_code == 0
-        assert "Logged in" in result.output
-        mock_client.verify_code.assert_called_once_with(
-            "user@test.com", "123456", organization_id=None
-        )
-        mock_save.assert_called_once()
-        # request_code should NOT be called
-        mock_client.request_code.assert_not_called()
-
-    @patch("dailybot_cli.commands.auth.clear_org_cache")
-    @patch("dailybot_cli.commands.auth.load_org_cache")
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    @patch("dailybot_cli.commands.auth.save_credentials")
-    def test_login_non_interactive_verify_with_org(
-        self,
-        mock_save: MagicMock,
-        mock_client_cls: MagicMock,
-        mock_load_cache: MagicMock,
-        mock_clear_cache: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """Non-interactive step 2 with --org UUID resolves via cached org list."""
-        mock_load_cache.return_value = [
-            {"id": 1, "name": "Acme Corp", "uuid": "abc-123"},
-            {"id": 2, "name": "Side Project", "uuid": "def-456"},
-        ]
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.api_url = "https://api.dailybot.com"
-        mock_client.verify_code.return_value = {
-            "token": "tok999",
-            "user": {"email": "user@test.com"},
-            "organization": {"id": 2, "name": "Side Project", "uuid": "def-456"},
-        }
-
-        result = runner.invoke(
-            cli, ["login", "--email=user@test.com", "--code=654321", "--org=def-456"]
-        )
-        assert result.exit_code == 0
-        assert "Logged in" in result.output
-        assert "Side Project" in result.output
-        # Should NOT call request_code (would invalidate the OTP)
-        mock_client.request_code.assert_not_called()
-        # Single verify call with resolved integer ID
-        mock_client.verify_code.assert_called_once_with(
-            "user@test.com", "654321", organization_id=2
-        )
-        mock_clear_cache.assert_called_once()
-
-    @patch("dailybot_cli.commands.auth.load_org_cache")
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    def test_login_non_interactive_verify_with_bad_org_uuid(
-        self,
-        mock_client_cls: MagicMock,
-        mock_load_cache: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """Non-interactive --org with unknown UUID shows error and org list."""
-        mock_load_cache.return_value = [
-            {"id": 1, "name": "Acme Corp", "uuid": "abc-123"},
-        ]
-
-        result = runner.invoke(
-            cli, ["login", "--email=user@test.com", "--code=654321", "--org=wrong-uuid"]
-        )
-        assert result.exit_code != 0
-        assert "not found" in result.output
-        assert "Acme Corp" in result.output
-
-    @patch("dailybot_cli.commands.auth.load_org_cache")
-    def test_login_non_interactive_verify_with_org_no_cache(
-        self,
-        mock_load_cache: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """Non-interactive --org without cached org list tells user to run step 1."""
-        mock_load_cache.return_value = None
-
-        result = runner.invoke(
-            cli, ["login", "--email=user@test.com", "--code=654321", "--org=abc-123"]
-        )
-        assert result.exit_code != 0
-        assert "No cached organization list" in result.output
-
-    @patch("dailybot_cli.commands.auth.save_org_cache")
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    def test_login_non_interactive_request_code_multi_org(
-        self,
-        mock_client_cls: MagicMock,
-        mock_save_cache: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """Non-interactive step 1: --email requests code, prints orgs, caches org list."""
-        orgs = [
-            {"id": 1, "name": "Acme Corp", "uuid": "abc-123"},
-            {"id": 2, "name": "Side Project", "uuid": "def-456"},
-        ]
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.api_url = "https://api.dailybot.com"
-        mock_client.request_code.return_value = {
-            "detail": "Verification code sent.",
-            "organizations": orgs,
-            "is_multi_org": True,
-        }
-
-        result = runner.invoke(cli, ["login", "--email=user@test.com"])
-        assert result.exit_code == 0
-        assert "Verification code sent" in result.output
-        assert "Acme Corp" in result.output
-        assert "uuid: abc-123" in result.output
-        assert "Side Project" in result.output
-        assert "uuid: def-456" in result.output
-        assert "--code=CODE --org=ORG_UUID" in result.output
-        # Should cache org list for step 2
-        mock_save_cache.assert_called_once_with("user@test.com", orgs)
-        # Should NOT prompt for code
-        mock_client.verify_code.assert_not_called()
-
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    def test_login_non_interactive_verify_requires_org(
-        self,
-        mock_client_cls: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """Non-interactive verify without --org when multi-org: prints orgs and instruction."""
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.api_url = "https://api.dailybot.com"
-        mock_client.verify_code.return_value = {
-            "requires_organization_selection": True,
-            "organizations": [
-                {"id": 1, "name": "Acme Corp", "uuid": "abc-123"},
-                {"id": 2, "name": "Side Project", "uuid": "def-456"},
-            ],
-        }
-
-        result = runner.invoke(
-            cli, ["login", "--email=user@test.com", "--code=123456"]
-        )
-        assert result.exit_code != 0
-        assert "Acme Corp" in result.output
-        assert "Side Project" in result.output
-        assert "--org=ORG_UUID" in result.output
-
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    @patch("dailybot_cli.commands.auth.save_credentials")
-    def test_login_non_interactive_verify_auto_selects_single_org(
-        self,
-        mock_save: MagicMock,
-        mock_client_cls: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """Non-interactive verify auto-selects when only one org available."""
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.api_url = "https://api.dailybot.com"
-        # First call: requires org selection with 1 org
-        # Second call (retry with org_id): returns token
-        mock_client.verify_code.side_effect = [
-            {
-                "requires_organization_selection": True,
-                "organizations": [{"id": 1, "name": "MyOrg", "uuid": "org-uuid"}],
-            },
-            {
-                "token": "tok-auto",
-                "organization": {"id": 1, "name": "MyOrg", "uuid": "org-uuid"},
-            },
-        ]
-
-        result = runner.invoke(
-            cli, ["login", "--email=user@test.com", "--code=123456"]
-        )
-        assert result.exit_code == 0
-        assert "Auto-selecting organization: MyOrg" in result.output
-        assert "Logged in" in result.output
-        assert mock_client.verify_code.call_count == 2
-        mock_client.verify_code.assert_called_with("user@test.com", "123456", organization_id=1)
-
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    def test_login_non_interactive_request_code_single_org(
-        self,
-        mock_client_cls: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """Non-interactive step 1 with single org: prints instructions without --org."""
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.api_url = "https://api.dailybot.com"
-        mock_client.request_code.return_value = {
-            "detail": "Verification code sent.",
-            "organizations": [{"id": 1, "name": "MyOrg", "uuid": "org-uuid"}],
-            "is_multi_org": False,
-        }
-
-        result = runner.invoke(cli, ["login", "--email=user@test.com"])
-        assert result.exit_code == 0
-        assert "Verification code sent" in result.output
-        assert "--code=CODE" in result.output
-        assert "--org" not in result.output
-        mock_client.verify_code.assert_not_called()
-
-
-class TestLogoutCommand:
-
-    @patch("dailybot_cli.commands.auth.get_token")
-    @patch("dailybot_cli.commands.auth.clear_credentials")
-    @patch("dailybot_cli.commands.auth.DailyBotClient")
-    def test_logout(
-        self,
-        mock_client_cls: MagicMock,
-        mock_clear: MagicMock,
-        mock_get_token: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.logout.return_value = {}
-
-        result = runner.invoke(cli, ["logout"])
-        assert result.exit_code == 0
-        assert "Logged out" in result.output
-        mock_clear.assert_called_once()
-
-    @patch("dailybot_cli.commands.auth.get_token")
-    def test_logout_not_logged_in(
-        self, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_token.return_value = None
-        result = runner.invoke(cli, ["logout"])
-        assert result.exit_code == 0
-        assert "Not logged in" in result.output
-
-
-class TestUpdateCommand:
-
-    @patch("dailybot_cli.commands.update.get_token")
-    @patch("dailybot_cli.commands.update.DailyBotClient")
-    def test_update_message(
-        self, mock_client_cls: MagicMock, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_update.return_value = {
-            "followups_count": 1,
-            "attached_followups": [{"followup_name": "Standup"}],
-        }
-
-        result = runner.invoke(cli, ["update", "Finished auth module"])
-        assert result.exit_code == 0
-        assert "1 check-in" in result.output
-
-    @patch("dailybot_cli.commands.update.get_token")
-    @patch("dailybot_cli.commands.update.DailyBotClient")
-    def test_update_structured(
-        self, mock_client_cls: MagicMock, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_update.return_value = {
-            "followups_count": 1,
-            "attached_followups": [{"followup_name": "Standup"}],
-        }
-
-        result = runner.invoke(
-            cli, ["update", "--done", "Auth", "--doing", "Tests", "--blocked", "None"]
-        )
-        assert result.exit_code == 0
-        mock_client.submit_update.assert_called_once_with(
-            message=None, done="Auth", doing="Tests", blocked="None"
-        )
-
-    @patch("dailybot_cli.commands.update.get_token")
-    @patch("dailybot_cli.commands.update.DailyBotClient")
-    def test_update_shows_submitted_for_created(
-        self, mock_client_cls: MagicMock, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_update.return_value = {
-            "followups_count": 1,
-            "attached_followups": [{"followup_name": "Standup", "action": "created"}],
-        }
-
-        result = runner.invoke(cli, ["update", "Did some work"])
-        assert result.exit_code == 0
-        assert "Submitted" in result.output
-
-    @patch("dailybot_cli.commands.update.get_token")
-    @patch("dailybot_cli.commands.update.DailyBotClient")
-    def test_update_shows_updated_for_enriched(
-        self, mock_client_cls: MagicMock, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_update.return_value = {
-            "followups_count": 1,
-            "attached_followups": [{"followup_name": "Standup", "action": "updated"}],
-        }
-
-        result = runner.invoke(cli, ["update", "More progress"])
-        assert result.exit_code == 0
-        assert "Updated" in result.output
-
-    @patch("dailybot_cli.commands.update.get_token")
-    @patch("dailybot_cli.commands.update.DailyBotClient")
-    def test_update_ai_processing_failed(
-        self, mock_client_cls: MagicMock, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        from dailybot_cli.api_client import APIError
-
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_update.side_effect = APIError(400, "AI processing failed for input")
-
-        result = runner.invoke(cli, ["update", "???"])
-        assert result.exit_code != 0
-        assert "could not process" in result.output
-        assert "support@dailybot.com" in result.output
-
-    @patch("dailybot_cli.commands.update.get_token")
-    @patch("dailybot_cli.commands.update.DailyBotClient")
-    def test_update_timeout(
-        self, mock_client_cls: MagicMock, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        import httpx
-
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_update.side_effect = httpx.ReadTimeout("timed out")
-
-        result = runner.invoke(cli, ["update", "test"])
-        assert result.exit_code != 0
-        assert "timed out" in result.output
-
-    @patch("dailybot_cli.commands.update.get_token")
-    def test_update_not_logged_in(
-        self, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_token.return_value = None
-        result = runner.invoke(cli, ["update", "test"])
-        assert result.exit_code != 0
-
-
-class TestStatusCommand:
-
-    @patch("dailybot_cli.commands.status.get_token")
-    @patch("dailybot_cli.commands.status.DailyBotClient")
-    def test_status_with_checkins(
-        self, mock_client_cls: MagicMock, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_status.return_value = {
-            "count": 1,
-            "pending_checkins": [
-                {
-                    "followup_name": "Daily Standup",
-                    "template_questions": [
-                        {"question": "What did you do?", "is_blocker": False},
-                    ],
-                }
-            ],
-        }
-
-        result = runner.invoke(cli, ["status"])
-        assert result.exit_code == 0
-        assert "Daily Standup" in result.output
-
-    @patch("dailybot_cli.commands.status.get_token")
-    @patch("dailybot_cli.commands.status.DailyBotClient")
-    def test_status_no_checkins(
-        self, mock_client_cls: MagicMock, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_status.return_value = {"count": 0, "pending_checkins": []}
-
-        result = runner.invoke(cli, ["status"])
-        assert result.exit_code == 0
-        assert "No pending" in result.output
-
-    @patch("dailybot_cli.commands.status.get_token")
-    @patch("dailybot_cli.commands.status.DailyBotClient")
-    def test_status_auth_valid_login(
-        self, mock_client_cls: MagicMock, mock_get_token: MagicMock, runner: CliRunner
-    ) -> None:
-        """--auth with valid OTP session shows login auth info."""
-        mock_get_token.return_value = "tok"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.auth_status.return_value = {
-            "user": {"email": "user@test.com"},
-            "organization": {"name": "MyOrg", "uuid": "org-uuid"},
-        }
-
-        result = runner.invoke(cli, ["status", "--auth"])
-        assert result.exit_code == 0
-        assert "login (OTP)" in result.output
-        assert "user@test.com" in result.output
-        assert "MyOrg" in result.output
-
-    @patch("dailybot_cli.commands.status.get_api_key")
-    @patch("dailybot_cli.commands.status.get_token")
-    @patch("dailybot_cli.commands.status.DailyBotClient")
-    def test_status_auth_valid_api_key(
-        self,
-        mock_client_cls: MagicMock,
-        mock_get_token: MagicMock,
-        mock_get_api_key: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """--auth falls back to API key when no login token."""
-        mock_get_token.return_value = None
-        mock_get_api_key.return_value = "sk-abc123"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_agent_health.return_value = {"status": "healthy"}
-
-        result = runner.invoke(cli, ["status", "--auth"])
-        assert result.exit_code == 0
-        assert "API key" in result.output
-        assert "sk-a****" in result.output
-
-    @patch("dailybot_cli.commands.status.get_api_key")
-    @patch("dailybot_cli.commands.status.get_token")
-    @patch("dailybot_cli.commands.status.DailyBotClient")
-    def test_status_auth_expired_login_falls_back_to_api_key(
-        self,
-        mock_client_cls: MagicMock,
-        mock_get_token: MagicMock,
-        mock_get_api_key: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """--auth with expired login falls back to valid API key."""
-        from dailybot_cli.api_client import APIError
-
-        mock_get_token.return_value = "expired-tok"
-        mock_get_api_key.return_value = "sk-xyz789"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.auth_status.side_effect = APIError(401, "Unauthorized")
-        mock_client.get_agent_health.return_value = {"status": "healthy"}
-
-        result = runner.invoke(cli, ["status", "--auth"])
-        assert result.exit_code == 0
-        assert "invalid or expired" in result.output
-        assert "API key" in result.output
-
-    @patch("dailybot_cli.commands.status.get_api_key")
-    @patch("dailybot_cli.commands.status.get_token")
-    def test_status_auth_no_credentials(
-        self,
-        mock_get_token: MagicMock,
-        mock_get_api_key: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        """--auth with no credentials shows error."""
-        mock_get_token.return_value = None
-        mock_get_api_key.return_value = None
-
-        result = runner.invoke(cli, ["status", "--auth"])
-        assert result.exit_code != 0
-        assert "Not authenticated" in result.output
-
-
-class TestInteractiveLogin:
-
-    @patch("dailybot_cli.commands.interactive.questionary")
-    @patch("dailybot_cli.commands.interactive._do_login")
-    @patch("dailybot_cli.commands.interactive.load_credentials")
-    @patch("dailybot_cli.commands.interactive.get_token")
-    def test_interactive_guides_login_when_not_authenticated(
-        self,
-        mock_get_token: MagicMock,
-        mock_load_creds: MagicMock,
-        mock_do_login: MagicMock,
-        mock_questionary: MagicMock,
-        runner: CliRunner,
-    ) -> None:
-        # First call: not logged in; second call (after _do_login): return creds
-        mock_get_token.return_value = None
-        mock_load_creds.side_effect = [
-            None,
-            {"token": "tok", "email": "u@t.com", "organization": "Org"},
-        ]
-        # Mock questionary.select to return "Quit"
-        mock_questionary.select.return_value.ask.return_value = "Quit"
-        # Provide email for the prompt (code is handled inside _do_login which is mocked)
-        result = runner.invoke(cli, [], input="u@t.com\n")
-        mock_do_login.assert_called_once_with("u@t.com")
-
-
-class TestAgentCommand:
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_update(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_report.return_value = {"id": 1, "uuid": "abc"}
-
-        result = runner.invoke(
-            cli, ["agent", "update", "Deployed v2.1", "--name", "Claude Code"]
-        )
-        assert result.exit_code == 0
-        assert "Report submitted" in result.output
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_update_with_metadata(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_report.return_value = {"id": 2, "uuid": "def"}
-
-        result = runner.invoke(
-            cli, ["agent", "update", "Fixed login bug", "--name", "Claude Code",
-                  "--metadata", '{"repo": "api-services", "branch": "fix/login", "pr": "#142"}']
-        )
-        assert result.exit_code == 0
-        assert "Report submitted" in result.output
-        mock_client.submit_agent_report.assert_called_once_with(
-            agent_name="Claude Code",
-            content="Fixed login bug",
-            structured=None,
-            metadata={"repo": "api-services", "branch": "fix/login", "pr": "#142"},
-            is_milestone=False,
-            co_authors=None,
-        )
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    def test_agent_update_no_api_key(
-        self, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = None
-        result = runner.invoke(cli, ["agent", "update", "test"])
-        assert result.exit_code != 0
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_health_ok(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_health.return_value = {
-            "agent_name": "Claude Code",
-            "status": "healthy",
-            "last_check": "2025-01-01T00:00:00Z",
-            "history": [],
-        }
-
-        result = runner.invoke(
-            cli, ["agent", "health", "--ok", "--message", "All good", "--name", "Claude Code"]
-        )
-        assert result.exit_code == 0
-        assert "healthy" in result.output
-        assert "Claude Code" in result.output
-        mock_client.submit_agent_health.assert_called_once_with(
-            agent_name="Claude Code", ok=True, message="All good"
-        )
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_health_fail(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_health.return_value = {
-            "agent_name": "CI Bot",
-            "status": "unhealthy",
-            "last_check": "2025-01-01T00:00:00Z",
-            "history": [],
-        }
-
-        result = runner.invoke(
-            cli, ["agent", "health", "--fail", "--message", "DB down", "--name", "CI Bot"]
-        )
-        assert result.exit_code == 0
-        assert "unhealthy" in result.output
-        assert "CI Bot" in result.output
-        mock_client.submit_agent_health.assert_called_once_with(
-            agent_name="CI Bot", ok=False, message="DB down"
-        )
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_health_status(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_agent_health.return_value = {
-            "agent_name": "Claude Code",
-            "status": "healthy",
-            "last_check": "2025-01-01T00:00:00Z",
-            "history": [
-                {"timestamp": "2025-01-01T00:00:00Z", "status": "healthy", "message": "All good"},
-            ],
-        }
-
-        result = runner.invoke(
-            cli, ["agent", "health", "--status", "--name", "Claude Code"]
-        )
-        assert result.exit_code == 0
-        assert "healthy" in result.output
-        assert "Claude Code" in result.output
-        mock_client.get_agent_health.assert_called_once_with(agent_name="Claude Code")
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    def test_agent_health_no_api_key(
-        self, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = None
-        result = runner.invoke(cli, ["agent", "health", "--ok"])
-        assert result.exit_code != 0
-
-    def test_agent_health_no_flag(self, runner: CliRunner) -> None:
-        result = runner.invoke(cli, ["agent", "health"])
-        assert result.exit_code != 0
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_health_with_pending_messages(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_health.return_value = {
-            "agent_name": "Claude Code",
-            "status": "healthy",
-            "last_check": "2025-01-01T00:00:00Z",
-            "history": [],
-            "pending_messages": [
-                {
-                    "id": "uuid-1",
-                    "content": "Please review PR #42",
-                    "message_type": "text",
-                    "sender_type": "human",
-                    "sender_name": "John Doe",
-                    "created_at": "2025-01-01T00:00:00Z",
-                },
-                {
-                    "id": "uuid-2",
-                    "content": "New deployment ready",
-                    "message_type": "system",
-                    "sender_type": "system",
-                    "sender_name": None,
-                    "created_at": "2025-01-01T00:00:00Z",
-                },
-            ],
-        }
-
-        result = runner.invoke(
-            cli, ["agent", "health", "--ok", "--name", "Claude Code"]
-        )
-        assert result.exit_code == 0
-        assert "Pending messages from Dailybot (2)" in result.output
-        assert "[id:uuid-1]" in result.output
-        assert "Please review PR #42" in result.output
-        assert "John Doe:" in result.output
-        assert "[id:uuid-2]" in result.output
-        assert "New deployment ready" in result.output
-        assert "[system]:" in result.output
-        assert "dailybot agent message claim <id>" in result.output
-
-    # --- Webhook tests ---
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_webhook_register(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.register_agent_webhook.return_value = {
-            "agent_name": "Claude Code",
-            "webhook_url": "https://my-server.com/hook",
-        }
-
-        result = runner.invoke(
-            cli,
-            ["agent", "webhook", "register", "--url", "https://my-server.com/hook",
-             "--secret", "my-token", "--name", "Claude Code"],
-        )
-        assert result.exit_code == 0
-        assert "Webhook Registered" in result.output
-        assert "https://my-server.com/hook" in result.output
-        mock_client.register_agent_webhook.assert_called_once_with(
-            agent_name="Claude Code",
-            webhook_url="https://my-server.com/hook",
-            webhook_secret="my-token",
-        )
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_webhook_unregister(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.unregister_agent_webhook.return_value = {
-            "detail": "Webhook unregistered.",
-        }
-
-        result = runner.invoke(
-            cli, ["agent", "webhook", "unregister", "--name", "Claude Code"]
-        )
-        assert result.exit_code == 0
-        assert "Webhook unregistered" in result.output
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    def test_webhook_register_no_api_key(
-        self, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = None
-        result = runner.invoke(
-            cli, ["agent", "webhook", "register", "--url", "https://example.com/hook"]
-        )
-        assert result.exit_code != 0
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    def test_webhook_unregister_no_api_key(
-        self, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = None
-        result = runner.invoke(cli, ["agent", "webhook", "unregister"])
-        assert result.exit_code != 0
-
-    # --- Message tests ---
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_message_send(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.send_agent_message.return_value = {
-            "id": "msg-uuid",
-            "agent_name": "Claude Code",
-            "content": "Review PR #42",
-            "message_type": "text",
-            "sender_type": "agent",
-            "sender_name": "CLI Agent",
-            "delivered": False,
-            "created_at": "2025-01-01T00:00:00Z",
-        }
-
-        result = runner.invoke(
-            cli,
-            ["agent", "message", "send", "--to", "Claude Code", "--content", "Review PR #42"],
-        )
-        assert result.exit_code == 0
-        assert "Message Sent" in result.output
-        assert "Review PR #42" in result.output
-        assert "CLI Agent" in result.output
-        mock_client.send_agent_message.assert_called_once_with(
-            agent_name="Claude Code",
-            content="Review PR #42",
-            message_type=None,
-            metadata=None,
-            expires_at=None,
-            sender_type="agent",
-            sender_name="CLI Agent",
-        )
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_message_send_with_type(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.send_agent_message.return_value = {
-            "id": "msg-uuid",
-            "agent_name": "Claude Code",
-            "content": "Do X",
-            "message_type": "command",
-            "sender_type": "agent",
-            "sender_name": "My Bot",
-            "delivered": False,
-            "created_at": "2025-01-01T00:00:00Z",
-        }
-
-        result = runner.invoke(
-            cli,
-            ["agent", "message", "send", "--to", "Claude Code",
-             "--content", "Do X", "--type", "command", "--name", "My Bot"],
-        )
-        assert result.exit_code == 0
-        assert "Message Sent" in result.output
-        mock_client.send_agent_message.assert_called_once_with(
-            agent_name="Claude Code",
-            content="Do X",
-            message_type="command",
-            metadata=None,
-            expires_at=None,
-            sender_type="agent",
-            sender_name="My Bot",
-        )
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_message_list(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_agent_messages.return_value = [
-            {
-                "id": "msg-1",
-                "content": "Review PR #42",
-                "message_type": "text",
-                "sender_type": "human",
-                "sender_name": "John Doe",
-                "delivered": False,
-                "created_at": "2025-01-01T00:00:00Z",
-            },
-            {
-                "id": "msg-2",
-                "content": "Deploy done",
-                "message_type": "system",
-                "sender_type": "agent",
-                "sender_name": "CI Bot",
-                "delivered": True,
-                "created_at": "2025-01-01T01:00:00Z",
-            },
-        ]
-
-        result = runner.invoke(
-            cli, ["agent", "message", "list", "--name", "Claude Code"]
-        )
-        assert result.exit_code == 0
-        assert "Review PR #42" in result.output
-        assert "John Doe" in result.output
-        assert "Deploy done" in result.output
-        assert "CI Bot" in result.output
-        mock_client.get_agent_messages.assert_called_once_with(
-            agent_name="Claude Code", delivered=None
-        )
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_message_list_pending(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_agent_messages.return_value = []
-
-        result = runner.invoke(
-            cli, ["agent", "message", "list", "--name", "Claude Code", "--pending"]
-        )
-        assert result.exit_code == 0
-        assert "No messages" in result.output
-        mock_client.get_agent_messages.assert_called_once_with(
-            agent_name="Claude Code", delivered=False
-        )
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    def test_message_send_no_api_key(
-        self, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = None
-        result = runner.invoke(
-            cli, ["agent", "message", "send", "--to", "Bot", "--content", "hi"]
-        )
-        assert result.exit_code != 0
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    def test_message_list_no_api_key(
-        self, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = None
-        result = runner.invoke(cli, ["agent", "message", "list", "--name", "Bot"])
-        assert result.exit_code != 0
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_update_milestone(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_report.return_value = {
-            "id": 10, "is_milestone": True,
-        }
-
-        result = runner.invoke(
-            cli, ["agent", "update", "Big feature", "--milestone"]
-        )
-        assert result.exit_code == 0
-        assert "[Milestone]" in result.output
-        mock_client.submit_agent_report.assert_called_once_with(
-            agent_name="CLI Agent",
-            content="Big feature",
-            structured=None,
-            metadata=None,
-            is_milestone=True,
-            co_authors=None,
-        )
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_update_co_authors(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_report.return_value = {
-            "id": 11,
-            "co_authors": [
-                {"name": "Alice", "uuid": "a-uuid"},
-                {"name": "Bob", "uuid": "b-uuid"},
-            ],
-        }
-
-        result = runner.invoke(
-            cli, ["agent", "update", "Paired work",
-                  "--co-authors", "alice@co.com", "--co-authors", "bob@co.com"]
-        )
-        assert result.exit_code == 0
-        assert "Co-authors: Alice, Bob" in result.output
-        mock_client.submit_agent_report.assert_called_once_with(
-            agent_name="CLI Agent",
-            content="Paired work",
-            structured=None,
-            metadata=None,
-            is_milestone=False,
-            co_authors=["alice@co.com", "bob@co.com"],
-        )
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_update_co_authors_comma_separated(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_report.return_value = {
-            "id": 12,
-            "co_authors": [
-                {"name": "Alice", "uuid": "a-uuid"},
-                {"name": "Bob", "uuid": "b-uuid"},
-            ],
-        }
-
-        result = runner.invoke(
-            cli, ["agent", "update", "Paired work",
-                  "--co-authors", "alice@co.com,bob@co.com"]
-        )
-        assert result.exit_code == 0
-        assert "Co-authors: Alice, Bob" in result.output
-        mock_client.submit_agent_report.assert_called_once_with(
-            agent_name="CLI Agent",
-            content="Paired work",
-            structured=None,
-            metadata=None,
-            is_milestone=False,
-            co_authors=["alice@co.com", "bob@co.com"],
-        )
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_update_milestone_and_co_authors(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_report.return_value = {
-            "id": 13,
-            "is_milestone": True,
-            "co_authors": [{"name": "Alice", "uuid": "a-uuid"}],
-        }
-
-        result = runner.invoke(
-            cli, ["agent", "update", "Big feature", "--milestone",
-                  "--co-authors", "alice@co.com"]
-        )
-        assert result.exit_code == 0
-        assert "[Milestone]" in result.output
-        assert "Co-authors: Alice" in result.output
-        mock_client.submit_agent_report.assert_called_once_with(
-            agent_name="CLI Agent",
-            content="Big feature",
-            structured=None,
-            metadata=None,
-            is_milestone=True,
-            co_authors=["alice@co.com"],
-        )
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_agent_update_with_pending_messages(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_report.return_value = {
-            "id": 14,
-            "pending_messages": [
-                {
-                    "id": "uuid-1",
-                    "sender_type": "human",
-                    "sender_name": "John Doe",
-                    "content": "Please review PR #42",
-                },
-                {
-                    "id": "uuid-2",
-                    "sender_type": "system",
-                    "sender_name": "",
-                    "content": "New deployment ready",
-                },
-            ],
-        }
-
-        result = runner.invoke(
-            cli, ["agent", "update", "Did some work"]
-        )
-        assert result.exit_code == 0
-        assert "Report submitted" in result.output
-        assert "Pending messages from Dailybot (2)" in result.output
-        assert "[id:uuid-1]" in result.output
-        assert "John Doe:" in result.output
-        assert "Please review PR #42" in result.output
-        assert "[id:uuid-2]" in result.output
-        assert "New deployment ready" in result.output
-        assert "dailybot agent message claim <id>" in result.output
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    def test_agent_no_auth(
-        self, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = None
-        result = runner.invoke(cli, ["agent", "update", "test"])
-        assert result.exit_code != 0
-        assert "dailybot config key=" in result.output
-        assert "dailybot login" in result.output
-
-
-class TestAgentEmailCommand:
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_email_send(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.send_agent_email.return_value = {
-            "sent_count": 1,
-            "total_recipients": 1,
-            "reply_to": "ag-abc@mail.dailybot.com",
-        }
-
-        result = runner.invoke(
-            cli,
-            ["agent", "email", "send",
-             "--to", "user@example.com",
-             "--subject", "Build passed",
-             "--body-html", "<p>All green.</p>",
-             "--name", "Claude Code"],
-        )
-        assert result.exit_code == 0
-        assert "Email Sent" in result.output
-        assert "1 of 1" in result.output
-        assert "ag-abc@mail.dailybot.com" in result.output
-        mock_client.send_agent_email.assert_called_once_with(
-            agent_name="Claude Code",
-            to=["user@example.com"],
-            subject="Build passed",
-            body_html="<p>All green.</p>",
-            metadata=None,
-        )
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_email_send_multiple_recipients(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.send_agent_email.return_value = {
-            "sent_count": 2,
-            "total_recipients": 2,
-            "reply_to": "ag-abc@mail.dailybot.com",
-        }
-
-        result = runner.invoke(
-            cli,
-            ["agent", "email", "send",
-             "--to", "a@co.com", "--to", "b@co.com",
-             "--subject", "Report",
-             "--body-html", "<h1>Done</h1>",
-             "--name", "CI Bot"],
-        )
-        assert result.exit_code == 0
-        assert "2 of 2" in result.output
-        mock_client.send_agent_email.assert_called_once_with(
-            agent_name="CI Bot",
-            to=["a@co.com", "b@co.com"],
-            subject="Report",
-            body_html="<h1>Done</h1>",
-            metadata=None,
-        )
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_email_send_rate_limited(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        from dailybot_cli.api_client import APIError
-
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.send_agent_email.side_effect = APIError(
-            429, "Agent email hourly limit exceeded."
-        )
-
-        result = runner.invoke(
-            cli,
-            ["agent", "email", "send",
-             "--to", "user@example.com",
-             "--subject", "Test",
-             "--body-html", "<p>Hi</p>"],
-        )
-        assert result.exit_code != 0
-        assert "Hourly email limit exceeded" in result.output
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    def test_email_send_no_auth(
-        self, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = None
-        result = runner.invoke(
-            cli,
-            ["agent", "email", "send",
-             "--to", "user@example.com",
-             "--subject", "Test",
-             "--body-html", "<p>Hi</p>"],
-        )
-        assert result.exit_code != 0
-
-    @patch("dailybot_cli.commands.agent.get_default_profile", return_value=None)
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_email_send_with_metadata(
-        self, mock_client_cls: MagicMock, mock_get_auth: MagicMock, _mock_profile: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.send_agent_email.return_value = {
-            "sent_count": 1,
-            "total_recipients": 1,
-            "reply_to": "ag-abc@mail.dailybot.com",
-        }
-
-        result = runner.invoke(
-            cli,
-            ["agent", "email", "send",
-             "--to", "user@example.com",
-             "--subject", "Build",
-             "--body-html", "<p>Done</p>",
-             "--metadata", '{"pr": "#42"}'],
-        )
-        assert result.exit_code == 0
-        mock_client.send_agent_email.assert_called_once_with(
-            agent_name="CLI Agent",
-            to=["user@example.com"],
-            subject="Build",
-            body_html="<p>Done</p>",
-            metadata={"pr": "#42"},
-        )
-
-
-class TestConfigCommand:
-
-    @pytest.fixture(autouse=True)
-    def _tmp_config(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        config_dir: Path = tmp_path / ".config" / "dailybot"
-        monkeypatch.setattr("dailybot_cli.config.CONFIG_DIR", config_dir)
-        monkeypatch.setattr("dailybot_cli.config.CONFIG_FILE", config_dir / "config.json")
-        monkeypatch.setattr("dailybot_cli.config.CREDENTIALS_FILE", config_dir / "credentials.json")
-
-    def test_config_set_key(self, runner: CliRunner) -> None:
-        result = runner.invoke(cli, ["config", "key=abc123"])
-        assert result.exit_code == 0
-        assert "API key saved" in result.output
-        assert "abc1****" in result.output
-
-    def test_config_show_key(self, runner: CliRunner) -> None:
-        runner.invoke(cli, ["config", "key=secretkey99"])
-        result = runner.invoke(cli, ["config", "key"])
-        assert result.exit_code == 0
-        assert "secr****" in result.output
-
-    def test_config_show_key_not_set(self, runner: CliRunner) -> None:
-        result = runner.invoke(cli, ["config", "key"])
-        assert result.exit_code == 0
-        assert "not set" in result.output
-
-    def test_config_unset_key(self, runner: CliRunner) -> None:
-        runner.invoke(cli, ["config", "key=abc123"])
-        result = runner.invoke(cli, ["config", "key="])
-        assert result.exit_code == 0
-        assert "removed" in result.output
-
-    def test_config_unknown_setting(self, runner: CliRunner) -> None:
-        result = runner.invoke(cli, ["config", "foo=bar"])
-        assert result.exit_code != 0
-        assert "Unknown setting" in result.output
-
-
-class TestAgentConfigure:
-
-    @patch("dailybot_cli.commands.agent.get_token")
-    @patch("dailybot_cli.commands.agent.save_agent_profile")
-    def test_configure_otp_only(
-        self, mock_save: MagicMock, mock_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_token.return_value = "tok"
-        result = runner.invoke(cli, ["agent", "configure", "--name", "Claude Code"])
-        assert result.exit_code == 0
-        assert "configured" in result.output
-        mock_save.assert_called_once_with("claude-code", agent_name="Claude Code", api_key=None)
-
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    @patch("dailybot_cli.commands.agent.save_agent_profile")
-    def test_configure_with_key(
-        self, mock_save: MagicMock, mock_client_cls: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_agent_health.return_value = {"status": "healthy"}
-        result = runner.invoke(cli, ["agent", "configure", "--name", "CI Bot", "--key", "abc123"])
-        assert result.exit_code == 0
-        assert "configured" in result.output
-        mock_save.assert_called_once_with("ci-bot", agent_name="CI Bot", api_key="abc123")
-
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_configure_invalid_key(
-        self, mock_client_cls: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_agent_health.side_effect = APIError(401, "Unauthorized")
-        result = runner.invoke(cli, ["agent", "configure", "--name", "Bot", "--key", "bad"])
-        assert result.exit_code != 0
-        assert "invalid" in result.output.lower()
-
-    @patch("dailybot_cli.commands.agent.get_token")
-    def test_configure_no_key_no_login(
-        self, mock_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_token.return_value = None
-        result = runner.invoke(cli, ["agent", "configure", "--name", "Bot"])
-        assert result.exit_code != 0
-
-    @patch("dailybot_cli.commands.agent.get_token")
-    @patch("dailybot_cli.commands.agent.save_agent_profile")
-    def test_configure_custom_profile_name(
-        self, mock_save: MagicMock, mock_token: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_token.return_value = "tok"
-        result = runner.invoke(cli, ["agent", "configure", "--name", "Claude Code", "--profile", "myprofile"])
-        assert result.exit_code == 0
-        mock_save.assert_called_once_with("myprofile", agent_name="Claude Code", api_key=None)
-
-
-class TestAgentProfiles:
-
-    @patch("dailybot_cli.commands.agent.list_profiles")
-    @patch("dailybot_cli.commands.agent.load_agents")
-    def test_profiles_list(
-        self, mock_load: MagicMock, mock_list: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_list.return_value = [
-            {"profile": "claude-code", "agent_name": "Claude Code", "has_key": True, "is_default": True},
-            {"profile": "ci-bot", "agent_name": "CI Bot", "has_key": False, "is_default": False},
-        ]
-        mock_load.return_value = {
-            "profiles": {
-                "claude-code": {"agent_name": "Claude Code", "api_key": "abcdef1234"},
-                "ci-bot": {"agent_name": "CI Bot"},
-            },
-            "default": "claude-code",
-        }
-        result = runner.invoke(cli, ["agent", "profiles"])
-        assert result.exit_code == 0
-        assert "Claude Code" in result.output
-        assert "CI Bot" in result.output
-
-    @patch("dailybot_cli.commands.agent.load_agents")
-    @patch("dailybot_cli.commands.agent.list_profiles")
-    def test_profiles_empty(
-        self, mock_list: MagicMock, mock_load: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_list.return_value = []
-        mock_load.return_value = {}
-        result = runner.invoke(cli, ["agent", "profiles"])
-        assert result.exit_code == 0
-        assert "No agent profiles" in result.output
-
-
-class TestAgentProfileAuth:
-
-    @patch("dailybot_cli.commands.agent.get_profile")
-    @patch("dailybot_cli.commands.agent.get_default_profile")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_update_uses_profile(
-        self, mock_client_cls: MagicMock, mock_default: MagicMock, mock_get: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get.return_value = {"profile": "test", "agent_name": "Test Agent", "api_key": "key123"}
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_report.return_value = {"id": 1}
-        result = runner.invoke(cli, ["agent", "--profile", "test", "update", "did stuff"])
-        assert result.exit_code == 0
-        mock_client.submit_agent_report.assert_called_once()
-        call_kwargs = mock_client.submit_agent_report.call_args[1]
-        assert call_kwargs["agent_name"] == "Test Agent"
-
-    @patch("dailybot_cli.commands.agent.get_default_profile")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_update_uses_default_profile(
-        self, mock_client_cls: MagicMock, mock_default: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_default.return_value = {"profile": "default", "agent_name": "Default Agent", "api_key": "k1"}
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_report.return_value = {"id": 1}
-        result = runner.invoke(cli, ["agent", "update", "did stuff"])
-        assert result.exit_code == 0
-        call_kwargs = mock_client.submit_agent_report.call_args[1]
-        assert call_kwargs["agent_name"] == "Default Agent"
-
-    @patch("dailybot_cli.commands.agent.get_default_profile")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_name_flag_overrides_profile(
-        self, mock_client_cls: MagicMock, mock_default: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_default.return_value = {"profile": "default", "agent_name": "Default Agent", "api_key": "k1"}
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_report.return_value = {"id": 1}
-        result = runner.invoke(cli, ["agent", "update", "did stuff", "--name", "Override"])
-        assert result.exit_code == 0
-        call_kwargs = mock_client.submit_agent_report.call_args[1]
-        assert call_kwargs["agent_name"] == "Override"
-
-    @patch("dailybot_cli.commands.agent.get_profile")
-    def test_profile_not_found(
-        self, mock_get: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_get.return_value = None
-        result = runner.invoke(cli, ["agent", "--profile", "nope", "update", "test"])
-        assert result.exit_code != 0
-        assert "not found" in result.output
-
-
-class TestAgentRegister:
-
-    @patch("dailybot_cli.commands.agent.save_agent_profile")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_register_success(
-        self, mock_client_cls: MagicMock, mock_save: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_registration_challenge.return_value = {
-            "challenge_id": "ch-1",
-            "instruction": "The registration code for this session is 1234. To confirm you are a reasoning agent and not a script, respond with a JSON object containing two fields: 'reason' (one sentence explaining why this agent needs a DailyBot account) and 'answer' (the registration code multiplied by the number of words in this instruction).",
-            "expires_in": 300,
-        }
-        mock_client.register_agent.return_value = {
-            "api_key": "new-key-123",
-            "agent_name": "Claude Code",
-            "agent_email": "claude-code@mail.dailybot.co",
-            "org_name": "My Startup",
-            "claim_url": "https://app.dailybot.com/claim/abc123",
-        }
-        result = runner.invoke(cli, [
-            "agent", "register",
-            "--org-name", "My Startup",
-            "--agent-name", "Claude Code",
-            "--email", "me@co.com",
-        ])
-        assert result.exit_code == 0
-        assert "Registered" in result.output
-        assert "claude-code@mail.dailybot.co" in result.output
-        assert "claim" in result.output.lower()
-        mock_client.register_agent.assert_called_once_with(
-            challenge_id="ch-1",
-            answer=1234 * 52,
-            reason="Agent 'Claude Code' registering for org 'My Startup'",
-            org_name="My Startup",
-            agent_name="Claude Code",
-            contact_email="me@co.com",
-            timezone="UTC",
-        )
-        mock_save.assert_called_once_with("claude-code", agent_name="Claude Code", api_key="new-key-123", agent_email="claude-code@mail.dailybot.co")
-
-    @patch("dailybot_cli.commands.agent.save_agent_profile")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_register_without_email(
-        self, mock_client_cls: MagicMock, mock_save: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_registration_challenge.return_value = {
-            "challenge_id": "ch-1",
-            "instruction": "The registration code for this session is 1234. To confirm you are a reasoning agent and not a script, respond with a JSON object containing two fields: 'reason' (one sentence explaining why this agent needs a DailyBot account) and 'answer' (the registration code multiplied by the number of words in this instruction).",
-            "expires_in": 300,
-        }
-        mock_client.register_agent.return_value = {
-            "api_key": "key-1",
-            "agent_name": "Bot",
-            "agent_email": "bot@mail.dailybot.co",
-            "org_name": "Org",
-            "claim_url": "https://app.dailybot.com/claim/xyz",
-        }
-        result = runner.invoke(cli, [
-            "agent", "register",
-            "--org-name", "Org",
-            "--agent-name", "Bot",
-        ])
-        assert result.exit_code == 0
-        mock_client.register_agent.assert_called_once_with(
-            challenge_id="ch-1",
-            answer=1234 * 52,
-            reason="Agent 'Bot' registering for org 'Org'",
-            org_name="Org",
-            agent_name="Bot",
-            contact_email=None,
-            timezone="UTC",
-        )
-
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_register_challenge_expired_retries(
-        self, mock_client_cls: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_client: MagicMock = mock_client_cls.return_value
-        challenge: dict[str, Any] = {
-            "challenge_id": "ch-1",
-            "instruction": "The registration code for this session is 2000. To confirm you are a reasoning agent and not a script, respond with a JSON object containing two fields: 'reason' (one sentence explaining why this agent needs a DailyBot account) and 'answer' (the registration code multiplied by the number of words in this instruction).",
-            "expires_in": 300,
-        }
-        mock_client.get_registration_challenge.return_value = challenge
-        mock_client.register_agent.side_effect = [
-            APIError(400, "Challenge expired"),
-            {"api_key": "k", "agent_name": "A", "org_name": "O", "claim_url": "https://app.dailybot.com/claim/x"},
-        ]
-        with patch("dailybot_cli.commands.agent.save_agent_profile"):
-            result = runner.invoke(cli, [
-                "agent", "register",
-                "--org-name", "O", "--agent-name", "A", "--email", "a@b.com",
-            ])
-        assert result.exit_code == 0
-        assert "Registered" in result.output
-
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_register_rate_limited(
-        self, mock_client_cls: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.get_registration_challenge.return_value = {
-            "challenge_id": "ch-1",
-            "instruction": "The registration code for this session is 5000. To confirm.",
-            "expires_in": 300,
-        }
-        mock_client.register_agent.side_effect = APIError(429, "Too many requests")
-        result = runner.invoke(cli, [
-            "agent", "register",
-            "--org-name", "O", "--agent-name", "A", "--email", "a@b.com",
-        ])
-        assert result.exit_code != 0
-        assert "Rate limited" in result.output
-
-
-class TestAgentMessageClaim:
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.get_default_profile")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_claim_messages(
-        self, mock_client_cls: MagicMock, mock_default: MagicMock, mock_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_default.return_value = None
-        mock_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.mark_agent_messages_read.return_value = {"updated": 2}
-        result = runner.invoke(cli, ["agent", "message", "claim", "uuid-1", "uuid-2"])
-        assert result.exit_code == 0
-        assert "2 message(s)" in result.output
-        mock_client.mark_agent_messages_read.assert_called_once_with(message_ids=["uuid-1", "uuid-2"])
-
-    @patch("dailybot_cli.commands.agent.get_agent_auth")
-    @patch("dailybot_cli.commands.agent.get_default_profile")
-    @patch("dailybot_cli.commands.agent.DailyBotClient")
-    def test_claim_all(
-        self, mock_client_cls: MagicMock, mock_default: MagicMock, mock_auth: MagicMock, runner: CliRunner
-    ) -> None:
-        mock_default.return_value = None
-        mock_auth.return_value = "api_key"
-        mock_client: MagicMock = mock_client_cls.return_value
-        mock_client.submit_agent_health.return_value = {
-            "agent_name": "CLI Agent", "status": "healthy", "last_check": "now",
-        }
-        result = runner.invoke(cli, ["agent", "message", "claim-all"])
-        assert result.exit_code == 0
-        assert "delivered" in result.output.lower()
-        mock_client.submit_agent_health.assert_called_once_with(
-            agent_name="CLI Agent", ok=True, message=None,
-        )
@@ -3,8 +3,7 @@
 import json
 import os
 from pathlib import Path
-from typing import Any, Optional
-from unittest import mock
+from typing import Any, Iterator, Optional
 
 import pytest
 
@@ -14,25 +13,63 @@ from dailybot_cli.config import (
     get_api_key,
     get_api_url,
     get_token,
+    invalidate_config_cache,
     load_config,
     load_credentials,
     save_config,
     save_credentials,
+    set_api_url_override,
 )
 
 
 @pytest.fixture
-def tmp_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
-    """Override config paths to use a temp directory."""
-    config_dir: Path = tmp_path / ".config" / "dailybot"
+def tmp_config(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Override config paths to use a fresh temp directory."""
+    config_dir: Path = tmp_path_factory.mktemp("home") / ".config" / "dailybot"
     creds_file: Path = config_dir / "credentials.json"
     config_file: Path = config_dir / "config.json"
     monkeypatch.setattr("dailybot_cli.config.CONFIG_DIR", config_dir)
     monkeypatch.setattr("dailybot_cli.config.CREDENTIALS_FILE", creds_file)
     monkeypatch.setattr("dailybot_cli.config.CONFIG_FILE", config_file)
+    monkeypatch.setattr("dailybot_cli.config.ETAG_CACHE_FILE", config_dir / "etag_cache.json")
     return config_dir
 
 
+@pytest.fixture(scope="class")
+def shared_tmp_config(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Point config paths at one temp directory for a whole test class."""
+    config_dir: Path = tmp_path_factory.mktemp("home") / ".config" / "dailybot"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("dailybot_cli.config.CONFIG_DIR", config_dir)
+        mp.setattr("dailybot_cli.config.CREDENTIALS_FILE", config_dir / "credentials.json")
+        mp.setattr("dailybot_cli.config.CONFIG_FILE", config_dir / "config.json")
+        yield config_dir
+
+
+@pytest.mark.usefixtures("shared_tmp_config")
+class TestReadOnlyAccessors:
+    """Lookups that never write, so one config dir serves the whole class."""
+
+    def test_load_credentials_no_file(self) -> None:
+        assert load_credentials() is None
+
+    @pytest.mark.parametrize(
+        "env,expected",
+        [(None, "https://api.dailybot.com"), ("http://localhost:8600/", "http://localhost:8600")],
+    )
+    def test_get_api_url(
+        self, monkeypatch: pytest.MonkeyPatch, env: Optional[str], expected: str
+    ) -> None:
+        if env:
+            monkeypatch.setenv("DAILYBOT_API_URL", env)
+        else:
+            monkeypatch.delenv("DAILYBOT_API_URL", raising=False)
+        assert get_api_url() == expected
+
+    def test_load_config_no_file(self) -> None:
+        assert load_config() == {}
+
+
 def test_save_and_load_credentials(tmp_config: Path) -> None:
     save_credentials(
         token="tok123",
@@ -46,10 +83,31 @@ def test_save_and_load_credentials(tmp_config: Path) -> None:
     assert creds["email"] == "user@example.com"
     assert creds["organization"] == "MyOrg"
     assert creds["organization_uuid"] == "org-uuid-42"
+    assert os.stat(tmp_config / "credentials.json").st_mode & 0o777 == 0o600
 
 
-def test_load_credentials_no_file(tmp_config: Path) -> None:
-    assert load_credentials() is None
+def test_credentials_written_compact(tmp_config: Path) -> None:
+    save_credentials(token="tok", email="e", organization="o", organization_uuid="u")
+    raw: bytes = (tmp_config / "credentials.json").read_bytes()
+    assert b"\n" not in raw and b": " not in raw
+    assert json.loads(raw)["token"] == "tok"
+    assert sorted(p.name for p in tmp_config.iterdir()) == ["credentials.json"]
+
+
+def test_failed_save_keeps_previous_file_and_no_temp(
+    tmp_config: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    save_credentials(token="old", email="e", organization="o", organization_uuid="u")
+
+    def fail_replace(src: str, dst: Path) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("dailybot_cli.config.os.replace", fail_replace)
+    with pytest.raises(OSError):
+        save_credentials(token="new", email="e", organization="o", organization_uuid="u")
+
+    assert sorted(p.name for p in tmp_config.iterdir()) == ["credentials.json"]
+    assert json.loads((tmp_config / "credentials.json").read_bytes())["token"] == "old"
 
 
 def test_clear_credentials(tmp_config: Path) -> None:
@@ -58,54 +116,78 @@ def test_clear_credentials(tmp_config: Path) -> None:
     assert load_credentials() is None
 
 
-def test_get_api_url_default(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_get_api_url_follows_override_and_saved_credentials(
+    tmp_config: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     monkeypatch.delenv("DAILYBOT_API_URL", raising=False)
+    monkeypatch.setattr("dailybot_cli.config._api_url_override", None)
     assert get_api_url() == "https://api.dailybot.com"
-
-
-def test_get_api_url_from_env(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("DAILYBOT_API_URL", "http://localhost:8600/")
-    assert get_api_url() == "http://localhost:8600"
-
-
-def test_get_token_from_env(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    save_credentials(
+        token="t", email="e", organization="o", organization_uuid="u", api_url="http://saved"
+    )
+    assert get_api_url() == "http://saved"
+    set_api_url_override("http://flag/")
+    assert get_api_url() == "http://flag"
+
+
+@pytest.mark.parametrize(
+    "env,stored,expected",
+    [
+        ("env_token", None, "env_token"),
+        (None, "file_token", "file_token"),
+        ("env_token", "file_token", "env_token"),
+        (None, None, None),
+    ],
+)
+def test_get_token_precedence(
+    tmp_config: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    env: Optional[str],
+    stored: Optional[str],
+    expected: Optional[str],
+) -> None:
+    if env:
+        monkeypatch.setenv("DAILYBOT_CLI_TOKEN", env)
+    else:
+        monkeypatch.delenv("DAILYBOT_CLI_TOKEN", raising=False)
+    if stored:
+        save_credentials(token=stored, email="e", organization="o", organization_uuid="uuid-1")
+    assert get_token() == expected
+
+
+def test_get_token_cached_until_credentials_change(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DAILYBOT_CLI_TOKEN", raising=False)
+    save_credentials(token="first", email="e", organization="o", organization_uuid="uuid-1")
+    assert get_token() == "first"
     monkeypatch.setenv("DAILYBOT_CLI_TOKEN", "env_token")
+    assert get_token() == "first"
+    clear_credentials()
     assert get_token() == "env_token"
 
 
-def test_get_token_from_credentials(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("DAILYBOT_CLI_TOKEN", raising=False)
-    save_credentials(token="file_token", email="e", organization="o", organization_uuid="uuid-1")
-    assert get_token() == "file_token"
-
-
-def test_get_api_key_from_env(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("DAILYBOT_API_KEY", "apikey123")
-    assert get_api_key() == "apikey123"
-
-
-def test_get_api_key_not_set(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("DAILYBOT_API_KEY", raising=False)
-    assert get_api_key() is None
-
-
-def test_get_api_key_from_config(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("DAILYBOT_API_KEY", raising=False)
-    save_config({"api_key": "stored-key"})
-    assert get_api_key() == "stored-key"
-
-
-def test_get_api_key_env_overrides_config(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("DAILYBOT_API_KEY", "env-key")
-    save_config({"api_key": "stored-key"})
-    assert get_api_key() == "env-key"
-
-
-def test_credentials_file_permissions(tmp_config: Path) -> None:
-    save_credentials(token="t", email="e", organization="o", organization_uuid="uuid-1")
-    creds_file: Path = tmp_config / "credentials.json"
-    mode: int = os.stat(creds_file).st_mode & 0o777
-    assert mode == 0o600
+@pytest.mark.parametrize(
+    "env,stored,expected",
+    [
+        ("env-key", None, "env-key"),
+        (None, "stored-key", "stored-key"),
+        ("env-key", "stored-key", "env-key"),
+        (None, None, None),
+    ],
+)
+def test_get_api_key_precedence(
+    tmp_config: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    env: Optional[str],
+    stored: Optional[str],
+    expected: Optional[str],
+) -> None:
+    if env:
+        monkeypatch.setenv("DAILYBOT_API_KEY", env)
+    else:
+        monkeypatch.delenv("DAILYBOT_API_KEY", raising=False)
+    if stored:
+        save_config({"api_key": stored})
+    assert get_api_key() == expected
 
 
 # --- Config storage tests ---
@@ -115,10 +197,16 @@ def test_save_and_load_config(tmp_config: Path) -> None:
     save_config({"api_key": "abc123"})
     data: dict[str, Any] = load_config()
     assert data["api_key"] == "abc123"
+    assert os.stat(tmp_config / "config.json").st_mode & 0o777 == 0o600
 
 
-def test_load_config_no_file(tmp_config: Path) -> None:
-    assert load_config() == {}
+def test_load_config_read_once_until_saved(tmp_config: Path) -> None:
+    save_config({"api_key": "abc123"})
+    load_config()["api_key"] = "mutated"
+    (tmp_config / "config.json").write_text(json.dumps({"api_key": "on_disk"}))
+    assert load_config()["api_key"] == "abc123"
+    invalidate_config_cache()
+    assert load_config()["api_key"] == "on_disk"
 
 
 def test_save_config_merges(tmp_config: Path) -> None:
@@ -137,30 +225,26 @@ def test_save_config_removes_none(tmp_config: Path) -> None:
     assert data["other"] == "val"
 
 
-def test_config_file_permissions(tmp_config: Path) -> None:
-    save_config({"api_key": "secret"})
-    config_file: Path = tmp_config / "config.json"
-    mode: int = os.stat(config_file).st_mode & 0o777
-    assert mode == 0o600
-
-
 # --- get_agent_auth tests ---
 
 
-def test_get_agent_auth_api_key(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("DAILYBOT_API_KEY", "key")
-    monkeypatch.delenv("DAILYBOT_CLI_TOKEN", raising=False)
-    assert get_agent_auth() == "api_key"
-
-
-def test_get_agent_auth_bearer(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("DAILYBOT_API_KEY", raising=False)
+@pytest.mark.parametrize(
+    "api_key,token_file,expected",
+    [("key", False, "api_key"), (None, True, "bearer"), (None, False, None)],
+)
+def test_get_agent_auth(
+    tmp_config: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    api_key: Optional[str],
+    token_file: bool,
+    expected: Optional[str],
+) -> None:
     monkeypatch.delenv("DAILYBOT_CLI_TOKEN", raising=False)
-    save_credentials(token="tok", email="e", organization="o", organization_uuid="uuid-1")
-    assert get_agent_auth() == "bearer"
+    if api_key:
+        monkeypatch.setenv("DAILYBOT_API_KEY", api_key)
+    else:
+        monkeypatch.delenv("DAILYBOT_API_KEY", raising=False)
+    if token_file:
+        save_credentials(token="tok", email="e", organization="o", organization_uuid="uuid-1")
+    assert get_agent_auth() == expected
 
-
-def test_get_agent_auth_none(tmp_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("DAILYBOT_API_KEY", raising=False)
-    monkeypatch.delenv("DAILYBOT_CLI_TOKEN", raising=False)
-    assert get_agent_auth() is None
@@ -0,0 +1,107 @@
+"""Shared pytest fixtures; plain helpers live in tests/helpers.py."""
+
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator
+from unittest.mock import DEFAULT, MagicMock, create_autospec, patch
+
+import pytest
+from click.testing import CliRunner
+
+from dailybot_cli.api_client import DailyBotClient
+from dailybot_cli.config import invalidate_config_cache
+from tests.helpers import StubClient
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config_cache() -> Iterator[None]:
+    """Each test starts and ends without memoized env/credential lookups."""
+    invalidate_config_cache()
+    yield
+    invalidate_config_cache()
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip the GET retry backoff so error-path tests never actually wait."""
+    # Swap the module's ``time`` rather than ``time.sleep`` itself, so the
+    # no-op cannot leak into pytest or xdist threads running alongside.
+    monkeypatch.setattr("dailybot_cli.api_client.time", SimpleNamespace(sleep=lambda seconds: None))
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    # CliRunner keeps no state between invoke() calls, so one serves every test.
+    return CliRunner()
+
+
+# Autospeccing DailyBotClient costs far more than resetting a mock, so every
+# client fixture hands out this one instance and resets it after the test.
+_CLIENT_TEMPLATE: MagicMock = create_autospec(DailyBotClient, instance=True)
+_CLIENT_ATTRS: dict[str, Any] = {
+    name: getattr(_CLIENT_TEMPLATE, name) for name in ("api_url", "token", "api_key", "timeout")
+}
+
+
+@pytest.fixture
+def _client() -> Iterator[MagicMock]:
+    """The shared autospecced DailyBotClient instance, reset after each test."""
+    yield _CLIENT_TEMPLATE
+    _CLIENT_TEMPLATE.reset_mock(return_value=True, side_effect=True)
+    for name, value in _CLIENT_ATTRS.items():
+        setattr(_CLIENT_TEMPLATE, name, value)
+
+
+def _mock_client(monkeypatch: pytest.MonkeyPatch, module: str, client: MagicMock) -> MagicMock:
+    """Make ``DailyBotClient`` in a command module construct *client*."""
+    client_cls = MagicMock(name="DailyBotClient", return_value=client)
+    monkeypatch.setattr(f"dailybot_cli.commands.{module}.DailyBotClient", client_cls)
+    return client
+
+
+@pytest.fixture
+def update_client(monkeypatch: pytest.MonkeyPatch, _client: MagicMock) -> MagicMock:
+    """Mocked DailyBotClient instance used by `dailybot update`."""
+    return _mock_client(monkeypatch, "update", _client)
+
+
+@pytest.fixture
+def status_client(monkeypatch: pytest.MonkeyPatch, _client: MagicMock) -> MagicMock:
+    """Mocked DailyBotClient instance used by `dailybot status`."""
+    return _mock_client(monkeypatch, "status", _client)
+
+
+@pytest.fixture
+def auth_client(monkeypatch: pytest.MonkeyPatch, _client: MagicMock) -> MagicMock:
+    """Mocked DailyBotClient instance used by `dailybot login`/`logout`."""
+    return _mock_client(monkeypatch, "auth", _client)
+
+
+@pytest.fixture
+def agent_mocks(_client: MagicMock) -> Iterator[dict[str, MagicMock]]:
+    """Patch `dailybot agent` auth, profile and client lookups in one go.
+
+    Defaults to an API-key session with no default profile; tests override
+    ``agent_mocks["get_agent_auth"].return_value`` and friends as needed.
+    """
+    with patch.multiple(
+        "dailybot_cli.commands.agent",
+        get_agent_auth=DEFAULT,
+        get_default_profile=DEFAULT,
+        DailyBotClient=DEFAULT,
+    ) as mocks:
+        mocks["get_agent_auth"].return_value = "api_key"
+        mocks["get_default_profile"].return_value = None
+        mocks["DailyBotClient"].return_value = _client
+        yield mocks
+
+
+@pytest.fixture
+def stub_client_factory(agent_mocks: dict[str, MagicMock]) -> Callable[..., StubClient]:
+    """Build a StubClient and hand it to `dailybot agent` commands."""
+
+    def factory(**responses: Any) -> StubClient:
+        stub = StubClient(**responses)
+        agent_mocks["DailyBotClient"].return_value = stub
+        return stub
+
+    return factory
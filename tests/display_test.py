@@ -0,0 +1,26 @@
+"""Tests for display module."""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from dailybot_cli.display import print_info, print_success
+
+
+@pytest.fixture
+def piped_console(monkeypatch: pytest.MonkeyPatch) -> io.StringIO:
+    """Route the stdout console to a non-terminal buffer."""
+    buffer: io.StringIO = io.StringIO()
+    monkeypatch.setattr("dailybot_cli.display.console", Console(file=buffer, force_terminal=False))
+    return buffer
+
+
+def test_piped_message_renders_markup_as_plain_text(piped_console: io.StringIO) -> None:
+    print_success("Saved [bold]key[/bold] for \\[org]")
+    assert piped_console.getvalue() == "OK Saved key for [org]\n"
+
+
+def test_piped_message_without_markup_written_verbatim(piped_console: io.StringIO) -> None:
+    print_info("Logged in as user@example.com")
+    assert piped_console.getvalue() == "Logged in as user@example.com\n"
@@ -0,0 +1,48 @@
+"""Test helpers shared across modules (fixtures live in conftest.py)."""
+
+import inspect
+from typing import Any, Callable, Optional
+
+from dailybot_cli.api_client import DailyBotClient
+
+
+def standup_response(action: Optional[str] = None) -> dict[str, Any]:
+    """A submit_update() result that attached the update to one "Standup" check-in."""
+    followup: dict[str, Any] = {"followup_name": "Standup"}
+    if action:
+        followup["action"] = action
+    return {"followups_count": 1, "attached_followups": [followup]}
+
+
+class StubClient:
+    """Lightweight DailyBotClient stand-in returning canned responses.
+
+    Every method call is checked against the real DailyBotClient signature
+    and recorded in ``calls`` as ``(name, arguments)``, with positional
+    arguments keyed by parameter name; a response that is an exception
+    instance is raised instead of returned.
+    """
+
+    def __init__(self, **responses: Any) -> None:
+        self.responses: dict[str, Any] = responses
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        signature: inspect.Signature = inspect.signature(getattr(DailyBotClient, name))
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            arguments: dict[str, Any] = signature.bind(self, *args, **kwargs).arguments
+            arguments.pop("self")
+            self.calls.append((name, arguments))
+            response: Any = self.responses.get(name)
+            if isinstance(response, BaseException):
+                raise response
+            return response
+
+        return method
+
+    def close(self) -> None:
+        pass